@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+# Micro-benchmarks for the query-building and fetch hot paths. They need no
+# database server: compilation runs on an unconnected MySQL DSN, fetches on an
+# in-memory SQLite database and a fake connection. See `python -m benchmarks -h`.
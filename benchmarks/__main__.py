@@ -0,0 +1,53 @@
+# benchmarks/__main__.py
+import argparse
+import sys
+
+from .cases import CASES
+from .harness import run_cases, selected_names, metadata, compare, load, save
+
+
+def parse_args(argv = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="SorcererDB hot path benchmarks")
+    parser.add_argument("-k", "--filter", action="append", help="only run cases whose name contains this")
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("-b", "--baseline", help="compare against a JSON file written by --output")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                        help="fraction slower than the baseline that counts as a regression (default 0.2)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed runs per case; the best one is kept")
+    parser.add_argument("--target", type=float, default=0.05, help="seconds per timed run (default 0.05)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    return parser.parse_args(argv)
+
+def report(name, result):
+    print(f"{name:<28} {result['best_us']:>12.2f} us  {result['ops_per_sec']:>14,.0f} ops/s")
+
+def main(argv = None):
+    args = parse_args(argv)
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    results = run_cases(CASES, args.filter, args.repeat, args.target, report)
+    if args.output:
+        save(args.output, {"meta": metadata(), "results": results})
+
+    if not args.baseline:
+        return 0
+
+    baseline = load(args.baseline)["results"]
+    baseline = {name: baseline[name] for name in selected_names(baseline, args.filter)}
+    rows     = compare(results, baseline, args.threshold)
+    print()
+    for row in rows:
+        change = "" if row["change"] is None else f"{row['change']:+.1%}"
+        print(f"{row['name']:<28} {row['status']:<10} {change}")
+
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) over {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
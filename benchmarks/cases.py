@@ -0,0 +1,117 @@
+# benchmarks/cases.py
+from sorcererdb import SorcererDB, DBConfig, Spell
+
+from .fakes import COLUMNS, FakeConnection, make_rows
+
+FETCH_ROWS = 1000
+
+ROW = {"name": "Jane", "email": "jane@example.com", "age": 42, "status": "active", "score": 3.5}
+
+CONDITIONS = {
+    "id":         10,
+    "name":       ["jane", "LIKE"],
+    "age":        [[18, 65], "BETWEEN"],
+    "status":     [["active", "pending"], "IN"],
+    "deleted_at": [None, "IS NULL"],
+}
+
+IN_VALUES = "|".join(str(i) for i in range(50))
+
+
+def compile_db():
+    # Never connected: SQL is compiled for the MySQL DSN without a server
+    return SorcererDB(DBConfig(name="bench", engine="mysql"), profile=False)
+
+def sqlite_db():
+    db = SorcererDB(DBConfig(name="bench", engine="sqlite", database=":memory:"), profile=False)
+    db.connect("bench")
+    db.simple(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, age INT, created_at TEXT)", "count"
+    )
+    db.insert_many("users", [dict(zip(COLUMNS, row)) for row in make_rows(FETCH_ROWS)])
+    return db
+
+
+# Query building
+def build_bindings():
+    db = compile_db()
+    return lambda: db.build_bindings(CONDITIONS), None
+
+def format_binding():
+    db = compile_db()
+    return lambda: db.format_binding("email", "jane@example.com", "like"), None
+
+def format_in():
+    db = compile_db()
+    return lambda: db.format_in("id", IN_VALUES), None
+
+def compile_insert():
+    db = compile_db()
+    return lambda: db.compile_insert("users", ROW), None
+
+def compile_insert_uncached():
+    db = compile_db()
+
+    def run():
+        db.statements.clear()
+        db.compile_insert("users", ROW)
+
+    return run, None
+
+def compile_update():
+    db = compile_db()
+    return lambda: db.compile_update("users", ROW, {"id": 10, "status": ["active", "!="]}), None
+
+def compile_delete():
+    db = compile_db()
+    return lambda: db.compile_delete("users", CONDITIONS, 10), None
+
+def compile_values():
+    db = compile_db()
+    return lambda: db.compile_values(list(ROW), 100), None
+
+
+# Fetch and row materialization
+def fetch_sqlite(row_factory):
+    def setup():
+        db = sqlite_db()
+
+        def run():
+            db.query("SELECT id, name, email, age, created_at FROM users")
+            db.result_set("all", cache=False, row_factory=row_factory)
+
+        return run, lambda: db.disconnect("bench")
+
+    return setup
+
+def fetch_spell(row_factory):
+    # Spell over a fake connection: the cost of Spell and row objects alone
+    def setup():
+        conn = FakeConnection(make_rows(FETCH_ROWS))
+
+        def run():
+            with Spell(conn, "mysql", row_factory=row_factory) as spell:
+                spell.execute("SELECT id, name, email, age, created_at FROM users")
+                spell.fetchall()
+
+        return run, None
+
+    return setup
+
+
+CASES = {
+    "bindings.build_bindings":  build_bindings,
+    "bindings.format_binding":  format_binding,
+    "bindings.format_in":       format_in,
+    "compile.insert":           compile_insert,
+    "compile.insert_uncached":  compile_insert_uncached,
+    "compile.update":           compile_update,
+    "compile.delete":           compile_delete,
+    "compile.values_100":       compile_values,
+    "fetch.sqlite_dict":        fetch_sqlite("dict"),
+    "fetch.sqlite_tuple":       fetch_sqlite("tuple"),
+    "fetch.sqlite_row":         fetch_sqlite("row"),
+    "fetch.spell_dict":         fetch_spell("dict"),
+    "fetch.spell_tuple":        fetch_spell("tuple"),
+    "fetch.spell_row":          fetch_spell("row"),
+}
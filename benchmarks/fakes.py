@@ -0,0 +1,43 @@
+# benchmarks/fakes.py
+
+COLUMNS = ("id", "name", "email", "age", "created_at")
+
+
+def make_rows(count):
+    return [(i, f"user{i}", f"user{i}@example.com", 20 + i % 50, "2024-01-01 00:00:00") for i in range(count)]
+
+
+class FakeCursor:
+    # Just enough of a mysql.connector cursor for Spell: every execute()
+    # "returns" the same prebuilt rows, so only Spell's own cost is measured
+    def __init__(self, rows):
+        self.description = [(column,) for column in COLUMNS]
+        self.rows        = rows
+        self.rowcount    = len(rows)
+        self.lastrowid   = None
+
+    def execute(self, query, bindings = None):
+        return None
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchmany(self, size = 1):
+        return self.rows[:size]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    unread_result = False
+
+    def __init__(self, rows):
+        self.rows  = rows
+        self.dicts = [dict(zip(COLUMNS, row)) for row in rows]
+
+    def cursor(self, dictionary = False, buffered = True):
+        return FakeCursor(self.dicts if dictionary else self.rows)
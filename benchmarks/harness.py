@@ -0,0 +1,104 @@
+# benchmarks/harness.py
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+
+def calibrate(func, target = 0.05):
+    # A loop count that runs for about `target` seconds
+    number = 1
+    while True:
+        elapsed = timed(func, number)
+        if elapsed >= target or number >= 10 ** 7:
+            return number
+        if elapsed < target / 10:
+            number *= 10
+        else:
+            number = math.ceil(number * target / elapsed)
+
+def timed(func, number):
+    loop    = range(number)
+    started = time.perf_counter()
+    for _ in loop:
+        func()
+    return time.perf_counter() - started
+
+def measure(func, repeat = 5, target = 0.05):
+    number  = calibrate(func, target)
+    samples = [timed(func, number) / number for _ in range(repeat)]
+    best    = min(samples)
+    return {
+        "iterations":  number,
+        "repeat":      repeat,
+        "best_us":     best * 1e6,
+        "median_us":   statistics.median(samples) * 1e6,
+        "ops_per_sec": 1 / best if best > 0 else 0.0,
+    }
+
+def selected_names(names, patterns = None):
+    return [name for name in names if not patterns or any(pattern in name for pattern in patterns)]
+
+def run_cases(cases, patterns = None, repeat = 5, target = 0.05, report = None):
+    results = {}
+    for name in selected_names(cases, patterns):
+        setup = cases[name]
+        func, teardown = setup()
+        try:
+            results[name] = measure(func, repeat, target)
+        finally:
+            if teardown is not None:
+                teardown()
+        if report is not None:
+            report(name, results[name])
+    return results
+
+def metadata():
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        package = version("sorcererdb")
+    except PackageNotFoundError:
+        package = None
+    return {
+        "created":    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python":     sys.version.split()[0],
+        "platform":   platform.platform(),
+        "machine":    platform.machine(),
+        "sorcererdb": package,
+    }
+
+def compare(results, baseline, threshold = 0.2):
+    # A case regresses when its best time is more than `threshold` (a
+    # fraction) slower than the baseline's. Cases missing on either side are
+    # listed but never fail the comparison.
+    rows = []
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            rows.append({"name": name, "status": "new", "change": None})
+            continue
+        change = current["best_us"] / before["best_us"] - 1 if before["best_us"] > 0 else 0.0
+        if change > threshold:
+            status = "regressed"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "status": status, "change": change})
+
+    for name in baseline:
+        if name not in results:
+            rows.append({"name": name, "status": "missing", "change": None})
+    return rows
+
+def load(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+def save(path, document):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+        handle.write("\n")
@@ -1,5 +1,3 @@
-
-
 # try:
 #     from .core import SorcererDB
 #     from .config import DBConfig
@@ -13,10 +11,21 @@
 from .core import SorcererDB
 from .config import DBConfig
 from .spell import Spell
+from .cache import ResultCache
 
 from loguru import logger
-from .logging import configure_logging
 
+# A library stays silent until the application opts in with configure_logging()
+logger.disable("sorcererdb")
 
-configure_logging()
 
+def __getattr__(name):
+    # Imported on first use so `import sorcererdb` stays cheap for tools
+    # that never need asyncio or the file sink
+    if name == "AsyncSorcererDB":
+        from .aio import AsyncSorcererDB
+        return AsyncSorcererDB
+    if name == "configure_logging":
+        from .logging import configure_logging
+        return configure_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
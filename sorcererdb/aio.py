@@ -0,0 +1,245 @@
+# sorcererdb/aio.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+
+from loguru import logger
+
+from .config import DBConfig
+from .core import SorcererDB
+from .drivers import db_errors
+from .cache import read_tables, write_table
+from .router import is_read
+
+
+class AsyncSorcererDB:
+    # Blocking driver calls run on a dedicated executor, each on a connection
+    # checked out of the DSN's pool, so many queries can be in flight from one
+    # event loop. Query state and open transactions live in context variables,
+    # which asyncio copies per task, instead of on the instance.
+
+    def __init__(self, config: DBConfig, cache_backend=None, max_workers=None):
+        self.db       = SorcererDB(config, cache_backend=cache_backend)
+        self.cache    = self.db.cache
+        self.executor = ThreadPoolExecutor(
+            max_workers        = max_workers or config.pool_max_size,
+            thread_name_prefix = "sorcererdb"
+        )
+
+        self.active_connection = None
+        self.state       = ContextVar(f"sorcererdb_state_{id(self)}", default=("", {}, 0))
+        # (connection, DSN name) of the task's open transaction
+        self.transaction = ContextVar(f"sorcererdb_transaction_{id(self)}", default=None)
+        # Tables written in the open transaction, invalidated again at commit
+        self.invalidations = ContextVar(f"sorcererdb_invalidations_{id(self)}", default=None)
+
+    async def run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    # DSN and Connection Methods
+    def set_dsn(self, config: DBConfig):
+        self.db.set_dsn(config)
+        return self
+
+    async def connect(self, name):
+        conn_config = self.db.get_dsn(name)
+        await self.run_blocking(self.db.get_pool, conn_config.name)
+
+        self.active_connection    = conn_config.name
+        self.db.active_connection = conn_config.name
+        logger.info(f"[AsyncSorcererDB] Connected to {name} / {conn_config.engine}")
+        return self
+
+    async def disconnect(self, name):
+        await self.run_blocking(self.db.disconnect, name)
+        if self.active_connection == name:
+            self.active_connection = None
+        return self
+
+    async def close(self):
+        for name in list(self.db.pools):
+            await self.disconnect(name)
+        self.executor.shutdown(wait=True)
+
+    def get_active_connection(self):
+        return self.active_connection
+
+    def pool_stats(self, name = None):
+        return self.db.pool_stats(name or self.active_connection)
+
+    def stats(self, name = None):
+        return self.db.stats(name)
+
+    def prometheus(self):
+        return self.db.prometheus()
+
+    # Query Methods
+    def query(self, sql):
+        self.state.set((sql, {}, 0))
+        return self
+
+    def get_query(self):
+        return self.state.get()[0]
+
+    def binding(self, param, value):
+        sql, bindings, row_count = self.state.get()
+        param, value = SorcererDB.clean_binding(param, value)
+        # Copy rather than mutate: child tasks share the parent's objects
+        self.state.set((sql, {**bindings, param: value}, row_count))
+        return self
+
+    def set_bindings(self, params):
+        for param, value in params.items():
+            self.binding(param, value)
+
+        return self
+
+    def get_bindings(self):
+        return self.state.get()[1]
+
+    def reset_bindings(self):
+        sql, bindings, row_count = self.state.get()
+        self.state.set((sql, {}, row_count))
+        return self
+
+    def result_count(self):
+        return self.state.get()[2]
+
+    # Execute Methods
+    def run_spell(self, conn, sql, bindings, fetch_type, size, name = None):
+        spell = self.db.new_spell(conn, name or self.active_connection)
+        try:
+            spell.execute(sql, bindings)
+            return spell.fetch(fetch_type, size), spell.rowcount()
+        finally:
+            spell.close()
+
+    def run_pooled(self, name, sql, bindings, fetch_type, size):
+        router  = self.db.router
+        replica = router.route(name, sql) if router is not None else None
+        if replica is None:
+            with self.db.pooled_connection(name) as conn:
+                result = self.run_spell(conn, sql, bindings, fetch_type, size, name)
+            if router is not None and name == router.primary and not is_read(sql):
+                router.wrote()
+            return result
+
+        with router.track(replica), self.db.pooled_connection(replica) as conn:
+            return self.run_spell(conn, sql, bindings, fetch_type, size, replica)
+
+    async def run(self, sql, bindings, fetch_type = "all", size = None, cache = True):
+        conn, name = self.transaction.get() or (None, self.active_connection)
+        cache_key  = None
+        if cache and self.cache is not None and conn is None and sql.lstrip()[:6].lower() == "select":
+            row_factory = self.db.get_dsn(self.active_connection).row_factory
+            cache_key   = self.cache.make_key(self.active_connection, sql, bindings, fetch_type, size, row_factory)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached, SorcererDB.cached_row_count(cached, fetch_type, self.result_count())
+
+        if conn is not None:
+            result, row_count = await self.run_blocking(self.run_spell, conn, sql, bindings, fetch_type, size, name)
+        else:
+            result, row_count = await self.run_blocking(
+                self.run_pooled, self.active_connection, sql, bindings, fetch_type, size
+            )
+
+        if self.cache is not None:
+            table = write_table(sql)
+            if table is not None:
+                if conn is not None:
+                    # Other tasks may cache the pre-commit rows meanwhile
+                    self.invalidations.get().add(table)
+                self.cache.invalidate(table)
+            elif cache_key is not None:
+                self.cache.set(cache_key, result, read_tables(sql))
+
+        return result, row_count
+
+    async def result_set(self, fetch_type = "all", size = None, cache = True):
+        sql, bindings, row_count = self.state.get()
+        result, row_count = await self.run(sql, bindings, fetch_type, size, cache)
+        self.state.set((sql, bindings, row_count))
+        return result
+
+    async def simple(self, query, fetch_type = "all", size = None, cache = True):
+        self.query(query)
+        return await self.result_set(fetch_type, size, cache)
+
+    # CRUD Methods
+    async def insert(self, table, data):
+        insert_sql, values = self.db.compile_insert(table, data)
+        self.query(insert_sql).set_bindings(values)
+        return await self.result_set("last_insert_id")
+
+    async def update(self, table, data, conditions):
+        update_sql, values = self.db.compile_update(table, data, conditions)
+        self.query(update_sql).set_bindings(values)
+        return await self.result_set("count")
+
+    async def delete(self, table, conditions, limit = None):
+        delete_sql, values = self.db.compile_delete(table, conditions, limit)
+        self.query(delete_sql).set_bindings(values)
+        return await self.result_set("count")
+
+    # Transactional Methods
+    def begin_on(self, conn):
+        if self.db.get_engine() == "sqlite":
+            conn.execute("BEGIN")
+        else:
+            conn.start_transaction()
+
+    async def begin(self):
+        if self.transaction.get() is not None:
+            logger.error(f"[AsyncSorcererDB] Transaction already open in this task")
+            raise ValueError("Transaction already open in this task")
+
+        name = self.active_connection
+        pool = self.db.get_pool(name)
+        conn = await self.run_blocking(pool.checkout)
+        try:
+            await self.run_blocking(self.begin_on, conn)
+        except db_errors() as err:
+            await self.run_blocking(pool.checkin, conn)
+            logger.error(f"[AsyncSorcererDB] Error beginning transaction | {err}")
+            raise ValueError(f"Error beginning transaction | {err}")
+
+        self.transaction.set((conn, name))
+        self.invalidations.set(set())
+        logger.debug(f"[AsyncSorcererDB] Beginning transaction")
+        return self
+
+    async def end_transaction(self, action):
+        transaction = self.transaction.get()
+        if transaction is None:
+            logger.error(f"[AsyncSorcererDB] No transaction open in this task")
+            raise ValueError("No transaction open in this task")
+        conn, name = transaction
+
+        tables = self.invalidations.get() or set()
+        self.transaction.set(None)
+        self.invalidations.set(None)
+        try:
+            await self.run_blocking(getattr(conn, action))
+        finally:
+            # Back to the pool it came from; the checkin may roll back over the network
+            await self.run_blocking(self.db.get_pool(name).checkin, conn)
+
+        if action == "commit":
+            if self.db.router is not None:
+                self.db.router.wrote()
+            if self.cache is not None:
+                for table in tables:
+                    self.cache.invalidate(table)
+
+    async def commit(self):
+        logger.debug(f"[AsyncSorcererDB] Committing transaction")
+        await self.end_transaction("commit")
+        return self
+
+    async def rollback(self):
+        logger.debug(f"[AsyncSorcererDB] Rolling back transaction")
+        await self.end_transaction("rollback")
+        return self
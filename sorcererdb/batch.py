@@ -0,0 +1,113 @@
+# sorcererdb/batch.py
+import time
+
+from loguru import logger
+
+from .cache import write_table
+
+
+class WriteBatch:
+    # Writes made inside db.batch() share one transaction until it holds
+    # max_statements writes or has been open for max_delay_ms; the next write
+    # then commits it and opens another. Thresholds are checked as statements
+    # arrive, never from a timer, so the connection is only used by its owner.
+    # With coalesce=True insert() rows are held back and written as multi-row
+    # INSERTs per table and column set before the next other statement runs.
+
+    def __init__(self, db, max_statements = 1000, max_delay_ms = 50, coalesce = False, external = False):
+        if max_statements < 1:
+            logger.error(f"[WriteBatch] Invalid max_statements: {max_statements}")
+            raise ValueError(f"Invalid max_statements: {max_statements}")
+
+        self.db             = db
+        self.max_statements = max_statements
+        self.max_delay      = max_delay_ms / 1000
+        self.coalesce       = coalesce
+        # Inside a caller's transaction nothing is committed here
+        self.external       = external
+
+        self.opened     = None   # perf_counter() when our transaction began
+        self.statements = 0      # writes in the open transaction
+        self.pending    = []     # (table, columns, row) waiting to be coalesced
+        self.writing    = False
+        self.counts     = {"statements": 0, "transactions": 0, "coalesced": 0}
+
+    def due(self):
+        if self.opened is None:
+            return False
+        return self.statements >= self.max_statements or time.perf_counter() - self.opened >= self.max_delay
+
+    def open(self):
+        # Also covers a transaction committed behind our back, and leaves one
+        # begun by someone else (e.g. update_many()) to its owner
+        if self.external or self.db.in_transaction():
+            return
+        self.db.begin()
+        self.opened     = time.perf_counter()
+        self.statements = 0
+
+    def before(self, sql, write = None):
+        # Called by SorcererDB ahead of every statement; queued rows are written
+        # first so reads see them and writes land after them. write overrides
+        # the SQL check for statements it cannot see into (CALL, bulk loads)
+        if self.writing:
+            return
+        self.write_pending()
+        if not (write_table(sql) is not None if write is None else write):
+            return
+        if self.due():
+            self.commit()
+        self.open()
+
+    def wrote(self):
+        # Called by SorcererDB after every write
+        self.statements           += 1
+        self.counts["statements"] += 1
+
+    def queue(self, table, data):
+        self.pending.append((table, tuple(data.keys()), data))
+        if len(self.pending) >= self.max_statements or self.due():
+            self.flush()
+
+    def write_pending(self):
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, []
+        self.open()
+        # insert_many() goes through the fluent query state; keep the caller's
+        db    = self.db
+        state = (db.sql_query, db.bindings, db.stored_query)
+        self.writing = True
+        try:
+            start = 0
+            # Runs of consecutive rows with the same table and columns keep
+            # statement order while each becomes one insert_many()
+            for end in range(1, len(pending) + 1):
+                if end == len(pending) or pending[end][:2] != pending[start][:2]:
+                    self.db.insert_many(pending[start][0], [row for _, _, row in pending[start:end]])
+                    start = end
+        finally:
+            self.writing = False
+            db.sql_query, db.bindings, db.stored_query = state
+        self.counts["coalesced"] += len(pending)
+
+    def commit(self):
+        if self.opened is None:
+            return
+        self.opened     = None
+        self.statements = 0
+        self.db.commit()
+        self.counts["transactions"] += 1
+
+    def flush(self):
+        self.write_pending()
+        self.commit()
+        return self
+
+    def discard(self):
+        self.pending    = []
+        self.statements = 0
+        if self.opened is not None:
+            self.opened = None
+            self.db.rollback()
@@ -0,0 +1,100 @@
+# sorcererdb/bulkload.py
+import os
+from itertools import chain, islice
+
+from loguru import logger
+
+# MySQL's default LOAD DATA format: tab separated, backslash escaped, \N for NULL
+INFILE_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+def is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+def file_delimiter(path, delimiter = None):
+    if delimiter is not None:
+        return delimiter
+    return "\t" if os.fspath(path).lower().endswith((".tsv", ".tab")) else ","
+
+def quote_path(path):
+    return "'" + os.fspath(path).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+def file_rows(path, delimiter, header):
+    # A generator, so the file is only open while rows are being read
+    import csv
+    with open(path, newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle, delimiter=delimiter)
+        if header:
+            next(reader, None)
+        yield from reader
+
+def read_header(path, delimiter):
+    import csv
+    with open(path, newline="", encoding="utf-8") as handle:
+        header = next(csv.reader(handle, delimiter=delimiter), None)
+    if not header:
+        logger.error(f"[BulkLoad] No header row in {path}")
+        raise ValueError(f"No header row in {path}")
+    return header
+
+def read_source(source, columns = None, delimiter = None, header = True):
+    # Returns the column names and a lazy iterator of row tuples in that order
+    if is_path(source):
+        delimiter = file_delimiter(source, delimiter)
+        if columns is None:
+            if not header:
+                logger.error(f"[BulkLoad] Columns are required for {source} without a header row")
+                raise ValueError(f"Columns are required for {source} without a header row")
+            columns = read_header(source, delimiter)
+        return list(columns), file_rows(source, delimiter, header)
+
+    rows  = iter(source)
+    first = next(rows, None)
+    if first is None:
+        return list(columns or []), iter(())
+
+    rows = chain([first], rows)
+    if isinstance(first, dict):
+        columns = list(columns or first.keys())
+        return columns, (tuple(row[column] for column in columns) for row in rows)
+
+    if columns is None:
+        logger.error(f"[BulkLoad] Columns are required for rows that are not dicts")
+        raise ValueError("Columns are required for rows that are not dicts")
+    return list(columns), (tuple(row) for row in rows)
+
+def chunked(rows, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+def infile_field(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8")
+    return str(value).translate(INFILE_ESCAPES)
+
+def write_infile(handle, rows):
+    # Rewrites the spool file in place so one chunk is on disk at a time
+    handle.seek(0)
+    handle.truncate()
+    handle.writelines("\t".join(map(infile_field, row)) + "\n" for row in rows)
+    handle.flush()
+
+def load_data_sql(path, table, columns, charset, delimiter = "\t", csv_format = False, header = False):
+    load_sql  = f"LOAD DATA LOCAL INFILE {quote_path(path)} INTO TABLE `{table}` CHARACTER SET {charset} "
+    if csv_format:
+        # RFC 4180 style: quoted fields with doubled quotes, no backslash escapes
+        field_end = "\\t" if delimiter == "\t" else delimiter.replace("\\", "\\\\").replace("'", "\\'")
+        load_sql += f"FIELDS TERMINATED BY '{field_end}' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+        load_sql += "LINES TERMINATED BY '\\n' "
+    else:
+        load_sql += "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+    if header:
+        load_sql += "IGNORE 1 LINES "
+    return load_sql + "(" + ", ".join(f"`{column}`" for column in columns) + ")"
@@ -0,0 +1,161 @@
+# sorcererdb/cache.py
+import re
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+
+TABLE        = r"[`\"\[]?[\w.$]+[`\"\]]?"
+# FROM may list several tables separated by commas. An alias is only taken
+# when a comma follows it, so a keyword such as JOIN is never read as one.
+READ_TABLES  = re.compile(
+    r"\b(?:FROM|JOIN)\s+(" + TABLE + r"(?:(?:\s+(?:AS\s+)?\w+)?\s*,\s*" + TABLE + r")*)", re.IGNORECASE
+)
+WRITE_TABLES = re.compile(
+    r"^\s*(?:INSERT(?:\s+(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY))?(?:\s+IGNORE)?(?:\s+INTO)?"
+    r"|REPLACE(?:\s+(?:LOW_PRIORITY|DELAYED))?(?:\s+INTO)?"
+    r"|UPDATE(?:\s+LOW_PRIORITY)?(?:\s+IGNORE)?|DELETE(?:\s+LOW_PRIORITY)?(?:\s+QUICK)?(?:\s+IGNORE)?\s+FROM"
+    r"|TRUNCATE(?:\s+TABLE)?|ALTER\s+TABLE|DROP\s+TABLE(?:\s+IF\s+EXISTS)?"
+    r"|LOAD\s+DATA\s+(?:LOCAL\s+)?INFILE\s+'(?:[^'\\]|\\.)*'\s+(?:REPLACE\s+|IGNORE\s+)?INTO\s+TABLE)"
+    r"\s+(" + TABLE + r")",
+    re.IGNORECASE
+)
+
+
+def normalize_table(name):
+    return name.strip("`\"[]").split(".")[-1].lower()
+
+def normalize_sql(sql):
+    return " ".join(sql.split())
+
+def read_tables(sql):
+    # The first word of each comma-separated item is the table; the rest is its alias
+    return frozenset(
+        normalize_table(item.split()[0]) for match in READ_TABLES.findall(sql) for item in match.split(",")
+    )
+
+def write_table(sql):
+    match = WRITE_TABLES.match(sql)
+    return normalize_table(match.group(1)) if match else None
+
+def estimate_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+def copy_result(value):
+    # Hand out shallow copies so callers can not mutate the cached rows
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class ResultCache:
+
+    def __init__(self, max_entries = 1024, max_bytes = 64 * 1024 * 1024, ttl = 60):
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.ttl         = ttl
+
+        self.lock    = threading.Lock()
+        self.entries = OrderedDict()   # key -> (value, tables, expires_at, size)
+        self.tags    = {}              # table -> set(keys)
+        self.bytes   = 0
+
+        self.hits          = 0
+        self.misses        = 0
+        self.evictions     = 0
+        self.invalidations = 0
+
+    def make_key(self, dsn, sql, bindings, *extra):
+        params = tuple(sorted((str(key), repr(value)) for key, value in (bindings or {}).items()))
+        return (dsn, normalize_sql(sql), params) + extra
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, tables, expires_at, size = entry
+            if expires_at is not None and time.monotonic() > expires_at:
+                self.remove(key)
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return copy_result(value)
+
+    def set(self, key, value, tables = frozenset(), ttl = None):
+        ttl  = self.ttl if ttl is None else ttl
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"[Cache] Result of {size} bytes exceeds cache size, not cached")
+            return False
+
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+
+            expires_at = time.monotonic() + ttl if ttl else None
+            self.entries[key] = (copy_result(value), tables, expires_at, size)
+            self.bytes += size
+            for table in tables:
+                self.tags.setdefault(table, set()).add(key)
+
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self.remove(oldest)
+                self.evictions += 1
+
+        return True
+
+    def remove(self, key):
+        # Caller holds the lock
+        value, tables, expires_at, size = self.entries.pop(key)
+        self.bytes -= size
+        for table in tables:
+            keys = self.tags.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[table]
+
+    def invalidate(self, table):
+        table = normalize_table(table)
+        with self.lock:
+            keys = self.tags.pop(table, set())
+            for key in list(keys):
+                if key in self.entries:
+                    self.remove(key)
+            self.invalidations += len(keys)
+
+        if keys:
+            logger.debug(f"[Cache] Invalidated {len(keys)} entries for table {table}")
+        return len(keys)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.tags.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries":       len(self.entries),
+                "bytes":         self.bytes,
+                "hits":          self.hits,
+                "misses":        self.misses,
+                "evictions":     self.evictions,
+                "invalidations": self.invalidations,
+            }
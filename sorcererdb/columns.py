@@ -0,0 +1,114 @@
+# sorcererdb/columns.py
+from functools import lru_cache
+
+# mysql.connector FieldType codes
+MYSQL_INTEGER_TYPES = {1, 2, 3, 8, 9, 13}     # TINY, SHORT, LONG, LONGLONG, INT24, YEAR
+MYSQL_FLOAT_TYPES   = {4, 5}                  # FLOAT, DOUBLE
+NULLABLE_FLAG       = 6                       # description index of null_ok
+
+
+@lru_cache(maxsize=1)
+def load_numpy():
+    # NumPy is optional; without it columns come back as plain lists
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def metadata_kind(column):
+    type_code = column[1] if len(column) > 1 else None
+    if type_code in MYSQL_INTEGER_TYPES:
+        nullable = len(column) > NULLABLE_FLAG and column[NULLABLE_FLAG]
+        return "float" if nullable else "int"
+    if type_code in MYSQL_FLOAT_TYPES:
+        return "float"
+    if type_code is None:
+        return None
+    return "object"
+
+def value_kind(values):
+    # SQLite reports no column types, so look at the first chunk instead
+    kind = None
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return "object"
+        if isinstance(value, float):
+            kind = "float"
+        elif kind is None:
+            kind = "int"
+    return kind or "object"
+
+
+class ColumnBuilder:
+    # Fills one column a chunk at a time into an array that doubles as it
+    # grows, so no per-row Python objects are kept for numeric columns
+
+    def __init__(self, numpy, kind):
+        self.numpy = numpy
+        self.kind  = kind
+        self.size  = 0
+        self.data  = [] if numpy is None or kind == "object" else numpy.empty(1024, dtype=self.dtype())
+
+    def dtype(self):
+        return "int64" if self.kind == "int" else "float64"
+
+    def extend(self, values):
+        if isinstance(self.data, list):
+            self.data.extend(values)
+            self.size += len(values)
+            return
+
+        if self.kind == "int" and (None in values or any(type(value) is float for value in values)):
+            # A NULL or a real in an integer column: fall back to float (NaN for NULL)
+            self.kind = "float"
+            self.data = self.data.astype("float64")
+        if self.kind == "float":
+            values = [self.numpy.nan if value is None else value for value in values]
+
+        end = self.size + len(values)
+        if end > len(self.data):
+            grown = self.numpy.empty(max(end, len(self.data) * 2), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+
+        try:
+            self.data[self.size:end] = values
+        except (TypeError, ValueError, OverflowError):
+            # Values the dtype can not hold (e.g. text in a number column, or
+            # a BIGINT UNSIGNED past the int64 range)
+            self.data = list(self.data[:self.size]) + list(values)
+            self.kind = "object"
+        self.size = end
+
+    def result(self):
+        if isinstance(self.data, list):
+            if self.numpy is not None:
+                array = self.numpy.empty(len(self.data), dtype=object)
+                array[:] = self.data
+                return array
+            return self.data
+        return self.data[:self.size].copy()
+
+
+def read_columns(description, chunks):
+    numpy    = load_numpy()
+    names    = [column[0] for column in description]
+    kinds    = [metadata_kind(column) for column in description]
+    builders = None
+
+    for rows in chunks:
+        columns = list(zip(*rows))
+        if builders is None:
+            builders = [
+                ColumnBuilder(numpy, kind or value_kind(values))
+                for kind, values in zip(kinds, columns)
+            ]
+        for builder, values in zip(builders, columns):
+            builder.extend(list(values))
+
+    if builders is None:
+        builders = [ColumnBuilder(numpy, kind or "object") for kind in kinds]
+    return {name: builder.result() for name, builder in zip(names, builders)}
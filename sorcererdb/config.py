@@ -15,3 +15,37 @@ class DBConfig:
     timeout: int = 30
     autocommit: bool = True
 
+    # Lets bulk_load() use LOAD DATA LOCAL INFILE (MySQL)
+    local_infile: bool = False
+
+    # Connection pool
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_max_idle: int = 300
+    pool_max_lifetime: int = 3600
+    pool_wait_timeout: int = 30
+
+    # Prepared stored queries kept per connection
+    prepared_cache_size: int = 64
+
+    # Rows as "dict", "tuple" or "row" (tuple with column access)
+    row_factory: str = "dict"
+
+    # Slow query log (seconds; None disables)
+    slow_query_threshold: float = 1.0
+    slow_query_sample_rate: float = 0.0
+    slow_query_explain: bool = False
+
+    # SQLite
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    mmap_size: int = 0
+    cache_size: int = -2000
+    statement_cache_size: int = 128
+
+
+def shared_cache(config: DBConfig):
+    # Shared-cache connections lock tables against each other and fail at once
+    # with SQLITE_LOCKED rather than waiting out busy_timeout, so callers keep
+    # such a DSN's work on one connection wherever they can
+    return config.engine == "sqlite" and config.database == ":memory:"
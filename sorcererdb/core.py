@@ -1,40 +1,87 @@
-import mysql.connector
-from mysql.connector import Error
+import threading
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from functools import partial
+
 from loguru import logger
 
-from .config import DBConfig
-from .spell import Spell
+from .config import DBConfig, shared_cache
+from .drivers import load_driver, db_errors
+from .spell import Spell, PreparedCursor, live_cursors
+from .pool import ConnectionPool
+from .cache import read_tables, write_table
+from .statements import StatementCache, PreparedStatements, CursorCache
+from .profiler import Profiler
+from .slowlog import SlowQueryLog
+from .router import ReplicaRouter, is_read
+from .session import Session, ThreadSession, PinnedConnections, checkin_all, session_attribute
+from .scatter import gather, merge_rows, stream_merge
+from .columns import read_columns
+from .rows import check_row_factory, row_class
+from .bulkload import is_path, file_delimiter, read_source, chunked, write_infile, load_data_sql
+from .batch import WriteBatch
+from .pipeline import pipeline_calls, number_bindings, multi_results, read_result
+from .export import ExportWriter, check_format, write_rows
+from .paginate import Page, key_columns_of, encode_cursor, decode_cursor, seek_predicate, page_source
 
 
 class SorcererDB:
-    def __init__(self, config: DBConfig, cache_backend=None, log_queries=False):
+    # Query state lives on a Session. With thread_safe=True every thread gets its
+    # own Session and pins its own connection from the shared pools, so one
+    # instance can be used from a ThreadPoolExecutor.
+    sql_query             = session_attribute("sql_query")
+    bindings              = session_attribute("bindings")
+    row_count             = session_attribute("row_count")
+    stored_query          = session_attribute("stored_query")
+    pending_invalidations = session_attribute("pending_invalidations")
+    write_batch           = session_attribute("write_batch")
+
+    def __init__(self, config: DBConfig, cache_backend=None, log_queries=False, profile=True, thread_safe=False):
+        self.thread_safe        = thread_safe
+        self.session            = ThreadSession() if thread_safe else Session()
+        self.registry           = weakref.WeakSet() if thread_safe else None   # every live thread's PinnedConnections
+        self.default_connection = None
+        self.pools_lock         = threading.Lock()
+
         self.config            = config
         self.dsn               = {}
-        self.connections       = {}
+        self.pools             = {}
         self.active_connection = None
         self.cursor            = None
 
         self.log_queries = log_queries
         self.cache       = cache_backend
+        self.profiler    = Profiler() if profile else None
+        self.slow_log    = SlowQueryLog(self.dsn, self.pools)
+        self.router      = None
+        self.pending_invalidations = set()
         self.sql_error   = None
 
         self.sql_query      = ""
         self.bindings       = {}
         self.stored_queries = {}
         self.row_count      = 0
+        self.max_packets    = {}
+        self.statements     = StatementCache()
+        self.prepared       = PreparedStatements(config.prepared_cache_size)
+        self.cursors        = CursorCache()
+        self.stored_query   = None
 
         self.set_dsn(config)
 
     def __del__(self):
         logger.debug(f"[SorcererDB] Destroying SorcererDB instance")
         # self.close_cursor()
-        temp_connections = self.connections.copy()
+        temp_connections = list(self.connections) + list(self.pools)
         for conn in temp_connections:
             # self.connections[conn.name].close()
-            self.disconnect(conn)
+            if conn in self.connections or conn in self.pools:
+                self.disconnect(conn)
 
-        self.connections = {}
+        self.connections.clear()
         temp_connections = {}
+        self.slow_log.close()
 
     # DSN and Credentials Methods
     def set_dsn(self, config: DBConfig):
@@ -62,6 +109,56 @@ class SorcererDB:
         else:
             return False
 
+    # Session Methods
+    @property
+    def active_connection(self):
+        name = self.session.active_connection
+        # Threads that never picked a DSN start on the one last connected
+        return name if name is not None else self.default_connection
+
+    @active_connection.setter
+    def active_connection(self, name):
+        self.session.active_connection = name
+
+    @property
+    def connections(self):
+        if self.registry is None:
+            return self.session.connections
+        pinned = self.session.pinned
+        if pinned is None:
+            pinned = self.session.pinned = PinnedConnections(self.pools)
+            self.registry.add(pinned)
+        return pinned.connections
+
+    @connections.setter
+    def connections(self, connections):
+        if self.registry is None:
+            self.session.connections = connections
+        else:
+            # In place: the thread's finalizer holds this dict
+            pinned = self.connections
+            if connections is not pinned:
+                pinned.clear()
+                pinned.update(connections)
+
+    def all_connections(self):
+        if self.registry is None:
+            return [self.session.connections]
+        return [pinned.connections for pinned in list(self.registry)]
+
+    def session_connection(self):
+        name = self.active_connection
+        connections = self.connections
+        if name not in connections and self.registry is not None and name in self.pools:
+            # First query on this thread: pin a connection of its own
+            connections[name] = self.pools[name].checkout()
+        return connections[name]
+
+    def release(self):
+        # Hand this thread's pinned connections back now rather than when it exits
+        checkin_all(self.pools, self.connections)
+        return self
+
     # Connection Methods
     def get_connection(self, name):
         if name in self.connections:
@@ -76,6 +173,11 @@ class SorcererDB:
     
     def get_connection_name(self):
         return self.dsn[self.active_connection].name
+
+    def get_engine(self):
+        if self.active_connection in self.dsn:
+            return self.dsn[self.active_connection].engine
+        return self.config.engine
     
     # Change the active db connection based on name
     def set_active_connection(self, name):
@@ -100,51 +202,139 @@ class SorcererDB:
             return False
         
 
-    def connect(self, name):
-        conn_config = self.get_dsn(name) 
+    @staticmethod
+    def open_connection(conn_config):
         if conn_config.engine == 'mysql':
+            mysql = load_driver("mysql")
             try:
-                conn = mysql.connector.connect(
+                conn = mysql.connect(
                     host=conn_config.host,
                     port=conn_config.port,
                     user=conn_config.user,
                     password=conn_config.password,
                     database=conn_config.database,
-                    charset = conn_config.charset
+                    charset = conn_config.charset,
+                    allow_local_infile = conn_config.local_infile
                 )
 
                 if conn_config.autocommit:
                     conn.autocommit = True
 
-                self.connections[conn_config.name] = conn
-                self.active_connection = conn_config.name
-                logger.info(f"[SorcererDB] Connected to {name} / {conn_config.host}")
-            except mysql.connector.Error as err:
-                raise ConnectionError(f"Failed to connect to {name}: {err}")
+                logger.debug(f"[SorcererDB] Opened connection to {conn_config.name} / {conn_config.host}")
+            except mysql.Error as err:
+                raise ConnectionError(f"Failed to connect to {conn_config.name}: {err}")
 
         elif conn_config.engine == 'sqlite':
-            # conn = sqlite3.connect(self.dsn)
-            # self.connections[name] = conn
-            # self.active_connection = name
-            pass
+            sqlite3 = load_driver("sqlite")
+            from .sqlite import connect_sqlite
+            try:
+                conn = connect_sqlite(conn_config)
+                logger.debug(f"[SorcererDB] Opened connection to {conn_config.name} / {conn_config.database}")
+            except sqlite3.Error as err:
+                raise ConnectionError(f"Failed to connect to {conn_config.name}: {err}")
         else:
             logger.error(f"[SorcererDB] Invalid engine: {conn_config.engine}")
             raise ValueError(f"Invalid engine: {conn_config.engine}")
 
+        return conn
+
+    # Pool Methods
+    def get_pool(self, name):
+        if name in self.pools:
+            return self.pools[name]
+
+        with self.pools_lock:
+            if name in self.pools:
+                return self.pools[name]
+
+            conn_config = self.get_dsn(name)
+            self.pools[name] = ConnectionPool(
+                partial(self.open_connection, conn_config),
+                name         = conn_config.name,
+                min_size     = conn_config.pool_min_size,
+                max_size     = conn_config.pool_max_size,
+                max_idle     = conn_config.pool_max_idle,
+                max_lifetime = conn_config.pool_max_lifetime,
+                wait_timeout = conn_config.pool_wait_timeout
+            )
+
+        return self.pools[name]
+
+    def pool_stats(self, name = None):
+        return self.get_pool(name or self.active_connection).stats()
+
+    @contextmanager
+    def pooled_connection(self, name = None):
+        pool = self.get_pool(name or self.active_connection)
+        conn = pool.checkout()
+        try:
+            yield conn
+        finally:
+            pool.checkin(conn)
+
+    # Replica Methods
+    def set_replicas(self, primary, replicas, sticky_window = 1.0):
+        for name in [primary, *replicas]:
+            self.get_dsn(name)
+
+        self.router = ReplicaRouter(primary, replicas, sticky_window)
+        logger.info(f"[SorcererDB] Routing reads from {primary} to replicas {', '.join(replicas)}")
+        return self
+
+    def replica_for(self, sql):
+        if self.router is None or self.in_transaction():
+            return None
+        return self.router.route(self.active_connection, sql)
+
+    @contextmanager
+    def route(self, sql):
+        # Reads from the primary run on a pooled replica connection; everything
+        # else stays on the session connection
+        replica = self.replica_for(sql)
+        if replica is None:
+            yield self.session_connection(), self.active_connection
+            if self.router is not None and self.active_connection == self.router.primary and not is_read(sql):
+                self.router.wrote()
+            return
+
+        with self.router.track(replica), self.pooled_connection(replica) as conn:
+            yield conn, replica
+
+    def connect(self, name):
+        conn_config = self.get_dsn(name)
+        pool        = self.get_pool(conn_config.name)
+
+        if conn_config.name not in self.connections:
+            self.connections[conn_config.name] = pool.checkout()
+
+        self.active_connection  = conn_config.name
+        self.default_connection = conn_config.name
+        logger.info(f"[SorcererDB] Connected to {name} / {conn_config.engine}")
+
         return self
 
 
     # Disconnect Methods
     def disconnect(self, name):
         conn_config = self.get_dsn(name)
-        if conn_config.engine == 'mysql':
-            self.connections[conn_config.name].close()
-            del self.connections[conn_config.name]
-            if self.active_connection == conn_config.name:
-                self.active_connection = None
-            logger.debug(f"[SorcererDB] Disconnected from {name} / {conn_config.host}")
-        elif conn_config.engine == 'sqlite':
-            pass
+        pool        = self.pools.pop(conn_config.name, None)
+
+        for connections in self.all_connections():
+            conn = connections.pop(conn_config.name, None)
+            if conn is not None:
+                if pool:
+                    pool.checkin(conn)
+                else:
+                    conn.close()
+
+        if pool:
+            pool.close()
+
+        if self.active_connection == conn_config.name:
+            self.active_connection = None
+        if self.default_connection == conn_config.name:
+            self.default_connection = None
+        logger.debug(f"[SorcererDB] Disconnected from {name}")
     
     
 
@@ -156,6 +346,7 @@ class SorcererDB:
     def set_stored_query(self, key):
         if key in self.stored_queries:
             self.query(self.stored_queries[key])
+            self.stored_query = key
             return self
         else:
             logger.error(f"[SorcererDB] Stored query {key} does not exist")
@@ -163,11 +354,13 @@ class SorcererDB:
 
     def query(self, sql):
         self.reset_bindings()
-        self.sql_query = sql
+        self.sql_query    = sql
+        self.stored_query = None
         return self
 
     def reset_query(self):
-        self.sql_query = ""
+        self.sql_query    = ""
+        self.stored_query = None
         return self
 
     def get_query(self):
@@ -175,6 +368,13 @@ class SorcererDB:
 
     # Bindings Methods
     def binding(self, param, value):
+        param, value = self.clean_binding(param, value)
+        self.bindings[param] = value
+
+        return self
+
+    @staticmethod
+    def clean_binding(param, value):
         if type(param) == dict or type(param) == list or type(param) == tuple:
             logger.error(f"[SorcererDB] Bindings must be a single parameter. Use set_bindings.")
             raise ValueError("Bindings must be a single parameter. Use set_bindings.")
@@ -183,12 +383,9 @@ class SorcererDB:
         value = str(value).strip()
 
         if "limit" == param or "offset" == param:
-            self.bindings[param] = int(value)
+            return param, int(value)
         else:
-            self.bindings[param] = value
-
-
-        return self
+            return param, value
 
     def get_bindings(self):
         return self.bindings
@@ -240,6 +437,16 @@ class SorcererDB:
             return ""
 
         condition = condition.strip().upper()
+        value = self.format_value(value, condition)
+
+        field = field.strip().lower()
+        binder = self.format_binder(field)
+        query = f"{field} {condition} {binder}"
+
+        return field, query, value
+
+    @staticmethod
+    def format_value(value, condition):
         if condition == "LIKE" or condition == "NOT LIKE":
             value = "%" + str(value) + "%"
         elif condition == "IN" or condition == "NOT IN":
@@ -255,11 +462,41 @@ class SorcererDB:
         else:
             value = value
 
-        field = field.strip().lower()
-        binder = self.format_binder(field)
-        query = f"{field} {condition} {binder}"
+        return value
 
-        return field, query, value
+    # Compiled Statement Methods
+    def binding_shape(self, data):
+        # The (field, condition) pairs that decide the SQL text, plus the raw values
+        shape  = []
+        values = []
+
+        if type(data) == dict:
+            for key, value in data.items():
+                if type(value) == list:
+                    shape.append((key, value[1]))
+                    values.append(value[0])
+                else:
+                    shape.append((key, "="))
+                    values.append(value)
+        elif type(data) == list:
+            for item in data:
+                shape.append((item[0], item[2] if len(item) > 2 else "="))
+                values.append(item[1])
+
+        return tuple(shape), values
+
+    def template_fields(self, shape):
+        return tuple((field.strip().lower(), condition.strip().upper()) for field, condition in shape)
+
+    def bind_template(self, fields, values, bindings = None):
+        bindings = {} if bindings is None else bindings
+        for (field, condition), value in zip(fields, values):
+            bindings[field] = self.format_value(value, condition)
+
+        return bindings
+
+    def statement_stats(self):
+        return self.statements.stats()
     
     def format_for_in(self, tag, data, delimiter = "|" ):
         if tag == "":
@@ -290,67 +527,422 @@ class SorcererDB:
         return None, None
 
     def format_binder(self, key):
-        if self.config.engine == "mysql":
+        engine = self.get_engine()
+        if engine == "mysql":
             return "%(" + key + ")s"
-        elif self.config.engine == "sqlite":
+        elif engine == "sqlite":
             return "@" + key
-        elif self.config.engine == "postgresql":
+        elif engine == "postgresql":
             return "$" + key
         else:
-            logger.error(f"[SorcererDB] Invalid engine: {self.config.engine}")
-            raise ValueError(f"Invalid engine: {self.config.engine}")
+            logger.error(f"[SorcererDB] Invalid engine: {engine}")
+            raise ValueError(f"Invalid engine: {engine}")
+
+    def new_spell(self, conn, name = None, row_factory = None):
+        name   = name or self.active_connection
+        config = self.get_dsn(name)
+        return Spell(
+            conn, config.engine, self.profiler, name, self.slow_log, self.cursors,
+            check_row_factory(row_factory or config.row_factory)
+        )
 
     # Execute a Stored Procedure
     def proc(self, name, params = ()):
         
         try:
-            spell = Spell(self.connections[self.active_connection])
-            result = spell.proc(name, params)
-        except mysql.connector.Error as err:
+            # A procedure may write anything, so it always counts as a write
+            self.batch_before(name, write=True)
+            with self.new_spell(self.session_connection()) as spell:
+                result = spell.proc(name, params)
+            self.batch_wrote(name, write=True)
+            if self.router is not None:
+                self.router.wrote()
+        except db_errors() as err:
             logger.error(f"[SorcererDB] Error executing procedure: {name} | {err}")
             raise ValueError(f"Error executing procedure: {name} | {err}")
 
         return result
 
 
-    def simple(self, query, fetch_type = "all", size = None):
+    def simple(self, query, fetch_type = "all", size = None, cache = True, row_factory = None):
         try:
             self.query(query)
-            spell = Spell(self.connections[self.active_connection])
-            spell.execute(self.sql_query)
-            return spell.fetch(fetch_type, size)
-        except mysql.connector.Error as err:
+            # Ahead of the cache lookup: a read must see rows the batch has queued
+            self.batch_before(self.sql_query)
+            cache_key = self.cache_key(fetch_type, size, row_factory) if cache else None
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            with self.route(self.sql_query) as (conn, name), self.new_spell(conn, name, row_factory) as spell:
+                spell.execute(self.sql_query)
+                self.invalidate_cache(self.sql_query)
+                self.batch_wrote(self.sql_query)
+                result = spell.fetch(fetch_type, size)
+
+            if cache_key is not None:
+                self.cache.set(cache_key, result, read_tables(self.sql_query))
+            return result
+        except db_errors() as err:
             logger.error(f"[SorcererDB] Error executing query: {self.sql_query} | {err}")
             raise ValueError(f"Error executing query: {self.sql_query} | {err}")
 
-    def execute(self):
-        spell = Spell(self.connections[self.active_connection])
-        spell.execute(self.sql_query, self.bindings or {})
+    def execute(self, row_factory = None):
+        # The caller owns the returned Spell; use it as a context manager so its
+        # cursor is closed (or parked for reuse) as soon as the rows are read
+        self.batch_before(self.sql_query)
+
+        with self.route(self.sql_query) as (conn, name):
+            spell = self.new_spell(conn, name, row_factory)
+            # Buffered rows stay readable after a replica connection goes back
+            spell.execute(self.sql_query, self.bindings or {}, cursor=self.prepared_cursor(conn, spell.row_factory))
+        self.invalidate_cache(self.sql_query)
+        self.batch_wrote(self.sql_query)
         return spell
 
-    def result_set(self, fetch_type = "all", size = None):
+    def batch_before(self, sql, write = None):
+        if self.write_batch is not None:
+            self.write_batch.before(sql, write)
+
+    def batch_wrote(self, sql, write = None):
+        if self.write_batch is None:
+            return
+        if write_table(sql) is not None if write is None else write:
+            self.write_batch.wrote()
+
+    def prepared_cursor(self, conn, row_factory = None):
+        # Stored queries are prepared once per MySQL connection; SQLite already
+        # reuses prepared statements through the connection's statement cache
+        if self.stored_query is None or self.get_engine() != "mysql":
+            return None
 
-        spell = self.execute()
-        if spell:
+        sql        = self.sql_query
+        dictionary = False if row_factory in ("tuple", "row") else None
+        try:
+            return self.prepared.get(
+                conn, (self.stored_query, sql, dictionary), partial(PreparedCursor, conn, sql, dictionary)
+            )
+        except db_errors() as err:
+            logger.error(f"[SorcererDB] Error preparing stored query: {self.stored_query} | {err}")
+            raise ValueError(f"Error preparing stored query: {self.stored_query} | {err}")
+
+    def prepared_stats(self):
+        return self.prepared.stats()
+
+    def result_set(self, fetch_type = "all", size = None, cache = True, format = "rows", row_factory = None):
+        # Only flushes queued rows; execute() does the rest of the batch bookkeeping
+        self.batch_before(self.sql_query, write=False)
+        if format == "columns":
+            if fetch_type != "all" or size is not None:
+                logger.error(f"[SorcererDB] Invalid fetch for columns: {fetch_type}, size {size}")
+                raise ValueError(f"Invalid fetch for columns: {fetch_type}, size {size}")
+            return self.fetch_columns()
+        elif format != "rows":
+            logger.error(f"[SorcererDB] Invalid result format: {format}")
+            raise ValueError(f"Invalid result format: {format}")
+
+        cache_key = self.cache_key(fetch_type, size, row_factory) if cache else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.row_count = self.cached_row_count(cached, fetch_type, self.row_count)
+                return cached
+
+        with self.execute(row_factory) as spell:
             if fetch_type == "all":
                 self.row_count = spell.rowcount()
-                return spell.fetchall()
+                result = spell.fetchall()
             elif fetch_type == "one":
                 self.row_count = spell.rowcount()
-                return spell.fetchone()
+                result = spell.fetchone()
             elif fetch_type == "many":
                 self.row_count = spell.rowcount()
-                return spell.fetchmany(size=size)
+                result = spell.fetchmany(size=size)
             elif fetch_type == "count":
                 self.row_count = spell.rowcount()
-                return self.row_count
+                result = self.row_count
             elif fetch_type == "last_insert_id":
                 return spell.insert_id()
             else:
                 raise ValueError(f"Invalid fetch type: {fetch_type}")
-        else:
-            return False
+
+            if cache_key is not None:
+                self.cache.set(cache_key, result, read_tables(self.sql_query))
+            return result
     
+    @staticmethod
+    def cached_row_count(cached, fetch_type, row_count):
+        # A cache hit has no cursor to ask; anything else keeps the last count
+        if isinstance(cached, list):
+            return len(cached)
+        if fetch_type == "count":
+            return cached
+        return row_count
+
+    def fetch_columns(self, chunk_size = 10000):
+        # Tuple rows read in chunks straight into per-column arrays; no row
+        # dicts are built and the driver never buffers the whole result
+        with self.route(self.sql_query) as (conn, name), self.new_spell(conn, name) as spell:
+            spell.execute(self.sql_query, self.bindings or {}, buffered=False, dictionary=False)
+            columns = read_columns(spell.cursor.description or [], spell.stream(chunk_size))
+
+        self.row_count = len(next(iter(columns.values()))) if columns else 0
+        return columns
+
+    def export(self, sql, bindings, dest, format = "csv", chunk_size = 10000, compress = None):
+        # Tuple rows go from an unbuffered cursor, chunk_size at a time, through
+        # a buffered (optionally gzipped) writer; memory stays flat
+        check_format(format)
+        bindings = self.clean_bindings(bindings)
+        started  = time.perf_counter()
+        self.batch_before(sql)
+        with self.route(sql) as (conn, name), self.new_spell(conn, name, "tuple") as spell:
+            spell.execute(sql, bindings, buffered=False, dictionary=False)
+            columns = [column[0] for column in spell.cursor.description or []]
+            with ExportWriter(dest, compress) as writer:
+                rows = write_rows(writer.text, format, columns, spell.stream(chunk_size))
+            written = writer.bytes
+
+        seconds = time.perf_counter() - started
+        result  = {
+            "rows":         rows,
+            "bytes":        written,
+            "seconds":      seconds,
+            "rows_per_sec": rows / seconds if seconds > 0 else 0.0,
+        }
+        logger.info(f"[SorcererDB] Exported {rows} rows ({written} bytes) as {format} in {seconds:.2f}s")
+        self.row_count = rows
+        return result
+
+    def stream(self, fetch_size = 1000, chunks = False):
+        # Stream on a dedicated pooled connection so the session connection stays
+        # usable while rows are read, unless we are pinned to it
+        self.batch_before(self.sql_query)
+        if self.pinned_to_session():
+            conn, name = self.session_connection(), self.active_connection
+        else:
+            conn, name = None, self.replica_for(self.sql_query) or self.active_connection
+
+        # Capture the query now; a generator body only runs on the first next()
+        return self.stream_rows(name, self.sql_query, self.bindings or {}, fetch_size, chunks, conn)
+
+    def stream_rows(self, name, sql, bindings, fetch_size = 1000, chunks = False, conn = None):
+        pool     = self.get_pool(name) if conn is None else None
+        tracking = self.router.track(name) if self.router is not None else nullcontext()
+        with tracking:
+            conn  = pool.checkout() if pool is not None else conn
+            spell = self.new_spell(conn, name)
+            try:
+                spell.execute(sql, bindings, buffered=False)
+                for rows in spell.stream(fetch_size):
+                    if chunks:
+                        yield rows
+                    else:
+                        yield from rows
+            finally:
+                if pool is not None and getattr(conn, "unread_result", False):
+                    # Closed early: reading the rest off the wire could take
+                    # longer than the stream itself, so drop the connection
+                    spell.abandon()
+                    pool.checkin(conn, discard=True)
+                else:
+                    spell.close()
+                    if pool is not None:
+                        pool.checkin(conn)
+
+    # Scatter-Gather Methods
+    def scatter(self, sql, bindings = None, dsns = None, max_workers = None,
+                order_by = None, reverse = False, timeout = None):
+        names    = list(dsns) if dsns is not None else list(self.dsn)
+        bindings = self.clean_bindings(bindings)
+
+        results, errors, timeouts = gather(
+            partial(self.fetch_on, sql=sql, bindings=bindings), names, max_workers, timeout
+        )
+        self.invalidate_cache(sql)
+
+        ordered = {name: results[name] for name in names if name in results}
+        return {
+            "rows":     merge_rows(ordered.values(), order_by, reverse),
+            "results":  ordered,
+            "errors":   errors,
+            "timeouts": timeouts,
+            "complete": len(ordered) == len(names),
+        }
+
+    def scatter_stream(self, sql, bindings = None, dsns = None, order_by = None,
+                       reverse = False, fetch_size = 1000):
+        names    = list(dsns) if dsns is not None else list(self.dsn)
+        bindings = self.clean_bindings(bindings)
+
+        def open_stream(name):
+            if self.router is not None:
+                name = self.router.route(name, sql) or name
+            return self.stream_rows(name, sql, bindings, fetch_size, chunks=True)
+
+        return stream_merge(open_stream, names, order_by, reverse)
+
+    def fetch_on(self, name, sql, bindings, fetch_type = "all", size = None):
+        # One statement on a pooled connection of DSN `name`, or on one of its
+        # replicas for a read when replicas are set
+        replica  = self.router.route(name, sql) if self.router is not None else None
+        target   = replica or name
+        tracking = self.router.track(target) if self.router is not None else nullcontext()
+        with tracking, self.pooled_connection(target) as conn, self.new_spell(conn, target) as spell:
+            spell.execute(sql, bindings)
+            return spell.fetch(fetch_type, size)
+
+    def clean_bindings(self, params):
+        return dict(self.clean_binding(param, value) for param, value in (params or {}).items())
+
+    # Pipeline Methods
+    def pipeline(self, statements, max_workers = None):
+        # Independent statements in as few round trips as possible: one
+        # multi-statement packet on MySQL, otherwise concurrently on pooled
+        # connections, or in order on the session connection inside a
+        # transaction. A failed statement's slot holds its ValueError and the
+        # other statements still run.
+        calls = [
+            (sql, self.clean_bindings(bindings), fetch_type, size)
+            for sql, bindings, fetch_type, size in pipeline_calls(statements)
+        ]
+        if not calls:
+            return []
+
+        for sql, _, _, _ in calls:
+            self.batch_before(sql)
+
+        if self.get_engine() == "mysql":
+            results = self.pipeline_multi(calls)
+        elif self.pinned_to_session():
+            results = self.pipeline_each(calls)
+        else:
+            results = self.pipeline_concurrent(calls, max_workers)
+
+        for sql, _, _, _ in calls:
+            self.invalidate_cache(sql)
+            self.batch_wrote(sql)
+        return results
+
+    def pipeline_multi(self, calls):
+        results = [None] * len(calls)
+        # Replicas only when every statement is a read
+        probe   = next((sql for sql, _, _, _ in calls if not is_read(sql)), calls[0][0])
+        with self.route(probe) as (conn, name):
+            row_factory = check_row_factory(self.get_dsn(name).row_factory)
+            start = 0
+            while start < len(calls):
+                start = self.run_multi(conn, name, calls, start, results, row_factory)
+        return results
+
+    def run_multi(self, conn, name, calls, start, results, row_factory):
+        # Sends calls[start:] as one packet and returns where to carry on: the
+        # server stops at a failing statement, so the rest are sent again
+        parts  = []
+        params = {}
+        for index in range(start, len(calls)):
+            sql, numbered = number_bindings(index, calls[index][0], calls[index][1])
+            parts.append(sql.strip().rstrip(";"))
+            params.update(numbered)
+        multi_sql = ";\n".join(parts)
+
+        index   = start
+        cursor  = conn.cursor(dictionary=row_factory == "dict", buffered=True)
+        started = time.perf_counter()
+        try:
+            for result in multi_results(cursor, multi_sql, params):
+                _, _, fetch_type, size = calls[index]
+                row_type = None
+                if row_factory == "row" and result.description is not None:
+                    row_type = row_class(tuple(column[0] for column in result.description))
+                results[index] = read_result(result, fetch_type, size, row_type)
+                index += 1
+        except db_errors() as err:
+            logger.error(f"[SorcererDB] Error executing query: {calls[index][0]} | {err}")
+            results[index] = ValueError(f"Something went wrong: {err}")
+            index += 1
+        finally:
+            cursor.close()
+
+        if self.profiler is not None:
+            self.profiler.record(name, multi_sql, time.perf_counter() - started)
+        return index
+
+    def pipeline_each(self, calls):
+        results = []
+        conn    = self.session_connection()
+        for sql, bindings, fetch_type, size in calls:
+            try:
+                with self.new_spell(conn) as spell:
+                    spell.execute(sql, bindings)
+                    results.append(spell.fetch(fetch_type, size))
+            except ValueError as err:
+                results.append(err)
+        return results
+
+    def pipeline_concurrent(self, calls, max_workers = None):
+        name = self.active_connection
+
+        def run(index):
+            sql, bindings, fetch_type, size = calls[index]
+            return self.fetch_on(name, sql, bindings, fetch_type, size)
+
+        workers = max_workers or self.get_dsn(name).pool_max_size
+        results, errors, _ = gather(run, list(range(len(calls))), workers)
+        return [results[i] if i in results else ValueError(errors[i]) for i in range(len(calls))]
+
+    # Pagination Methods
+    def paginate(self, table_or_sql, key_columns, page_size = 1000, conditions = None,
+                 cursor = None, descending = False):
+        if page_size < 1:
+            logger.error(f"[SorcererDB] Invalid page size: {page_size}")
+            raise ValueError(f"Invalid page size: {page_size}")
+
+        key_columns = key_columns_of(key_columns)
+        last_key    = decode_cursor(cursor, key_columns) if cursor is not None else None
+
+        # Validate and bind the conditions now; the generator runs on first next()
+        c_fields, c_values = self.build_bindings(conditions) if conditions else ({}, {})
+        return self.paginate_pages(
+            table_or_sql, key_columns, page_size, list(c_fields.values()), c_values, last_key, descending
+        )
+
+    def paginate_pages(self, table_or_sql, key_columns, page_size, filters, values, last_key, descending):
+        binders   = [self.format_binder(f"seek_{i}") for i in range(len(key_columns))]
+        direction = " DESC" if descending else ""
+        order     = " ORDER BY " + ", ".join(column + direction for column in key_columns)
+        limit     = " LIMIT " + self.format_binder("limit")
+        select    = "SELECT * FROM " + page_source(table_or_sql)
+
+        first_sql = select + (" WHERE " + " AND ".join(filters) if filters else "") + order + limit
+        seek_sql  = select + " WHERE " + " AND ".join(filters + [seek_predicate(key_columns, binders, descending)]) + order + limit
+
+        # Keys are read by column name, which plain tuples do not support
+        row_factory = "row" if self.get_dsn(self.active_connection).row_factory == "tuple" else None
+
+        while True:
+            bindings = {**values, "limit": page_size}
+            if last_key is None:
+                sql = first_sql
+            else:
+                sql = seek_sql
+                bindings.update({f"seek_{i}": value for i, value in enumerate(last_key)})
+
+            # Bound as-is so seek values compare as their own type, as in insert_batch()
+            self.query(sql)
+            self.bindings = bindings
+            rows = self.result_set("all", cache=False, row_factory=row_factory)
+            if not rows:
+                return
+
+            last_key = [rows[-1][column] for column in key_columns]
+            more     = len(rows) == page_size
+            yield Page(rows, encode_cursor(key_columns, last_key) if more else None)
+
+            if not more:
+                return
+
     def result_data(self, fetch_type = "all", size = None):
         if fetch_type == "all":
             return self.cursor.fetchall()
@@ -362,21 +954,523 @@ class SorcererDB:
     def result_count(self):
         return self.row_count
 
+    # Profiling Methods
+    def stats(self, name = None):
+        report = {
+            "queries":    self.profiler.stats(name) if self.profiler is not None else {},
+            "pools":      {dsn: pool.stats() for dsn, pool in self.pools.items() if name in (None, dsn)},
+            "statements": self.statement_stats(),
+            "prepared":   self.prepared_stats(),
+            "cursors":    {"live": live_cursors(), **self.cursors.stats()},
+        }
+        if self.cache is not None:
+            report["cache"] = self.cache.stats()
+        if self.router is not None:
+            report["replicas"] = self.router.stats()
+
+        return report
+
+    def prometheus(self):
+        if self.profiler is None:
+            return ""
+        return self.profiler.prometheus()
+
+    # Cache Methods
+    def cache_key(self, fetch_type, size = None, row_factory = None):
+        if self.cache is None or fetch_type == "last_insert_id":
+            return None
+        if not self.sql_query.lstrip()[:6].lower() == "select":
+            return None
+        # Reads inside a transaction may see uncommitted writes
+        if self.in_transaction():
+            return None
+
+        row_factory = row_factory or self.get_dsn(self.active_connection).row_factory
+        return self.cache.make_key(self.active_connection, self.sql_query, self.bindings, fetch_type, size, row_factory)
+
+    def invalidate_cache(self, sql):
+        if self.cache is None:
+            return 0
+
+        table = write_table(sql)
+        if table is None:
+            return 0
+
+        if self.in_transaction():
+            # Invalidate again at commit so reads cached mid-transaction are dropped
+            self.pending_invalidations.add(table)
+        return self.cache.invalidate(table)
+
     # CRUD Methods
     def insert(self, table, data):
+        batch = self.write_batch
+        if batch is not None and batch.coalesce and isinstance(data, dict) and data:
+            # Written later as part of a multi-row INSERT, so there is no id yet
+            batch.queue(table, data)
+            return None
+
+        insert_sql, values = self.compile_insert(table, data)
+        self.query(insert_sql).set_bindings(values)
+        return self.result_set("last_insert_id")
+
+    def compile_insert(self, table, data):
         data_count = int(len(data))
         if data_count > 0:
+            shape, raw = self.binding_shape(data)
+            key        = (self.get_engine(), "insert", table, shape)
+            template   = self.statements.get(key)
+            if template is not None:
+                insert_sql, fields = template
+                return insert_sql, self.bind_template(fields, raw)
+
             fields, values = self.build_bindings(data)
 
             insert_sql = "INSERT INTO `" + table + "` "
-            insert_sql += "SET " + ", ".join(fields.values())
-            self.query(insert_sql).set_bindings(values)
-            return self.result_set("last_insert_id")
+            if self.get_engine() == "sqlite":
+                binders = [self.format_binder(field) for field in fields.keys()]
+                insert_sql += "(" + ", ".join(fields.keys()) + ") "
+                insert_sql += "VALUES (" + ", ".join(binders) + ")"
+            else:
+                insert_sql += "SET " + ", ".join(fields.values())
+
+            self.statements.set(key, (insert_sql, self.template_fields(shape)))
+            return insert_sql, values
         else:
             logger.error(f"[SorcererDB] Invalid data: {data}")
             raise ValueError(f"Invalid data: {data}")
 
+    def insert_many(self, table, rows, batch_size = 1000, max_packet = None):
+        if batch_size < 1:
+            logger.error(f"[SorcererDB] Invalid batch size: {batch_size}")
+            raise ValueError(f"Invalid batch size: {batch_size}")
+
+        result = {"rows": 0, "batches": 0, "first_id": None, "last_id": None}
+
+        own_transaction = not self.in_transaction()
+        if own_transaction:
+            self.begin()
+
+        try:
+            for columns, batch in self.split_batches(rows, batch_size, max_packet or self.get_max_packet()):
+                self.insert_batch(table, columns, batch, result)
+
+            if own_transaction:
+                self.commit()
+        except Exception:
+            if own_transaction:
+                self.rollback()
+            raise
+
+        return result
+
+    def split_batches(self, rows, batch_size, max_packet):
+        # Groups rows into statements bounded by batch_size, the packet size and
+        # SQLite's bound variable limit. Every row must have the first row's columns.
+        columns     = None
+        batch       = []
+        batch_bytes = 0
+
+        for row in rows:
+            if columns is None:
+                if len(row) == 0:
+                    logger.error(f"[SorcererDB] Invalid data: {row}")
+                    raise ValueError(f"Invalid data: {row}")
+                columns   = list(row.keys())
+                row_limit = self.max_batch_rows(len(columns), batch_size)
+            elif len(row) != len(columns) or any(column not in row for column in columns):
+                logger.error(f"[SorcererDB] Row columns do not match {columns}: {row}")
+                raise ValueError(f"Row columns do not match {columns}: {row}")
+
+            row_bytes = sum(len(str(value)) + len(column) + 8 for column, value in row.items())
+            if batch and (len(batch) >= row_limit or batch_bytes + row_bytes > max_packet):
+                yield columns, batch
+                batch       = []
+                batch_bytes = 0
+
+            batch.append(row)
+            batch_bytes += row_bytes
+
+        if batch:
+            yield columns, batch
+
+    def insert_batch(self, table, columns, batch, result):
+        key      = (self.get_engine(), "insert_many", table, tuple(columns), len(batch))
+        template = self.statements.get(key)
+        if template is None:
+            fields, keys, values_sql = self.compile_values(columns, len(batch))
+            insert_sql = "INSERT INTO `" + table + "` "
+            insert_sql += "(" + ", ".join(fields) + ") "
+            insert_sql += values_sql
+            template = self.statements.set(key, (insert_sql, keys))
+
+        insert_sql, keys = template
+
+        # Ids follow from the driver's last insert id only when the key was
+        # generated; rows that carry it may hold any values, so those batches
+        # leave first_id/last_id alone
+        generated = not set(self.primary_key(table)) & {column.strip().lower() for column in columns}
+
+        # Values are bound as-is; set_bindings() would stringify every one of them
+        self.query(insert_sql)
+        self.bindings = self.bind_rows(columns, batch, keys)
+        with self.execute() as spell:
+            insert_id = spell.insert_id()
+
+        count = len(batch)
+        if generated:
+            if self.get_engine() == "sqlite":
+                # SQLite reports the rowid of the last row, MySQL the first
+                first_id, last_id = insert_id - count + 1, insert_id
+            else:
+                first_id, last_id = insert_id, insert_id + count - 1
+
+            if result["first_id"] is None:
+                result["first_id"] = first_id
+            result["last_id"] = last_id
+        result["rows"]    += count
+        result["batches"] += 1
+        self.row_count     = result["rows"]
+        return result
+
+    def primary_key(self, table):
+        # Lower-cased primary key columns, looked up once per DSN and table
+        key     = (self.active_connection, "primary_key", table)
+        columns = self.statements.get(key)
+        if columns is None:
+            if self.get_engine() == "sqlite":
+                rows    = self.simple(f"PRAGMA table_info(`{table}`)", cache=False, row_factory="tuple")
+                columns = tuple(row[1].lower() for row in rows if row[5])
+            else:
+                rows    = self.simple(f"SHOW KEYS FROM `{table}` WHERE Key_name = 'PRIMARY'", cache=False, row_factory="tuple")
+                columns = tuple(row[4].lower() for row in rows)
+            columns = self.statements.set(key, columns)
+        return columns
+
+    def compile_values(self, columns, count):
+        fields = [column.strip().lower() for column in columns]
+        keys   = []
+        tuples = []
+        for i in range(count):
+            row_keys = [f"{field}_{i}" for field in fields]
+            keys.append(row_keys)
+            tuples.append("(" + ", ".join(self.format_binder(k) for k in row_keys) + ")")
+
+        return fields, keys, "VALUES " + ", ".join(tuples)
+
+    @staticmethod
+    def bind_rows(columns, batch, keys):
+        values = {}
+        for row, row_keys in zip(batch, keys):
+            for column, k in zip(columns, row_keys):
+                values[k] = row[column]
+        return values
+
+    def upsert_many(self, table, rows, key_columns, update_columns = None, batch_size = 1000, max_packet = None):
+        if batch_size < 1:
+            logger.error(f"[SorcererDB] Invalid batch size: {batch_size}")
+            raise ValueError(f"Invalid batch size: {batch_size}")
+
+        key_columns = [key_columns] if isinstance(key_columns, str) else list(key_columns)
+        result      = {"rows": 0, "batches": 0, "inserted": 0, "updated": 0, "batch_counts": []}
+
+        own_transaction = not self.in_transaction()
+        if own_transaction:
+            self.begin()
+
+        try:
+            for columns, batch in self.split_batches(rows, batch_size, max_packet or self.get_max_packet()):
+                missing = [column for column in key_columns if column not in columns]
+                if missing:
+                    logger.error(f"[SorcererDB] Rows are missing key columns: {missing}")
+                    raise ValueError(f"Rows are missing key columns: {missing}")
+
+                updates = [column for column in (update_columns or columns) if column not in key_columns]
+                self.upsert_batch(table, columns, key_columns, updates, batch, result)
+
+            if own_transaction:
+                self.commit()
+        except Exception:
+            if own_transaction:
+                self.rollback()
+            raise
+
+        return result
+
+    def upsert_batch(self, table, columns, key_columns, updates, batch, result):
+        engine   = self.get_engine()
+        key      = (engine, "upsert_many", table, tuple(columns), tuple(key_columns), tuple(updates), len(batch))
+        template = self.statements.get(key)
+        if template is None:
+            fields, keys, values_sql = self.compile_values(columns, len(batch))
+            upsert_sql = "INSERT INTO `" + table + "` (" + ", ".join(fields) + ") " + values_sql
+            if engine == "sqlite":
+                upsert_sql += " ON CONFLICT (" + ", ".join(key_columns) + ")"
+                if updates:
+                    upsert_sql += " DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in updates)
+                else:
+                    upsert_sql += " DO NOTHING"
+            else:
+                assignments = [f"{c} = VALUES({c})" for c in updates] or [f"{key_columns[0]} = {key_columns[0]}"]
+                upsert_sql += " ON DUPLICATE KEY UPDATE " + ", ".join(assignments)
+            template = self.statements.set(key, (upsert_sql, keys))
+
+        upsert_sql, keys = template
+
+        # Neither engine says which rows were new, so count the keys that exist
+        # beforehand; one extra statement per batch, inside the same transaction
+        distinct = list(dict.fromkeys(tuple(row[column] for column in key_columns) for row in batch))
+        existing = self.count_existing(table, key_columns, distinct)
+
+        self.query(upsert_sql)
+        self.bindings = self.bind_rows(columns, batch, keys)
+        self.execute().close()
+
+        inserted = len(distinct) - existing
+        counts   = {"rows": len(batch), "inserted": inserted, "updated": len(batch) - inserted}
+        result["batch_counts"].append(counts)
+        result["rows"]     += counts["rows"]
+        result["inserted"] += counts["inserted"]
+        result["updated"]  += counts["updated"]
+        result["batches"]  += 1
+        self.row_count      = result["rows"]
+        return result
+
+    def count_existing(self, table, key_columns, key_values):
+        bindings = {}
+        tuples   = []
+        for i, values in enumerate(key_values):
+            binders = []
+            for column, value in zip(key_columns, values):
+                bindings[f"k{i}_{column}"] = value
+                binders.append(self.format_binder(f"k{i}_{column}"))
+            tuples.append("(" + ", ".join(binders) + ")" if len(binders) > 1 else binders[0])
+
+        if len(key_columns) == 1:
+            match = key_columns[0] + " IN (" + ", ".join(tuples) + ")"
+        elif self.get_engine() == "sqlite":
+            match = "(" + ", ".join(key_columns) + ") IN (VALUES " + ", ".join(tuples) + ")"
+        else:
+            match = "(" + ", ".join(key_columns) + ") IN (" + ", ".join(tuples) + ")"
+
+        self.query("SELECT COUNT(*) AS existing FROM `" + table + "` WHERE " + match)
+        self.bindings = bindings
+        return int(self.result_set("one", cache=False, row_factory="dict")["existing"])
+
+    def update_many(self, table, rows, key_column, batch_size = 1000, max_packet = None, join_threshold = 5000):
+        if batch_size < 1:
+            logger.error(f"[SorcererDB] Invalid batch size: {batch_size}")
+            raise ValueError(f"Invalid batch size: {batch_size}")
+
+        result = {"rows": 0, "batches": 0, "affected": 0, "batch_counts": []}
+        for columns, batch in self.split_batches(rows, batch_size, max_packet or self.get_max_packet()):
+            updates = [column for column in columns if column != key_column]
+            if key_column not in columns or not updates:
+                logger.error(f"[SorcererDB] Rows need {key_column} and at least one column to update")
+                raise ValueError(f"Rows need {key_column} and at least one column to update")
+
+            # Each batch commits on its own, unless the caller already opened a transaction
+            own_transaction = not self.in_transaction()
+            if own_transaction:
+                self.begin()
+            try:
+                if len(batch) >= join_threshold:
+                    affected = self.update_batch_join(table, key_column, columns, updates, batch)
+                else:
+                    affected = self.update_batch_case(table, key_column, columns, updates, batch)
+                if own_transaction:
+                    self.commit()
+            except Exception:
+                if own_transaction:
+                    self.rollback()
+                raise
+
+            result["batch_counts"].append(affected)
+            result["affected"] += affected
+            result["rows"]     += len(batch)
+            result["batches"]  += 1
+
+        self.row_count = result["affected"]
+        return result
+
+    def update_batch_case(self, table, key_column, columns, updates, batch):
+        key      = (self.get_engine(), "update_many", table, key_column, tuple(columns), len(batch))
+        template = self.statements.get(key)
+        if template is None:
+            fields, keys, _ = self.compile_values(columns, len(batch))
+            key_index = columns.index(key_column)
+            key_binders = [self.format_binder(row_keys[key_index]) for row_keys in keys]
+
+            assignments = []
+            for column in updates:
+                index = columns.index(column)
+                whens = " ".join(
+                    f"WHEN {key_binder} THEN {self.format_binder(row_keys[index])}"
+                    for key_binder, row_keys in zip(key_binders, keys)
+                )
+                assignments.append(f"{fields[index]} = CASE {fields[key_index]} {whens} ELSE {fields[index]} END")
+
+            update_sql  = "UPDATE `" + table + "` SET " + ", ".join(assignments)
+            update_sql += " WHERE " + fields[key_index] + " IN (" + ", ".join(key_binders) + ")"
+            template = self.statements.set(key, (update_sql, keys))
+
+        update_sql, keys = template
+        self.query(update_sql)
+        self.bindings = self.bind_rows(columns, batch, keys)
+        with self.execute() as spell:
+            return spell.rowcount()
+
+    def update_batch_join(self, table, key_column, columns, updates, batch):
+        # Very large batches: load the new values into a temporary table and
+        # update with one join instead of a CASE arm per row
+        engine  = self.get_engine()
+        temp    = f"{table}_update_many"
+        fields  = [column.strip().lower() for column in columns]
+        key     = key_column.strip().lower()
+        changes = [column.strip().lower() for column in updates]
+        drop    = f"DROP TABLE IF EXISTS temp.{temp}" if engine == "sqlite" else f"DROP TEMPORARY TABLE IF EXISTS `{temp}`"
+        create  = "CREATE TEMP TABLE" if engine == "sqlite" else "CREATE TEMPORARY TABLE"
+
+        # CREATE ... AS SELECT copies no indexes; without one every row's lookup
+        # of its new values scans the whole temporary table. On MySQL the index
+        # is declared inline: CREATE INDEX would implicitly commit the caller's
+        # transaction, CREATE TEMPORARY TABLE does not
+        index = "" if engine == "sqlite" else f" (INDEX ({key}))"
+
+        self.simple(drop, "count")
+        self.simple(f"{create} `{temp}`{index} AS SELECT {', '.join(fields)} FROM `{table}` WHERE 1 = 0", "count")
+        try:
+            if engine == "sqlite":
+                self.simple(f"CREATE INDEX temp.{temp}_{key} ON `{temp}` ({key})", "count")
+            self.insert_batch(temp, columns, batch, {"rows": 0, "batches": 0, "first_id": None, "last_id": None})
+
+            if engine == "sqlite":
+                update_sql  = f"UPDATE `{table}` SET "
+                update_sql += ", ".join(f"{c} = (SELECT u.{c} FROM `{temp}` AS u WHERE u.{key} = `{table}`.{key})" for c in changes)
+                update_sql += f" WHERE {key} IN (SELECT {key} FROM `{temp}`)"
+            else:
+                update_sql  = f"UPDATE `{table}` AS target JOIN `{temp}` AS u ON target.{key} = u.{key} SET "
+                update_sql += ", ".join(f"target.{c} = u.{c}" for c in changes)
+
+            with self.query(update_sql).execute() as spell:
+                return spell.rowcount()
+        finally:
+            self.simple(drop, "count")
+
+    def bulk_load(self, table, source, columns = None, chunk_size = 10000, delimiter = None, header = True):
+        # source is a CSV/TSV path or any iterable of dicts or sequences. Rows are
+        # read lazily and sent chunk_size at a time, all in one transaction.
+        if chunk_size < 1:
+            logger.error(f"[SorcererDB] Invalid chunk size: {chunk_size}")
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+        config = self.get_dsn(self.active_connection)
+        if config.engine == "mysql" and not config.local_infile:
+            logger.error(f"[SorcererDB] bulk_load() needs local_infile=True on {config.name}")
+            raise ValueError(f"bulk_load() needs local_infile=True on {config.name}")
+
+        columns, rows = read_source(source, columns, delimiter, header)
+        result = {"rows": 0, "chunks": 0}
+
+        self.batch_before(table, write=True)
+        own_transaction = not self.in_transaction()
+        if own_transaction:
+            self.begin()
+
+        try:
+            if config.engine == "sqlite":
+                self.load_executemany(table, columns, rows, chunk_size, result)
+            elif is_path(source):
+                # The server reads the file as the client streams it; nothing is parsed here
+                load_sql = load_data_sql(
+                    source, table, columns, config.charset, file_delimiter(source, delimiter), True, header
+                )
+                result["rows"]   = self.load_infile(load_sql)
+                result["chunks"] = 1
+            else:
+                self.load_spooled(table, columns, rows, chunk_size, config.charset, result)
+
+            if own_transaction:
+                self.commit()
+        except Exception:
+            if own_transaction:
+                self.rollback()
+            raise
+
+        self.batch_wrote(table, write=True)
+        self.row_count = result["rows"]
+        return result
+
+    def load_executemany(self, table, columns, rows, chunk_size, result):
+        load_sql  = "INSERT INTO `" + table + "` (" + ", ".join(columns) + ") "
+        load_sql += "VALUES (" + ", ".join("?" for _ in columns) + ")"
+        with self.new_spell(self.session_connection()) as spell:
+            for chunk in chunked(rows, chunk_size):
+                spell.executemany(load_sql, chunk)
+                result["rows"]   += len(chunk)
+                result["chunks"] += 1
+        self.invalidate_cache(load_sql)
+        return result
+
+    def load_spooled(self, table, columns, rows, chunk_size, charset, result):
+        # Each chunk is written to one reused temp file and loaded from there,
+        # so only chunk_size rows are ever held in memory or on disk
+        import os
+        import tempfile
+
+        with tempfile.NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8", newline="", delete=False) as handle:
+            path = handle.name
+        try:
+            load_sql = load_data_sql(path, table, columns, charset)
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                for chunk in chunked(rows, chunk_size):
+                    write_infile(handle, chunk)
+                    result["rows"]   += self.load_infile(load_sql)
+                    result["chunks"] += 1
+        finally:
+            os.unlink(path)
+        return result
+
+    def load_infile(self, load_sql):
+        with self.new_spell(self.session_connection()) as spell:
+            spell.execute(load_sql, {})
+            count = spell.rowcount()
+        self.invalidate_cache(load_sql)
+        return count
+
+    def get_max_packet(self):
+        name = self.active_connection
+        if name not in self.max_packets:
+            if self.get_engine() == "mysql":
+                record = self.simple("SELECT @@max_allowed_packet AS max_packet", "one", row_factory="dict")
+                # Leave headroom for the statement text around the values
+                self.max_packets[name] = int(int(record["max_packet"]) * 0.9)
+            else:
+                from .sqlite import SQLITE_MAX_LENGTH
+                self.max_packets[name] = SQLITE_MAX_LENGTH
+
+        return self.max_packets[name]
+
+    def max_batch_rows(self, column_count, batch_size):
+        if self.get_engine() == "sqlite":
+            from .sqlite import SQLITE_MAX_VARIABLES
+            return max(1, min(batch_size, SQLITE_MAX_VARIABLES // column_count))
+        return batch_size
+
     def update(self, table, data, conditions):
+        update_sql, values = self.compile_update(table, data, conditions)
+        self.query(update_sql).set_bindings(values)
+        return self.result_set("count")
+
+    def compile_update(self, table, data, conditions):
+        shape, raw     = self.binding_shape(data)
+        c_shape, c_raw = self.binding_shape(conditions)
+        key            = (self.get_engine(), "update", table, shape, c_shape)
+        template       = self.statements.get(key)
+        if template is not None:
+            update_sql, fields, c_fields = template
+            values = self.bind_template(fields, raw)
+            return update_sql, self.bind_template(c_fields, c_raw, values)
+
         fields, values = self.build_bindings(data)
 
         condition_count = int(len(conditions))
@@ -392,12 +1486,24 @@ class SorcererDB:
         if condition_count > 0:
             update_sql += " WHERE " + ", ".join(c_fields.values())
 
-        self.query(update_sql).set_bindings(values).set_bindings(c_values)
-        return self.result_set("count")
+        self.statements.set(key, (update_sql, self.template_fields(shape), self.template_fields(c_shape)))
+        return update_sql, {**values, **c_values}
 
     def delete(self, table, conditions, limit = None):
+        delete_sql, c_values = self.compile_delete(table, conditions, limit)
+        self.query(delete_sql).set_bindings(c_values)
+        return self.result_set("count")
+
+    def compile_delete(self, table, conditions, limit = None):
         condition_count = int(len(conditions))
         if condition_count > 0:
+            c_shape, c_raw = self.binding_shape(conditions)
+            key            = (self.get_engine(), "delete", table, c_shape, limit)
+            template       = self.statements.get(key)
+            if template is not None:
+                delete_sql, c_fields = template
+                return delete_sql, self.bind_template(c_fields, c_raw)
+
             if limit:
                 limit = " LIMIT " + str(limit)
             else:
@@ -409,25 +1515,64 @@ class SorcererDB:
             delete_sql += " WHERE " + ", ".join(c_fields.values())
             delete_sql += limit
 
-            self.query(delete_sql).set_bindings(c_values)
-            return self.result_set("count")
+            self.statements.set(key, (delete_sql, self.template_fields(c_shape)))
+            return delete_sql, c_values
         else:
             logger.error(f"[SorcererDB] Invalid conditions: {conditions}")
             raise ValueError(f"Invalid conditions: {conditions}")
 
 
     # Transactional Methods
+    @contextmanager
+    def batch(self, max_statements = 1000, max_delay_ms = 50, coalesce = False):
+        # Groups the writes made inside the block into transactions; see
+        # WriteBatch. Transactions already committed stay committed if the
+        # block raises; the open one is rolled back.
+        if self.write_batch is not None:
+            # Nested: the outer batch decides when to commit
+            yield self.write_batch
+            return
+
+        batch = WriteBatch(self, max_statements, max_delay_ms, coalesce, external=self.in_transaction())
+        self.write_batch = batch
+        try:
+            yield batch
+            batch.flush()
+        except Exception:
+            batch.discard()
+            raise
+        finally:
+            self.write_batch = None
+
+    def pinned_to_session(self):
+        # Work that could run on another pooled connection stays on the session
+        # connection inside a transaction, and always on a :memory: SQLite DSN
+        return self.in_transaction() or shared_cache(self.get_dsn(self.active_connection))
+
+    def in_transaction(self):
+        return bool(getattr(self.session_connection(), "in_transaction", False))
+
     def begin(self):
         logger.debug(f"[SorcererDB] Beginning transaction")
-        self.connections[self.active_connection].start_transaction()
+        if self.get_engine() == "sqlite":
+            self.session_connection().execute("BEGIN")
+        else:
+            self.session_connection().start_transaction()
         return self
     
     def commit(self):
         logger.debug(f"[SorcererDB] Committing transaction")
-        self.connections[self.active_connection].commit()
+        self.session_connection().commit()
+        if self.router is not None:
+            self.router.wrote()
+        if self.cache is not None:
+            for table in self.pending_invalidations:
+                self.cache.invalidate(table)
+        self.pending_invalidations = set()
         return self
     
     def rollback(self):
         logger.debug(f"[SorcererDB] Rolling back transaction")
-        self.connections[self.active_connection].rollback()
+        self.session_connection().rollback()
+        self.pending_invalidations = set()
         return self
\ No newline at end of file
@@ -0,0 +1,36 @@
+# sorcererdb/drivers.py
+import threading
+from importlib import import_module
+
+# Driver modules per engine. Each one is imported the first time a DSN of that
+# engine connects, so `import sorcererdb` does not pay for drivers it never uses.
+DRIVERS = {
+    "mysql":  "mysql.connector",
+    "sqlite": "sqlite3",
+}
+
+lock    = threading.Lock()
+loaded  = {}
+errors  = ()
+
+
+def load_driver(engine):
+    global errors
+
+    driver = loaded.get(engine)
+    if driver is None:
+        if engine not in DRIVERS:
+            raise ValueError(f"Invalid engine: {engine}")
+
+        with lock:
+            driver = loaded.get(engine)
+            if driver is None:
+                driver = import_module(DRIVERS[engine])
+                loaded[engine] = driver
+                errors = tuple(module.Error for module in loaded.values())
+
+    return driver
+
+def db_errors():
+    # Base error classes of the drivers loaded so far; safe in an except clause
+    return errors
@@ -0,0 +1,105 @@
+# sorcererdb/export.py
+import io
+import os
+
+from loguru import logger
+
+FORMATS = ("csv", "jsonl")
+
+
+class CountingWriter(io.RawIOBase):
+    # Bottom of the writer stack: counts the bytes that reach the destination,
+    # after compression when gzip is on
+    def __init__(self, raw):
+        self.raw   = raw
+        self.count = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        written = self.raw.write(data)
+        written = len(data) if written is None else written
+        self.count += written
+        return written
+
+    def flush(self):
+        self.raw.flush()
+
+
+class ExportWriter:
+    # Text stream over [gzip over] a buffered writer over the byte counter. dest
+    # is a path or a binary file object; a file object is flushed, not closed.
+    # compress defaults to on for paths ending in .gz.
+    def __init__(self, dest, compress = None, buffer_size = 1 << 20):
+        if isinstance(dest, (str, os.PathLike)):
+            self.owned = open(dest, "wb")
+            if compress is None:
+                compress = os.fspath(dest).endswith(".gz")
+        else:
+            self.owned = None
+
+        self.counter  = CountingWriter(self.owned if self.owned is not None else dest)
+        self.buffered = io.BufferedWriter(self.counter, buffer_size)
+        # GzipFile never closes a fileobj it was handed, so close() does
+        self.gzip     = None
+        if compress:
+            import gzip
+            self.gzip = gzip.GzipFile(fileobj=self.buffered, mode="wb")
+        self.text = io.TextIOWrapper(self.buffered if self.gzip is None else self.gzip, encoding="utf-8", newline="")
+
+    @property
+    def bytes(self):
+        return self.counter.count
+
+    def close(self):
+        try:
+            self.text.close()
+            if self.gzip is not None:
+                self.buffered.close()
+        finally:
+            if self.owned is not None:
+                self.owned.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_csv(text, columns, chunks):
+    # csv and json are only imported once something is exported
+    import csv
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(columns)
+    rows = 0
+    for chunk in chunks:
+        writer.writerows(chunk)
+        rows += len(chunk)
+    return rows
+
+def write_jsonl(text, columns, chunks):
+    # Each line is assembled from the tuple row and pre-encoded keys, so no
+    # per-row dict is built
+    import json
+    encode = json.JSONEncoder(default=str, ensure_ascii=False).encode
+    keys   = [json.dumps(column) + ": " for column in columns]
+    rows   = 0
+    for chunk in chunks:
+        text.writelines(
+            "{" + ", ".join([key + encode(value) for key, value in zip(keys, row)]) + "}\n" for row in chunk
+        )
+        rows += len(chunk)
+    return rows
+
+def write_rows(text, format, columns, chunks):
+    if format == "csv":
+        return write_csv(text, columns, chunks)
+    return write_jsonl(text, columns, chunks)
+
+def check_format(format):
+    if format not in FORMATS:
+        logger.error(f"[Export] Invalid format: {format}")
+        raise ValueError(f"Invalid format: {format}")
+    return format
@@ -8,7 +8,9 @@ __log_file = __log_dir / "sorcererdb.log"
 __default_level = "INFO"
 
 def configure_logging(level: str = None, log_file: str = None):
+    # Opt-in: sorcererdb logs nothing until this is called
     logger.remove()
+    logger.enable("sorcererdb")
 
     log_level = level or os.getenv("SORCERERDB_LOG_LEVEL", __default_level)
     log_path  = log_file or os.getenv("SORCERERDB_LOG_FILE", __log_file)
@@ -0,0 +1,45 @@
+# sorcererdb/paginate.py
+
+class Page(list):
+    # One page of rows; `cursor` resumes the walk right after its last row and
+    # is None once the source is exhausted
+    def __init__(self, rows, cursor = None):
+        super().__init__(rows)
+        self.cursor = cursor
+
+
+def key_columns_of(key_columns):
+    if isinstance(key_columns, str):
+        return [key_columns]
+    return list(key_columns)
+
+def encode_cursor(key_columns, values):
+    # Opaque and URL safe, so it can travel through a query string between requests
+    import base64, json
+    payload = json.dumps({"k": key_columns, "v": list(values)}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor, key_columns):
+    import base64, json
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as err:
+        raise ValueError(f"Invalid pagination cursor: {err}")
+
+    if not isinstance(payload, dict) or payload.get("k") != key_columns or len(payload.get("v", [])) != len(key_columns):
+        raise ValueError(f"Pagination cursor does not match key columns {key_columns}")
+    return payload["v"]
+
+def seek_predicate(key_columns, binders, descending = False):
+    # (k1, k2) > (v1, v2) lets the index range scan start right after the last
+    # row, where OFFSET would read and discard every skipped row
+    operator = "<" if descending else ">"
+    if len(key_columns) == 1:
+        return f"{key_columns[0]} {operator} {binders[0]}"
+    return f"({', '.join(key_columns)}) {operator} ({', '.join(binders)})"
+
+def page_source(table_or_sql):
+    # A bare name is a table; anything else is a query paged as a subquery
+    if len(table_or_sql.split()) > 1:
+        return "(" + table_or_sql + ") AS page_source"
+    return "`" + table_or_sql + "`"
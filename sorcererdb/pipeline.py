@@ -0,0 +1,69 @@
+# sorcererdb/pipeline.py
+import re
+from functools import lru_cache
+
+from loguru import logger
+
+NAMED_PARAM = re.compile(r"%\((\w+)\)s")
+FETCH_TYPES = ("all", "one", "single", "many", "count", "insert_id", "last_insert_id")
+
+
+def pipeline_calls(statements):
+    # Each statement is a SQL string or (sql, bindings[, fetch_type[, size]])
+    calls = []
+    for statement in statements:
+        if isinstance(statement, str):
+            statement = (statement,)
+        sql, bindings, fetch_type, size = (tuple(statement) + (None, "all", None))[:4]
+        if fetch_type not in FETCH_TYPES:
+            logger.error(f"[Pipeline] Invalid fetch type: {fetch_type}")
+            raise ValueError(f"Invalid fetch type: {fetch_type}")
+        calls.append((sql, bindings or {}, fetch_type, size or 25))
+    return calls
+
+def number_bindings(index, sql, bindings):
+    # Statements sent together share one parameter dict, so every statement's
+    # %(name)s placeholders are renamed apart
+    prefix = f"s{index}_"
+    sql    = NAMED_PARAM.sub(lambda match: f"%({prefix}{match.group(1)})s", sql)
+    return sql, {prefix + key: value for key, value in bindings.items()}
+
+@lru_cache(maxsize=None)
+def accepts_multi(cursor_class):
+    # mysql-connector < 9.2 takes execute(..., multi=True) and returns an
+    # iterator of per-statement cursors. Decided once per cursor class, so an
+    # execute() is never retried: that would send the statements twice.
+    import inspect
+    try:
+        return "multi" in inspect.signature(cursor_class.execute).parameters
+    except (TypeError, ValueError):
+        return False
+
+def multi_results(cursor, sql, params):
+    # Yields the cursor once per statement, positioned on that statement's result
+    if accepts_multi(type(cursor)):
+        yield from cursor.execute(sql, params, multi=True)
+        return
+
+    # Newer connectors run every statement from execute(); nextset() moves on
+    cursor.execute(sql, params)
+    yield cursor
+    while cursor.nextset():
+        yield cursor
+
+def read_result(cursor, fetch_type, size, row_type = None):
+    if fetch_type == "count":
+        if cursor.description is not None:
+            cursor.fetchall()
+        return cursor.rowcount
+    if fetch_type in ("insert_id", "last_insert_id"):
+        return cursor.lastrowid
+
+    rows = cursor.fetchall() if cursor.description is not None else []
+    if row_type is not None:
+        rows = list(map(row_type, rows))
+    if fetch_type in ("one", "single"):
+        return rows[0] if rows else None
+    if fetch_type == "many":
+        return rows[:size]
+    return rows
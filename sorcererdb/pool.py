@@ -0,0 +1,172 @@
+# sorcererdb/pool.py
+import time
+import threading
+from collections import deque
+
+from loguru import logger
+
+
+class ConnectionPool:
+
+    def __init__(self, factory, name = "", min_size = 1, max_size = 10,
+                 max_idle = 300, max_lifetime = 3600, wait_timeout = 30):
+        if max_size < 1 or min_size > max_size:
+            logger.error(f"[Pool] Invalid pool size: min {min_size} / max {max_size}")
+            raise ValueError(f"Invalid pool size: min {min_size} / max {max_size}")
+
+        self.factory      = factory
+        self.name         = name
+        self.min_size     = min_size
+        self.max_size     = max_size
+        self.max_idle     = max_idle
+        self.max_lifetime = max_lifetime
+        self.wait_timeout = wait_timeout
+
+        self.lock    = threading.Condition()
+        self.idle    = deque()   # (conn, created_at, last_used)
+        self.in_use  = {}        # id(conn) -> created_at
+        self.size    = 0
+        self.closed  = False
+
+        self.checkouts = 0
+        self.checkins  = 0
+        self.waits     = 0
+        self.creations = 0
+        self.expired   = 0
+        self.timeouts  = 0
+
+        for _ in range(self.min_size):
+            with self.lock:
+                self.size += 1
+            conn, created_at = self.create()
+            with self.lock:
+                self.idle.append((conn, created_at, created_at))
+
+    def create(self):
+        # The slot is reserved (size += 1) under the lock by the caller, and the
+        # connect happens outside it so slow handshakes do not block checkins.
+        try:
+            conn = self.factory()
+        except Exception:
+            with self.lock:
+                self.size -= 1
+                self.lock.notify()
+            raise
+
+        with self.lock:
+            self.creations += 1
+        logger.debug(f"[Pool] {self.name} opened connection {self.size}/{self.max_size}")
+        return conn, time.monotonic()
+
+    def expired_entry(self, created_at, last_used, now):
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return True
+        if self.max_idle and now - last_used > self.max_idle:
+            return True
+        return False
+
+    def discard(self, conn):
+        self.size -= 1
+        try:
+            conn.close()
+        except Exception as err:
+            logger.warning(f"[Pool] {self.name} error closing connection: {err}")
+
+    def checkout(self, timeout = None):
+        timeout  = self.wait_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited   = False
+
+        with self.lock:
+            while True:
+                if self.closed:
+                    logger.error(f"[Pool] {self.name} is closed")
+                    raise ConnectionError(f"Pool {self.name} is closed")
+
+                now = time.monotonic()
+                while self.idle:
+                    conn, created_at, last_used = self.idle.pop()
+                    if self.expired_entry(created_at, last_used, now):
+                        self.expired += 1
+                        self.discard(conn)
+                        continue
+
+                    return self.lease(conn, created_at)
+
+                if self.size < self.max_size:
+                    self.size += 1
+                    break
+
+                if not waited:
+                    waited = True
+                    self.waits += 1
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self.timeouts += 1
+                    logger.error(f"[Pool] {self.name} exhausted after waiting {timeout}s")
+                    raise ConnectionError(f"Pool {self.name} exhausted after waiting {timeout}s")
+
+                self.lock.wait(remaining)
+
+        conn, created_at = self.create()
+        with self.lock:
+            return self.lease(conn, created_at)
+
+    def lease(self, conn, created_at):
+        self.in_use[id(conn)] = created_at
+        self.checkouts += 1
+        return conn
+
+    def checkin(self, conn, discard = False):
+        # discard=True closes a connection that is not fit for reuse, e.g. one
+        # with rows left unread on the wire
+        # Never hand an open transaction to the next borrower
+        if not discard and getattr(conn, "in_transaction", False):
+            try:
+                conn.rollback()
+            except Exception as err:
+                logger.warning(f"[Pool] {self.name} error rolling back on checkin: {err}")
+
+        with self.lock:
+            created_at = self.in_use.pop(id(conn), None)
+            if created_at is None:
+                logger.error(f"[Pool] {self.name} connection was not checked out from this pool")
+                raise ValueError(f"Connection was not checked out from pool {self.name}")
+
+            self.checkins += 1
+            now = time.monotonic()
+            if self.closed or discard:
+                self.discard(conn)
+            elif self.max_lifetime and now - created_at > self.max_lifetime:
+                self.expired += 1
+                self.discard(conn)
+            else:
+                self.idle.append((conn, created_at, now))
+
+            self.lock.notify()
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            while self.idle:
+                conn, created_at, last_used = self.idle.pop()
+                self.discard(conn)
+
+            self.lock.notify_all()
+        logger.debug(f"[Pool] {self.name} closed")
+
+    def stats(self):
+        with self.lock:
+            return {
+                "size":      self.size,
+                "idle":      len(self.idle),
+                "in_use":    len(self.in_use),
+                "max_size":  self.max_size,
+                "checkouts": self.checkouts,
+                "checkins":  self.checkins,
+                "waits":     self.waits,
+                "creations": self.creations,
+                "expired":   self.expired,
+                "timeouts":  self.timeouts,
+            }
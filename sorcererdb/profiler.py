@@ -0,0 +1,182 @@
+# sorcererdb/profiler.py
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+
+# Upper bounds in seconds; the last bucket catches everything slower
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^'\\]|\\.)*'"), "?"),
+    (re.compile(r'"(?:[^"\\]|\\.)*"'), "?"),
+    (re.compile(r"%\(\w+\)s|%s|[@$:]\w+|\?"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*"), "(?+)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql):
+    # Literals, placeholders and IN/VALUES lists collapse so that one statement
+    # shape maps to one series regardless of its values
+    for pattern, replacement in FINGERPRINT_RULES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+def estimate_bytes(rows):
+    # The first row of each fetch stands in for the rest: walking every value
+    # cost about as much again as the fetch itself
+    if not rows:
+        return 0
+    row  = rows[0]
+    size = 0
+    for value in (row.values() if isinstance(row, dict) else row):
+        if isinstance(value, (str, bytes, bytearray)):
+            size += len(value)
+        else:
+            size += 8
+    return size * len(rows)
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count  = 0
+        self.sum    = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum   += seconds
+
+    def quantile(self, q):
+        if self.count == 0:
+            return 0.0
+
+        rank       = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if cumulative + count >= rank and count > 0:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i]
+                if upper == float("inf"):
+                    return lower
+                # Linear interpolation inside the bucket, as Prometheus does
+                return lower + (upper - lower) * ((rank - cumulative) / count)
+            cumulative += count
+
+        return BUCKETS[-2]
+
+
+class QueryStats:
+
+    def __init__(self):
+        self.latency    = Histogram()
+        self.rows       = 0
+        self.bytes      = 0
+        self.fetch_time = 0.0
+        self.errors     = 0
+
+    def summary(self):
+        latency = self.latency
+        return {
+            "count":      latency.count,
+            "errors":     self.errors,
+            "total_time": latency.sum,
+            "mean":       latency.sum / latency.count if latency.count else 0.0,
+            "p50":        latency.quantile(0.50),
+            "p95":        latency.quantile(0.95),
+            "p99":        latency.quantile(0.99),
+            "rows":       self.rows,
+            "bytes":      self.bytes,
+            "fetch_time": self.fetch_time,
+        }
+
+
+class Profiler:
+
+    def __init__(self, max_fingerprints = 1000, track_bytes = True):
+        self.max_fingerprints = max_fingerprints
+        self.track_bytes      = track_bytes
+
+        self.lock    = threading.Lock()
+        self.queries = {}   # (dsn, fingerprint) -> QueryStats
+
+    def series(self, dsn, sql):
+        key   = (dsn, fingerprint(sql))
+        stats = self.queries.get(key)
+        if stats is None:
+            if len(self.queries) >= self.max_fingerprints:
+                # Bound the number of series; new shapes share one bucket
+                key = (dsn, "other")
+                stats = self.queries.get(key)
+            if stats is None:
+                stats = self.queries[key] = QueryStats()
+        return stats
+
+    def record(self, dsn, sql, seconds, rows = 0, error = False):
+        with self.lock:
+            stats = self.series(dsn, sql)
+            stats.latency.observe(seconds)
+            if error:
+                stats.errors += 1
+            elif rows > 0:
+                stats.rows += rows
+
+    def record_fetch(self, dsn, sql, seconds, rows):
+        size = estimate_bytes(rows) if self.track_bytes and rows else 0
+        with self.lock:
+            stats = self.series(dsn, sql)
+            stats.fetch_time += seconds
+            stats.rows       += len(rows)
+            stats.bytes      += size
+
+    def reset(self):
+        with self.lock:
+            self.queries = {}
+
+    def stats(self, dsn = None):
+        with self.lock:
+            report = {}
+            for (name, query), stats in self.queries.items():
+                if dsn is not None and name != dsn:
+                    continue
+                report.setdefault(name, {})[query] = stats.summary()
+            return report
+
+    def prometheus(self):
+        with self.lock:
+            items = [(name, query, stats, stats.summary()) for (name, query), stats in self.queries.items()]
+
+        lines = [
+            "# HELP sorcererdb_query_duration_seconds Query execution latency.",
+            "# TYPE sorcererdb_query_duration_seconds histogram",
+        ]
+        for name, query, stats, summary in items:
+            labels = f'dsn="{escape_label(name)}",query="{escape_label(query)}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stats.latency.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'sorcererdb_query_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"sorcererdb_query_duration_seconds_sum{{{labels}}} {summary['total_time']}")
+            lines.append(f"sorcererdb_query_duration_seconds_count{{{labels}}} {summary['count']}")
+
+        for metric, field, help_text in [
+            ("sorcererdb_query_rows_total", "rows", "Rows returned or affected."),
+            ("sorcererdb_query_bytes_total", "bytes", "Estimated bytes fetched."),
+            ("sorcererdb_query_errors_total", "errors", "Failed executions."),
+        ]:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, query, stats, summary in items:
+                labels = f'dsn="{escape_label(name)}",query="{escape_label(query)}"'
+                lines.append(f"{metric}{{{labels}}} {summary[field]}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,68 @@
+# sorcererdb/router.py
+import re
+import time
+import threading
+from contextlib import contextmanager
+
+# Locking reads must see the primary's latest rows
+LOCKING_READ = re.compile(r"\bFOR\s+(?:UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b", re.IGNORECASE)
+
+
+def is_read(sql):
+    return sql.lstrip()[:6].lower() == "select" and not LOCKING_READ.search(sql)
+
+
+class ReplicaRouter:
+    # Reads go to the replica with the fewest queries in flight, ties broken by
+    # the fewest served so load spreads evenly when nothing overlaps. After a
+    # write, reads stay on the primary for sticky_window seconds so a session
+    # sees its own changes despite replication lag.
+
+    def __init__(self, primary, replicas, sticky_window = 1.0):
+        self.primary       = primary
+        self.replicas      = list(replicas)
+        self.sticky_window = sticky_window
+
+        self.lock        = threading.Lock()
+        self.outstanding = {name: 0 for name in [primary, *self.replicas]}
+        self.served      = {name: 0 for name in [primary, *self.replicas]}
+        self.last_write  = None
+
+        self.sticky_reads = 0
+
+    def route(self, name, sql):
+        # The replica a statement on DSN `name` should run on, or None
+        if name != self.primary or not self.replicas or not is_read(sql):
+            return None
+
+        with self.lock:
+            if self.last_write is not None and time.monotonic() - self.last_write < self.sticky_window:
+                self.sticky_reads += 1
+                return None
+
+            return min(self.replicas, key=lambda replica: (self.outstanding[replica], self.served[replica]))
+
+    def wrote(self):
+        with self.lock:
+            self.last_write = time.monotonic()
+
+    @contextmanager
+    def track(self, name):
+        with self.lock:
+            self.outstanding[name] = self.outstanding.get(name, 0) + 1
+            self.served[name]      = self.served.get(name, 0) + 1
+        try:
+            yield name
+        finally:
+            with self.lock:
+                self.outstanding[name] -= 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "primary":      self.primary,
+                "replicas":     list(self.replicas),
+                "outstanding":  dict(self.outstanding),
+                "served":       dict(self.served),
+                "sticky_reads": self.sticky_reads,
+            }
@@ -0,0 +1,57 @@
+# sorcererdb/rows.py
+from functools import lru_cache
+
+ROW_FACTORIES = ("dict", "tuple", "row")
+
+
+class Row(tuple):
+    # A tuple that also answers to column names. The names live on a class made
+    # once per result shape, so a row costs no more than the tuple itself.
+    __slots__ = ()
+
+    fields    = ()
+    positions = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self.positions[key])
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name):
+        try:
+            return tuple.__getitem__(self, self.positions[name])
+        except KeyError:
+            raise AttributeError(f"Row has no column {name!r}") from None
+
+    def get(self, key, default = None):
+        position = self.positions.get(key)
+        return default if position is None else tuple.__getitem__(self, position)
+
+    def keys(self):
+        return self.fields
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return zip(self.fields, self)
+
+    def as_dict(self):
+        return dict(zip(self.fields, self))
+
+    def __repr__(self):
+        return "Row(" + ", ".join(f"{field}={value!r}" for field, value in zip(self.fields, self)) + ")"
+
+
+@lru_cache(maxsize=256)
+def row_class(fields):
+    return type("Row", (Row,), {
+        "__slots__": (),
+        "fields":    fields,
+        "positions": {field: position for position, field in enumerate(fields)},
+    })
+
+def check_row_factory(row_factory):
+    if row_factory is not None and row_factory not in ROW_FACTORIES:
+        raise ValueError(f"Invalid row factory: {row_factory}")
+    return row_factory
@@ -0,0 +1,152 @@
+# sorcererdb/scatter.py
+import heapq
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from operator import itemgetter
+from threading import Event
+
+from loguru import logger
+
+DONE = object()
+
+
+def sort_key(order_by):
+    if callable(order_by):
+        return order_by
+    if isinstance(order_by, (list, tuple)):
+        return itemgetter(*order_by)
+    return itemgetter(order_by)
+
+def merge_rows(results, order_by = None, reverse = False):
+    # An ordered merge expects each shard's rows to already be sorted on the
+    # key, which the shared ORDER BY in the query takes care of
+    if order_by is None:
+        return [row for rows in results for row in rows]
+    return list(heapq.merge(*results, key=sort_key(order_by), reverse=reverse))
+
+
+def gather(run, names, max_workers = None, timeout = None):
+    # Runs run(name) for every DSN on its own worker. A shard times out once it
+    # has been running for `timeout` seconds; Python can not interrupt the
+    # driver call, so the worker finishes in the background and its result is
+    # dropped. Queued shards are given up on if every worker is stuck that way.
+    if not names:
+        # ThreadPoolExecutor refuses max_workers=0
+        return {}, {}, []
+
+    # concurrent.futures loads its thread pool module on first use
+    from concurrent.futures import ThreadPoolExecutor
+    workers  = min(len(names), max_workers or len(names))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sorcererdb-scatter")
+    started  = {}
+
+    def task(name):
+        started[name] = time.monotonic()
+        return run(name)
+
+    futures  = {executor.submit(task, name): name for name in names}
+    pending  = set(futures)
+    results  = {}
+    errors   = {}
+    timeouts = []
+    stuck    = 0
+
+    try:
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                running  = [started[futures[f]] + timeout for f in pending if futures[f] in started]
+                wait_for = max(0, min(running) - time.monotonic()) if running else timeout
+
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except (ValueError, ConnectionError) as err:
+                    errors[name] = str(err)
+
+            if timeout is None:
+                continue
+
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                if name in started and now - started[name] >= timeout:
+                    pending.discard(future)
+                    timeouts.append(name)
+                    stuck += 1
+
+            if stuck >= workers:
+                for future in list(pending):
+                    if future.cancel():
+                        pending.discard(future)
+                        timeouts.append(futures[future])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if timeouts:
+        logger.warning(f"[Scatter] Timed out after {timeout}s on {', '.join(timeouts)}")
+    return results, errors, timeouts
+
+
+def stream_merge(open_stream, names, order_by = None, reverse = False, queue_size = 4):
+    # Every shard streams on its own worker into a bounded queue, so all shards
+    # run their query at once and a slow consumer holds back the producers.
+    # Rows come out as they arrive, or in key order when order_by is given.
+    if not names:
+        return
+
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+    stop     = Event()
+    shared   = queue.Queue(queue_size * len(names))
+    queues   = {name: (shared if order_by is None else queue.Queue(queue_size)) for name in names}
+    executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="sorcererdb-scatter")
+
+    def put(target, item):
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pump(name):
+        target = queues[name]
+        stream = open_stream(name)
+        try:
+            for chunk in stream:
+                if not put(target, chunk):
+                    return
+            put(target, DONE)
+        except Exception as err:
+            put(target, err)
+        finally:
+            stream.close()
+
+    def drain(source, producers):
+        while producers:
+            item = source.get()
+            if item is DONE:
+                producers -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield from item
+
+    for name in names:
+        executor.submit(pump, name)
+
+    try:
+        if order_by is None:
+            yield from drain(shared, len(names))
+        else:
+            shards = [drain(queues[name], 1) for name in names]
+            yield from heapq.merge(*shards, key=sort_key(order_by), reverse=reverse)
+    finally:
+        # Also runs when the caller stops early; producers see it and let go
+        # of their connections
+        stop.set()
+        executor.shutdown(wait=False)
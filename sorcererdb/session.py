@@ -0,0 +1,57 @@
+# sorcererdb/session.py
+import threading
+import weakref
+
+
+class Session:
+    # The fluent query state of one caller: query().set_bindings().result_set()
+    # reads and writes these between calls, so callers must not share one.
+
+    def __init__(self):
+        self.sql_query             = ""
+        self.bindings              = {}
+        self.row_count             = 0
+        self.stored_query          = None
+        self.active_connection     = None
+        self.pending_invalidations = set()
+        self.connections           = {}
+        self.write_batch           = None
+        self.pinned                = None   # PinnedConnections, with thread_safe=True
+
+
+class ThreadSession(threading.local):
+    # threading.local runs __init__ again the first time each thread touches it
+    __init__ = Session.__init__
+
+
+class PinnedConnections:
+    # One thread's connections pinned from the shared pools. It lives on the
+    # thread's ThreadSession, so it is dropped when the thread exits and the
+    # finalizer hands back whatever is still pinned; release() need not be
+    # called. The finalizer holds the dict, never this holder.
+
+    def __init__(self, pools):
+        self.connections = {}
+        self.finalizer   = weakref.finalize(self, checkin_all, pools, self.connections)
+        # At interpreter exit the pools may already be gone
+        self.finalizer.atexit = False
+
+
+def checkin_all(pools, connections):
+    for name, conn in list(connections.items()):
+        del connections[name]
+        pool = pools.get(name)
+        if pool is not None:
+            pool.checkin(conn)
+        else:
+            conn.close()
+
+
+def session_attribute(name):
+    def get(db):
+        return getattr(db.session, name)
+
+    def set(db, value):
+        setattr(db.session, name, value)
+
+    return property(get, set)
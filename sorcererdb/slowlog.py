@@ -0,0 +1,112 @@
+# sorcererdb/slowlog.py
+import random
+import threading
+from concurrent.futures import wait
+
+from loguru import logger
+
+from .profiler import fingerprint
+from .spell import Spell
+
+
+class SlowQueryLog:
+    # Thresholds come from each DSN's DBConfig. Slow queries are logged at
+    # WARNING, a sample of the fast ones at INFO. When explain is enabled the
+    # plan of a slow SELECT is captured on a background thread and the record
+    # is logged once it is attached, so the caller never waits on EXPLAIN.
+
+    def __init__(self, configs, pools, max_pending = 16):
+        self.configs     = configs
+        self.pools       = pools
+        self.max_pending = max_pending
+
+        self.lock     = threading.Lock()
+        self.executor = None
+        self.pending  = set()
+
+    def observe(self, dsn, sql, bindings, seconds, rows = 0):
+        config = self.configs.get(dsn)
+        if config is None:
+            return
+
+        threshold = config.slow_query_threshold
+        if threshold is not None and seconds >= threshold:
+            record = self.make_record(dsn, sql, bindings, seconds, rows)
+            if config.slow_query_explain and self.explainable(sql):
+                if self.submit_explain(record):
+                    return
+            self.emit(record, slow=True)
+        elif config.slow_query_sample_rate and random.random() < config.slow_query_sample_rate:
+            self.emit(self.make_record(dsn, sql, bindings, seconds, rows), slow=False)
+
+    def make_record(self, dsn, sql, bindings, seconds, rows):
+        return {
+            "dsn":         dsn,
+            "sql":         sql,
+            "fingerprint": fingerprint(sql),
+            "bindings":    bindings,
+            "seconds":     seconds,
+            "rows":        rows,
+            "plan":        None,
+        }
+
+    def explainable(self, sql):
+        return sql.lstrip()[:6].lower() == "select"
+
+    def submit_explain(self, record):
+        with self.lock:
+            if len(self.pending) >= self.max_pending:
+                # Do not let a burst of slow queries queue up EXPLAINs
+                return False
+            if self.executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sorcererdb-explain")
+            future = self.executor.submit(self.explain_and_emit, record)
+            self.pending.add(future)
+
+        future.add_done_callback(self.done)
+        return True
+
+    def done(self, future):
+        with self.lock:
+            self.pending.discard(future)
+
+    def explain(self, dsn, sql, bindings = None):
+        engine = self.configs[dsn].engine
+        prefix = "EXPLAIN QUERY PLAN " if engine == "sqlite" else "EXPLAIN "
+        pool   = self.pools[dsn]
+
+        conn = pool.checkout()
+        try:
+            # A plain Spell: EXPLAIN itself is not profiled or slow-logged
+            with Spell(conn, engine) as spell:
+                spell.execute(prefix + sql, bindings or {})
+                return spell.fetchall()
+        finally:
+            pool.checkin(conn)
+
+    def explain_and_emit(self, record):
+        try:
+            record["plan"] = self.explain(record["dsn"], record["sql"], record["bindings"])
+        except Exception as err:
+            logger.warning(f"[SlowQuery] EXPLAIN failed for {record['fingerprint']} | {err}")
+        self.emit(record, slow=True)
+
+    def emit(self, record, slow):
+        log = logger.bind(slow_query=record)
+        message = f"[SlowQuery] {record['dsn']} {record['seconds'] * 1000:.1f}ms | {record['fingerprint']}"
+        if slow:
+            log.warning(message)
+        else:
+            log.info(message)
+
+    def wait(self, timeout = None):
+        with self.lock:
+            pending = list(self.pending)
+        wait(pending, timeout=timeout)
+
+    def close(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
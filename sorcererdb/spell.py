@@ -1,46 +1,245 @@
 # sorcererdb/spell.py
 # from re import S
+import time
+import threading
 from loguru import logger
 
-import mysql.connector
-from mysql.connector import Error
+from .drivers import load_driver, db_errors
+from .pipeline import NAMED_PARAM
+from .rows import row_class
+
+# ER_UNKNOWN_STMT_HANDLER: the server no longer knows the statement id
+UNKNOWN_STATEMENT = 1243
+
+
+# Cursors currently held by a Spell, for spotting leaks in debug builds
+live_lock    = threading.Lock()
+live_count   = 0
+
+def track_cursor(delta):
+    global live_count
+    with live_lock:
+        live_count += delta
+
+def live_cursors():
+    return live_count
+
+
+def __getattr__(name):
+    # DB_ERRORS depends on which drivers have been loaded so far
+    if name == "DB_ERRORS":
+        return db_errors()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# A MySQL server-side prepared statement that outlives a single Spell. Prepared
+# cursors are unbuffered, so rows are read on execute() like a buffered cursor.
+class PreparedCursor:
+    def __init__(self, conn, query, dictionary = None):
+        self.conn       = conn
+        self.dictionary = query.strip().lower().startswith("select") if dictionary is None else dictionary
+        # The connector re-prepares whenever the operation string changes, and
+        # it rewrites %(name)s on every dict execute; convert once and reuse it
+        self.names      = NAMED_PARAM.findall(query)
+        self.operation  = NAMED_PARAM.sub("%s", query)
+        self.cursor     = self.prepare()
+        self.rows       = []
+        self.position   = 0
+
+    def prepare(self):
+        return self.conn.cursor(prepared=True, dictionary=self.dictionary)
+
+    @property
+    def rowcount(self):
+        if self.cursor.description is not None:
+            return len(self.rows)
+        return self.cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def params(self, bindings):
+        if not isinstance(bindings, dict):
+            return tuple(bindings or ())
+        missing = [name for name in self.names if name not in bindings]
+        if missing:
+            logger.error(f"[Spell] Missing bindings: {missing}")
+            raise ValueError(f"Missing bindings: {missing}")
+        return tuple(bindings[name] for name in self.names)
+
+    def execute(self, query, bindings = None):
+        params = self.params(bindings)
+        try:
+            self.cursor.execute(self.operation, params)
+        except load_driver("mysql").Error as err:
+            if err.errno != UNKNOWN_STATEMENT:
+                raise
+            # The connection was re-established underneath us; prepare again
+            logger.debug(f"[Spell] Re-preparing statement: {query}")
+            self.cursor = self.prepare()
+            self.cursor.execute(self.operation, params)
+
+        self.rows     = self.cursor.fetchall() if self.cursor.description is not None else []
+        self.position = 0
+        return self
+
+    def fetchone(self):
+        if self.position >= len(self.rows):
+            return None
+        row = self.rows[self.position]
+        self.position += 1
+        return row
+
+    def fetchmany(self, size = 1):
+        rows = self.rows[self.position:self.position + size]
+        self.position += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def close(self):
+        # Deallocates the statement on the server
+        self.rows = []
+        self.cursor.close()
+
 
 class Spell:
 
-    def __init__(self, conn):
+    def __init__(self, conn, engine = "mysql", profiler = None, dsn = None, slow_log = None, cursors = None,
+                 row_factory = None):
         self.conn     = conn
+        self.engine   = engine
         self.cursor   = None
         self.query    = None
         self.bindings = None
 
-    def open_cursor(self, query):
-        if query.strip().lower().startswith("select"):
-            return self.conn.cursor(dictionary=True, buffered=True)
+        self.profiler = profiler
+        self.dsn      = dsn
+        self.slow_log = slow_log
+        self.cursors  = cursors
+
+        # "dict" (the default), "tuple" or "row"; see rows.py
+        self.row_factory = row_factory
+        self.row_type    = None
+
+        self.owns_cursor = True
+        self.cursor_kind = None
+
+        load_driver(engine)
+
+    def open_cursor(self, query, buffered = True, dictionary = None):
+        if dictionary is None:
+            dictionary = query.strip().lower().startswith(("select", "explain"))
+        # Only buffered MySQL cursors are parked for reuse; sqlite3 connections
+        # can not be weakly referenced and reuse statements on their own
+        self.cursor_kind = dictionary if buffered and self.cursors is not None and self.engine == "mysql" else None
+        cursor = self.cursors.take(self.conn, self.cursor_kind) if self.cursor_kind is not None else None
+
+        if cursor is not None:
+            pass
+        elif self.engine == "sqlite":
+            from .sqlite import SQLiteCursor
+            cursor = SQLiteCursor(self.conn, dictionary=dictionary, buffered=buffered)
+        elif dictionary:
+            cursor = self.conn.cursor(dictionary=True, buffered=buffered)
         else:
-            return self.conn.cursor(buffered=True)
+            cursor = self.conn.cursor(buffered=buffered)
+
+        track_cursor(1)
+        return cursor
 
     def proc(self, name, params = None):
         
+        self.close()
         try:
+            self.owns_cursor = True
             self.cursor = self.open_cursor("select")
+            # Stored results stay on the cursor, so it is never handed to another Spell
+            self.cursor_kind = None
             return self.cursor.callproc(name, params)
-        except mysql.connector.Error as err:
+        except db_errors() as err:
             logger.error(f"[Spell] Error executing procedure: {name} | {err}")
             raise ValueError(f"Something went wrong: {err}")
 
-    def execute(self, query, bindings = None):
+    def execute(self, query, bindings = None, buffered = True, cursor = None, dictionary = None):
         
         self.query = query
         self.bindings = bindings
-        logger.debug(f"[Spell] Executing query: {self.query} | bindings: {self.bindings}")
+        # Lazy so the bindings are only formatted when DEBUG is enabled
+        logger.opt(lazy=True).debug("[Spell] Executing query: {} | bindings: {}", lambda: query, lambda: bindings)
         
+        # A Spell holds one cursor at a time
+        self.close()
+        if dictionary is None and self.row_factory in ("tuple", "row"):
+            dictionary = False
+
+        started = time.perf_counter()
         try:
-            self.cursor = self.open_cursor(query)
+            # A cursor handed in (e.g. a prepared statement) stays open for reuse
+            self.owns_cursor = cursor is None
+            self.cursor = cursor if cursor is not None else self.open_cursor(query, buffered, dictionary)
             self.cursor.execute(query, bindings)
-        except mysql.connector.Error as err:
+        except db_errors() as err:
+            if self.profiler is not None:
+                self.profiler.record(self.dsn, query, time.perf_counter() - started, error=True)
+            self.cursor_kind = None
+            self.close()
             logger.error(f"[Spell] Error executing query: {self.query} | {err}")
             raise ValueError(f"Something went wrong: {err}")
 
+        if self.row_factory == "row" and self.cursor.description is not None:
+            self.row_type = row_class(tuple(column[0] for column in self.cursor.description))
+        else:
+            self.row_type = None
+
+        if self.profiler is not None or self.slow_log is not None:
+            elapsed  = time.perf_counter() - started
+            rows     = self.cursor.rowcount
+            # Returned rows are counted by the profiler as they are fetched
+            affected = rows if self.cursor.description is None else 0
+            if self.profiler is not None:
+                self.profiler.record(self.dsn, query, elapsed, affected)
+            if self.slow_log is not None:
+                self.slow_log.observe(self.dsn, query, bindings, elapsed, rows)
+
+        return self.cursor
+
+    def executemany(self, query, rows):
+        # One statement, many parameter sets; nothing to fetch afterwards
+        self.query = query
+        self.bindings = None
+        logger.debug(f"[Spell] Executing many: {query}")
+
+        self.close()
+        started = time.perf_counter()
+        try:
+            self.owns_cursor = True
+            self.cursor = self.open_cursor(query, dictionary=False)
+            self.cursor.executemany(query, rows)
+        except db_errors() as err:
+            if self.profiler is not None:
+                self.profiler.record(self.dsn, query, time.perf_counter() - started, error=True)
+            self.cursor_kind = None
+            self.close()
+            logger.error(f"[Spell] Error executing query: {self.query} | {err}")
+            raise ValueError(f"Something went wrong: {err}")
+
+        self.row_type = None
+        if self.profiler is not None or self.slow_log is not None:
+            elapsed = time.perf_counter() - started
+            if self.profiler is not None:
+                self.profiler.record(self.dsn, query, elapsed, self.cursor.rowcount)
+            if self.slow_log is not None:
+                self.slow_log.observe(self.dsn, query, None, elapsed, self.cursor.rowcount)
+
         return self.cursor
 
     def fetch(self, fetch_type = "all", size = 25):
@@ -53,33 +252,89 @@ class Spell:
                 return self.fetchone()
             case "many":
                 return self.fetchmany(size)
-            case "insert_id":
+            case "insert_id" | "last_insert_id":
                 return self.insert_id()
             case _:
                 logger.error(f"[Spell] Invalid fetch type: {fetch_type}")
                 raise ValueError(f"Invalid fetch type: {fetch_type}")
 
+    def stream(self, size = 1000):
+        try:
+            while True:
+                rows = self.fetchmany(size)
+                if not rows:
+                    break
+                yield rows
+        except db_errors() as err:
+            logger.error(f"[Spell] Error streaming query: {self.query} | {err}")
+            raise ValueError(f"Something went wrong: {err}")
+
     def rowcount(self):
         logger.debug(f"[Spell] Rowcount: {self.cursor.rowcount}")
         return self.cursor.rowcount
 
     def fetchall(self):
-        return self.cursor.fetchall()
+        started = time.perf_counter()
+        rows = self.cursor.fetchall()
+        if self.row_type is not None:
+            rows = list(map(self.row_type, rows))
+        self.record_fetch(started, rows)
+        return rows
 
     def fetchone(self):
-        return self.cursor.fetchone()
+        started = time.perf_counter()
+        row = self.cursor.fetchone()
+        if self.row_type is not None and row is not None:
+            row = self.row_type(row)
+        self.record_fetch(started, [row] if row is not None else [])
+        return row
 
     def fetchmany(self, size = 25):
-        return self.cursor.fetchmany(size)
+        started = time.perf_counter()
+        rows = self.cursor.fetchmany(size)
+        if self.row_type is not None:
+            rows = list(map(self.row_type, rows))
+        self.record_fetch(started, rows)
+        return rows
+
+    def record_fetch(self, started, rows):
+        if self.profiler is not None:
+            self.profiler.record_fetch(self.dsn, self.query, time.perf_counter() - started, rows)
     
     def insert_id(self):
         return self.cursor.lastrowid
     
     def close(self):
-        self.cursor.close()
-        self.cursor = None
+        if self.cursor is None:
+            return
+        if not self.owns_cursor:
+            self.cursor = None
+            return
+        # An unbuffered MySQL cursor abandoned early leaves rows on the wire
+        if getattr(self.conn, "unread_result", False):
+            self.conn.consume_results()
+        if self.cursor_kind is not None and hasattr(self.cursor, "reset"):
+            # Drop the buffered rows now rather than on the next execute()
+            self.cursor.reset()
+            if not self.cursors.give(self.conn, self.cursor_kind, self.cursor):
+                self.cursor.close()
+        else:
+            self.cursor.close()
+        self.cursor      = None
+        self.cursor_kind = None
+        track_cursor(-1)
         logger.debug(f"[Spell] Cursor closed")
 
+    def abandon(self):
+        # Lets go of a cursor with rows still unread without reading them; the
+        # caller must close the connection instead of reusing it
+        if self.cursor is None:
+            return
+        self.cursor      = None
+        self.cursor_kind = None
+        track_cursor(-1)
+        logger.debug(f"[Spell] Cursor abandoned")
+
     def __enter__(self):
         return self
 
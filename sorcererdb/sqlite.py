@@ -0,0 +1,127 @@
+# sorcererdb/sqlite.py
+import sqlite3
+
+from loguru import logger
+
+from .config import DBConfig, shared_cache
+
+# Compile-time defaults for bound parameters and statement length
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+SQLITE_MAX_LENGTH    = 1000000000
+
+
+def dict_factory(cursor, row):
+    return {column[0]: row[i] for i, column in enumerate(cursor.description)}
+
+
+def database_uri(config: DBConfig):
+    # Every plain ":memory:" connection is a database of its own. Pooled
+    # connections of one DSN share a named in-memory database instead, which
+    # lives as long as any of them is open.
+    if shared_cache(config):
+        return f"file:sorcererdb-{id(config)}?mode=memory&cache=shared", True
+    return config.database, False
+
+
+def connect_sqlite(config: DBConfig):
+    # SQLite keeps its own per-connection statement cache keyed on the SQL text,
+    # so repeated queries through Spell skip the prepare step.
+    database, uri = database_uri(config)
+    conn = sqlite3.connect(
+        database,
+        uri               = uri,
+        timeout           = config.timeout,
+        isolation_level   = None if config.autocommit else "DEFERRED",
+        check_same_thread = False,
+        cached_statements = config.statement_cache_size
+    )
+
+    pragmas = {
+        "journal_mode": config.journal_mode,
+        "synchronous":  config.synchronous,
+        "mmap_size":    config.mmap_size,
+        "cache_size":   config.cache_size,
+    }
+    for pragma, value in pragmas.items():
+        if value is None:
+            continue
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+    logger.debug(f"[SQLite] Opened {config.database} | pragmas: {pragmas}")
+    return conn
+
+
+# Mirrors mysql.connector's cursors: buffered cursors read every row on
+# execute(), unbuffered ones hand rows out as SQLite steps through them
+class SQLiteCursor:
+    def __init__(self, conn, dictionary=False, buffered=True):
+        self.cursor = conn.cursor()
+        if dictionary:
+            self.cursor.row_factory = dict_factory
+
+        self.buffered = buffered
+        self.rows     = []
+        self.position = 0
+
+    @property
+    def rowcount(self):
+        if self.buffered and self.cursor.description is not None:
+            return len(self.rows)
+        return self.cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def execute(self, query, bindings=None):
+        self.cursor.execute(query, bindings or {})
+        if self.buffered and self.cursor.description is not None:
+            self.rows = self.cursor.fetchall()
+        else:
+            self.rows = []
+        self.position = 0
+        return self
+
+    def executemany(self, query, rows):
+        self.cursor.executemany(query, rows)
+        self.rows     = []
+        self.position = 0
+        return self
+
+    def callproc(self, name, params=None):
+        raise sqlite3.NotSupportedError("SQLite does not support stored procedures")
+
+    def fetchone(self):
+        if not self.buffered:
+            return self.cursor.fetchone()
+        if self.position >= len(self.rows):
+            return None
+        row = self.rows[self.position]
+        self.position += 1
+        return row
+
+    def fetchmany(self, size=1):
+        if not self.buffered:
+            return self.cursor.fetchmany(size)
+        rows = self.rows[self.position:self.position + size]
+        self.position += len(rows)
+        return rows
+
+    def fetchall(self):
+        if not self.buffered:
+            return self.cursor.fetchall()
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def close(self):
+        try:
+            self.cursor.close()
+        except sqlite3.ProgrammingError:
+            # Connection already closed, which closes its cursors too
+            pass
+        self.rows = []
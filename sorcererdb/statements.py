@@ -0,0 +1,168 @@
+# sorcererdb/statements.py
+import threading
+import weakref
+from collections import OrderedDict
+
+from loguru import logger
+
+
+class StatementCache:
+
+    def __init__(self, max_size = 256):
+        self.max_size   = max_size
+        self.lock       = threading.Lock()
+        self.statements = OrderedDict()
+
+        self.hits   = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            statement = self.statements.get(key)
+            if statement is None:
+                self.misses += 1
+                return None
+
+            self.statements.move_to_end(key)
+            self.hits += 1
+            return statement
+
+    def set(self, key, statement):
+        with self.lock:
+            self.statements[key] = statement
+            self.statements.move_to_end(key)
+            while len(self.statements) > self.max_size:
+                self.statements.popitem(last=False)
+
+        return statement
+
+    def clear(self):
+        with self.lock:
+            self.statements.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "size":   len(self.statements),
+                "hits":   self.hits,
+                "misses": self.misses,
+            }
+
+
+class PreparedStatements:
+    # Prepared handles are only valid on the connection that prepared them, so
+    # each connection gets its own LRU. Entries vanish with their connection,
+    # and a replacement connection simply prepares again on first use.
+
+    def __init__(self, max_size = 64):
+        self.max_size    = max_size
+        self.lock        = threading.Lock()
+        self.connections = weakref.WeakKeyDictionary()
+
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+    def get(self, conn, key, prepare):
+        with self.lock:
+            statements = self.connections.setdefault(conn, OrderedDict())
+            handle = statements.get(key)
+            if handle is not None:
+                statements.move_to_end(key)
+                self.hits += 1
+                return handle
+
+            self.misses += 1
+
+        handle = prepare()
+        evicted = []
+        with self.lock:
+            statements[key] = handle
+            while len(statements) > self.max_size:
+                evicted.append(statements.popitem(last=False)[1])
+                self.evictions += 1
+
+        for stale in evicted:
+            self.close_handle(stale)
+
+        return handle
+
+    def close_handle(self, handle):
+        try:
+            handle.close()
+        except Exception as err:
+            logger.warning(f"[Statements] Error closing prepared statement: {err}")
+
+    def clear(self, conn = None):
+        with self.lock:
+            if conn is None:
+                handles = [h for statements in self.connections.values() for h in statements.values()]
+                self.connections.clear()
+            else:
+                handles = list(self.connections.pop(conn, {}).values())
+
+        for handle in handles:
+            self.close_handle(handle)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "connections": len(self.connections),
+                "statements":  sum(len(statements) for statements in self.connections.values()),
+                "hits":        self.hits,
+                "misses":      self.misses,
+                "evictions":   self.evictions,
+            }
+
+
+class CursorCache:
+    # A buffered MySQL cursor has read all of its rows by the time execute()
+    # returns and only holds its connection weakly, so once a Spell is done with
+    # it the cursor can run the next query on that connection. Each connection
+    # keeps at most one idle cursor per row format.
+
+    def __init__(self):
+        self.lock        = threading.Lock()
+        self.connections = weakref.WeakKeyDictionary()
+
+        self.reuses = 0
+        self.parked = 0
+
+    def take(self, conn, kind):
+        with self.lock:
+            idle   = self.connections.get(conn)
+            cursor = idle.pop(kind, None) if idle else None
+            if cursor is not None:
+                self.reuses += 1
+            return cursor
+
+    def give(self, conn, kind, cursor):
+        with self.lock:
+            idle = self.connections.setdefault(conn, {})
+            if kind in idle:
+                return False
+            idle[kind] = cursor
+            self.parked += 1
+            return True
+
+    def clear(self, conn = None):
+        with self.lock:
+            if conn is None:
+                cursors = [c for idle in self.connections.values() for c in idle.values()]
+                self.connections.clear()
+            else:
+                cursors = list(self.connections.pop(conn, {}).values())
+
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception as err:
+                logger.warning(f"[Statements] Error closing idle cursor: {err}")
+
+    def stats(self):
+        with self.lock:
+            return {
+                "idle":   sum(len(idle) for idle in self.connections.values()),
+                "reuses": self.reuses,
+                "parked": self.parked,
+            }
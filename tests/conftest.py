@@ -96,4 +96,50 @@ def create_test_db():
 
     db.disconnect(config.name)
 
-    return None
\ No newline at end of file
+    return None
+
+@pytest.fixture(scope="function")
+def sqlite_config(tmp_path):
+    """SQLite database configuration"""
+    if DBConfig is None:
+        pytest.skip("DBConfig not available — sorcererdb not installed.")
+
+    return DBConfig(
+        engine='sqlite',
+        name='TestSQLite',
+        database=str(tmp_path / "sorcererdb_test.db"),
+        autocommit=True
+    )
+
+@pytest.fixture(scope="function")
+def sqlite_db(sqlite_config):
+    """SQLite database fixture with test tables"""
+    db = SorcererDB(sqlite_config)
+    db.connect(sqlite_config.name)
+
+    tables = [
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name VARCHAR(100) NOT NULL DEFAULT '',
+            email VARCHAR(100) NOT NULL DEFAULT '',
+            age INT NOT NULL DEFAULT 0,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INT NOT NULL DEFAULT 0,
+            title VARCHAR(200) NOT NULL DEFAULT '',
+            content TEXT NOT NULL DEFAULT ''
+        )
+        """
+    ]
+    for table_sql in tables:
+        db.simple(table_sql, "count")
+
+    yield db
+
+    if db.check_connection(sqlite_config.name):
+        db.disconnect(sqlite_config.name)
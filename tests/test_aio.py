@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+from sorcererdb import AsyncSorcererDB, DBConfig, ResultCache
+
+async def open_db(config, **kwargs):
+    db = AsyncSorcererDB(config, **kwargs)
+    await db.connect(config.name)
+    await db.simple("CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100), age INT)", "count")
+    return db
+
+def test_async_crud(sqlite_config):
+    """Test the awaitable CRUD surface"""
+    async def scenario():
+        db = await open_db(sqlite_config)
+
+        insert_id = await db.insert("users", {"name": "Eric", "age": 30})
+        assert insert_id == 1
+
+        records = await db.query("SELECT * FROM users WHERE id = @id").set_bindings({"id": insert_id}).result_set("all")
+        assert records[0]["name"] == "Eric"
+        assert db.result_count() == 1
+
+        assert await db.update("users", {"name": "Marvin"}, {"id": insert_id}) == 1
+        assert (await db.simple("SELECT name FROM users", "one"))["name"] == "Marvin"
+        assert await db.delete("users", {"id": insert_id}) == 1
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_query_state_is_per_task(sqlite_config):
+    """Test concurrent tasks do not see each other's query and bindings"""
+    async def lookup(db, name):
+        db.query("SELECT name FROM users WHERE name = @name")
+        await asyncio.sleep(0)
+        db.set_bindings({"name": name})
+        await asyncio.sleep(0)
+        return await db.result_set("one")
+
+    async def scenario():
+        db = await open_db(sqlite_config)
+        for i in range(10):
+            await db.insert("users", {"name": f"user{i}"})
+
+        results = await asyncio.gather(*(lookup(db, f"user{i}") for i in range(10)))
+        assert [row["name"] for row in results] == [f"user{i}" for i in range(10)]
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_queries_do_not_block_the_loop(sqlite_config):
+    """Test other coroutines keep running while queries are in flight"""
+    async def scenario():
+        db = await open_db(sqlite_config)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                ticks += 1
+                await asyncio.sleep(0)
+
+        query = db.simple(
+            "SELECT COUNT(*) AS c FROM (WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 200000) SELECT x FROM n)",
+            "one"
+        )
+        result, _ = await asyncio.gather(query, ticker())
+        assert result["c"] == 200000
+        assert ticks == 5
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_transactions(sqlite_config):
+    """Test a transaction is pinned to the task that began it"""
+    async def scenario():
+        db = await open_db(sqlite_config)
+
+        await db.begin()
+        await db.insert("users", {"name": "Rolled"})
+        assert len(await db.simple("SELECT * FROM users")) == 1
+        await db.rollback()
+
+        await db.begin()
+        await db.insert("users", {"name": "Committed"})
+        await db.commit()
+
+        assert await db.simple("SELECT name FROM users") == [{"name": "Committed"}]
+        assert db.pool_stats()["in_use"] == 0
+
+        with pytest.raises(ValueError):
+            await db.commit()
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_cache(sqlite_config):
+    """Test async reads share the result cache and writes invalidate it"""
+    async def scenario():
+        db = await open_db(sqlite_config, cache_backend=ResultCache())
+
+        await db.insert("users", {"name": "Eric"})
+        await db.simple("SELECT * FROM users")
+        await db.simple("SELECT * FROM users")
+        assert db.cache.stats()["hits"] == 1
+
+        await db.insert("users", {"name": "Barty"})
+        assert len(await db.simple("SELECT * FROM users")) == 2
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_commit_invalidates_cache(sqlite_config):
+    """Test reads cached by other tasks during a transaction are dropped at commit"""
+    async def scenario():
+        db = await open_db(sqlite_config, cache_backend=ResultCache())
+
+        async def writer(started, read):
+            await db.begin()
+            await db.insert("users", {"name": "Pending"})
+            started.set()
+            await read.wait()
+            await db.commit()
+
+        async def reader():
+            return await db.simple("SELECT COUNT(*) AS total FROM users", "one")
+
+        started, read = asyncio.Event(), asyncio.Event()
+        task = asyncio.create_task(writer(started, read))
+        await started.wait()
+        assert (await reader())["total"] == 0
+        read.set()
+        await task
+
+        assert (await reader())["total"] == 1
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_cached_row_count(sqlite_config):
+    """Test cache hits report the same row count as the query they stand for"""
+    async def scenario():
+        db = await open_db(sqlite_config, cache_backend=ResultCache())
+        for name in ["Eric", "Barty", "Marvin"]:
+            await db.insert("users", {"name": name})
+
+        for _ in range(2):
+            assert await db.simple("SELECT * FROM users", "count") == 3
+            assert db.result_count() == 3
+        assert db.cache.stats()["hits"] == 1
+
+        await db.close()
+
+    asyncio.run(scenario())
+
+def test_async_transaction_returns_to_its_pool(sqlite_config, tmp_path):
+    """Test a transaction ends on the DSN it began on after switching DSNs"""
+    async def scenario():
+        db = await open_db(sqlite_config)
+        db.set_dsn(DBConfig(name="Other", engine="sqlite", database=str(tmp_path / "other.db")))
+
+        await db.begin()
+        await db.connect("Other")
+        await db.insert("users", {"name": "Pinned"})
+        await db.commit()
+
+        assert db.pool_stats(sqlite_config.name)["in_use"] == 0
+        await db.connect(sqlite_config.name)
+        assert await db.simple("SELECT name FROM users", cache=False) == [{"name": "Pinned"}]
+
+        await db.close()
+
+    asyncio.run(scenario())
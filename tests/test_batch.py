@@ -0,0 +1,98 @@
+import pytest
+
+
+def count_users(db):
+    return db.simple("SELECT COUNT(*) AS total FROM users", "one", cache=False)["total"]
+
+def test_batch_groups_writes_into_transactions(sqlite_db):
+    """Test writes commit in groups of max_statements and on exit"""
+    with sqlite_db.batch(max_statements=3, max_delay_ms=60000) as batch:
+        for i in range(1, 8):
+            sqlite_db.insert("users", {"name": f"user{i}", "email": f"user{i}@example.com"})
+        assert sqlite_db.in_transaction()
+
+    assert not sqlite_db.in_transaction()
+    assert batch.counts["statements"] == 7
+    assert batch.counts["transactions"] == 3
+    assert count_users(sqlite_db) == 7
+
+def test_batch_commits_after_max_delay(sqlite_db):
+    """Test a transaction older than max_delay_ms is committed by the next write"""
+    with sqlite_db.batch(max_statements=1000, max_delay_ms=0) as batch:
+        sqlite_db.insert("users", {"name": "first"})
+        sqlite_db.insert("users", {"name": "second"})
+
+    assert batch.counts["transactions"] == 2
+
+def test_batch_rolls_back_on_error(sqlite_db):
+    """Test an exception rolls back the open transaction only"""
+    with pytest.raises(RuntimeError):
+        with sqlite_db.batch(max_statements=2, max_delay_ms=60000):
+            for i in range(3):
+                sqlite_db.insert("users", {"name": f"user{i}"})
+            raise RuntimeError("handler failed")
+
+    assert not sqlite_db.in_transaction()
+    assert count_users(sqlite_db) == 2
+
+def test_batch_coalesces_inserts(sqlite_db):
+    """Test coalesced inserts become multi-row statements and stay ordered"""
+    with sqlite_db.batch(coalesce=True, max_delay_ms=60000) as batch:
+        for i in range(1, 6):
+            assert sqlite_db.insert("users", {"id": i, "name": f"user{i}"}) is None
+        sqlite_db.insert("posts", {"user_id": 1, "title": "hello", "content": ""})
+        sqlite_db.insert("users", {"id": 6, "name": "user6"})
+        # Queued rows are written before any other statement
+        sqlite_db.update("users", {"name": "renamed"}, {"id": 5})
+        assert count_users(sqlite_db) == 6
+
+    assert batch.counts["coalesced"] == 7
+    assert batch.counts["statements"] == 4
+    assert batch.counts["transactions"] == 1
+    assert sqlite_db.simple("SELECT name FROM users WHERE id = 5", "one", cache=False)["name"] == "renamed"
+
+def test_batch_coalesced_rows_seen_by_other_paths(sqlite_db):
+    """Test simple(), cached reads, streams and pipelines see queued rows first"""
+    from sorcererdb import ResultCache
+
+    sqlite_db.cache = ResultCache()
+    assert sqlite_db.simple("SELECT COUNT(*) AS total FROM users", "one") == {"total": 0}
+
+    with sqlite_db.batch(coalesce=True, max_delay_ms=60000) as batch:
+        sqlite_db.insert("users", {"id": 1, "name": "first"})
+        assert sqlite_db.simple("SELECT COUNT(*) AS total FROM users", "one") == {"total": 1}
+
+        sqlite_db.insert("users", {"id": 2, "name": "second"})
+        assert sqlite_db.query("SELECT COUNT(*) AS total FROM users").result_set("one") == {"total": 2}
+
+        sqlite_db.insert("users", {"id": 3, "name": "third"})
+        assert len(list(sqlite_db.query("SELECT id FROM users").stream())) == 3
+
+        sqlite_db.insert("users", {"id": 4, "name": "fourth"})
+        assert sqlite_db.pipeline(["SELECT id FROM users"]) == [[{"id": i} for i in range(1, 5)]]
+
+        sqlite_db.insert("users", {"id": 5, "name": "fifth"})
+        sqlite_db.simple("DELETE FROM users", "count")
+
+    assert batch.counts["coalesced"] == 5
+    assert batch.counts["statements"] == 6
+    assert batch.counts["transactions"] == 1
+    assert count_users(sqlite_db) == 0
+
+def test_batch_inside_transaction(sqlite_db):
+    """Test a batch inside an open transaction leaves committing to its owner"""
+    sqlite_db.begin()
+    with sqlite_db.batch(max_statements=1, coalesce=True) as batch:
+        sqlite_db.insert("users", {"name": "pending"})
+        sqlite_db.insert("users", {"name": "pending"})
+    assert sqlite_db.in_transaction()
+    assert batch.counts["transactions"] == 0
+    sqlite_db.rollback()
+
+    assert count_users(sqlite_db) == 0
+
+def test_batch_invalid_max_statements(sqlite_db):
+    """Test max_statements must be positive"""
+    with pytest.raises(ValueError):
+        with sqlite_db.batch(max_statements=0):
+            pass
@@ -0,0 +1,34 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.harness import compare, measure
+
+
+def test_compare_flags_regressions():
+    """Test cases slower than the threshold regress, missing ones do not fail"""
+    baseline = {"a": {"best_us": 10.0}, "b": {"best_us": 10.0}, "c": {"best_us": 10.0}, "gone": {"best_us": 1.0}}
+    results  = {"a": {"best_us": 13.0}, "b": {"best_us": 11.0}, "c": {"best_us": 5.0}, "new": {"best_us": 1.0}}
+
+    rows = {row["name"]: row["status"] for row in compare(results, baseline, threshold=0.2)}
+
+    assert rows == {"a": "regressed", "b": "ok", "c": "improved", "new": "new", "gone": "missing"}
+
+def test_measure_reports_rates():
+    """Test a measurement has per-op times and a rate"""
+    result = measure(lambda: None, repeat=2, target=0.001)
+
+    assert result["repeat"] == 2
+    assert result["iterations"] >= 1
+    assert result["ops_per_sec"] > 0
+
+def test_cli_writes_json_and_compares(tmp_path, capsys):
+    """Test the CLI round trip: write results, then compare against them"""
+    output = tmp_path / "bench.json"
+
+    assert main(["-k", "format_binding", "-r", "1", "--target", "0.001", "-o", str(output)]) == 0
+    document = json.loads(output.read_text())
+    assert list(document["results"]) == ["bindings.format_binding"]
+    assert "python" in document["meta"]
+
+    assert main(["-k", "format_binding", "-r", "1", "--target", "0.001", "-b", str(output), "-t", "100"]) == 0
+    assert "missing" not in capsys.readouterr().out
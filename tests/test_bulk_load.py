@@ -0,0 +1,95 @@
+import pytest
+
+from sorcererdb.bulkload import read_source, infile_field, write_infile, load_data_sql
+
+
+def count_users(db):
+    return db.simple("SELECT COUNT(*) AS total FROM users", "one", cache=False)["total"]
+
+def test_bulk_load_iterator_in_chunks(sqlite_db):
+    """Test a generator of dicts is loaded lazily in chunks"""
+    consumed = []
+
+    def rows():
+        for i in range(1, 26):
+            consumed.append(i)
+            yield {"id": i, "name": f"user{i}", "email": f"user{i}@example.com"}
+
+    result = sqlite_db.bulk_load("users", rows(), chunk_size=10)
+
+    assert result == {"rows": 25, "chunks": 3}
+    assert count_users(sqlite_db) == 25
+    assert sqlite_db.simple("SELECT name FROM users WHERE id = 17", "one", cache=False)["name"] == "user17"
+
+def test_bulk_load_sequences_need_columns(sqlite_db):
+    """Test tuple rows are loaded in the given column order"""
+    with pytest.raises(ValueError):
+        sqlite_db.bulk_load("users", [(1, "a")])
+
+    sqlite_db.bulk_load("users", [(1, "alice", ""), (2, "bob", "")], columns=["id", "name", "email"])
+
+    assert sqlite_db.simple("SELECT name FROM users WHERE id = 2", "one", cache=False)["name"] == "bob"
+
+def test_bulk_load_csv_and_tsv_files(sqlite_db, tmp_path):
+    """Test CSV and TSV files load with their header row as columns"""
+    csv_file = tmp_path / "users.csv"
+    csv_file.write_text('id,name,email\n1,"Smith, Jane",jane@example.com\n2,"say ""hi""",hi@example.com\n')
+    tsv_file = tmp_path / "users.tsv"
+    tsv_file.write_text("id\tname\n3\tTab User\n")
+
+    assert sqlite_db.bulk_load("users", csv_file)["rows"] == 2
+    assert sqlite_db.bulk_load("users", tsv_file)["rows"] == 1
+
+    names = sqlite_db.simple("SELECT name FROM users ORDER BY id", cache=False)
+    assert [row["name"] for row in names] == ["Smith, Jane", 'say "hi"', "Tab User"]
+
+def test_bulk_load_rolls_back_on_error(sqlite_db):
+    """Test a failing chunk rolls back every chunk loaded before it"""
+    rows = [{"id": i, "name": f"user{i}"} for i in range(1, 6)] + [{"id": 1, "name": "duplicate"}]
+
+    with pytest.raises(ValueError):
+        sqlite_db.bulk_load("users", rows, chunk_size=2)
+
+    assert count_users(sqlite_db) == 0
+
+def test_bulk_load_requires_local_infile_on_mysql(sqlite_db, sqlite_config):
+    """Test MySQL DSNs must opt in to LOAD DATA LOCAL INFILE"""
+    sqlite_db.get_dsn(sqlite_config.name).engine = "mysql"
+    try:
+        with pytest.raises(ValueError, match="local_infile"):
+            sqlite_db.bulk_load("users", [{"id": 1}])
+    finally:
+        sqlite_db.get_dsn(sqlite_config.name).engine = "sqlite"
+
+def test_infile_escaping(tmp_path):
+    """Test spooled rows use MySQL's escaped tab format"""
+    assert infile_field(None) == "\\N"
+    assert infile_field(True) == "1"
+    assert infile_field("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+    path = tmp_path / "chunk.tsv"
+    with open(path, "w", newline="") as handle:
+        write_infile(handle, [(1, "long value"), (2, None)])
+        write_infile(handle, [(3, "x")])
+    assert path.read_text() == "3\tx\n"
+
+def test_load_data_sql():
+    """Test LOAD DATA statements for spooled chunks and CSV files"""
+    spooled = load_data_sql("/tmp/it's.tsv", "users", ["id", "name"], "utf8mb4")
+    assert spooled.startswith("LOAD DATA LOCAL INFILE '/tmp/it\\'s.tsv' INTO TABLE `users` CHARACTER SET utf8mb4")
+    assert spooled.endswith("(`id`, `name`)")
+
+    csv_sql = load_data_sql("/data/users.csv", "users", ["id"], "utf8mb4", ",", True, True)
+    assert "OPTIONALLY ENCLOSED BY '\"' ESCAPED BY ''" in csv_sql
+    assert "IGNORE 1 LINES" in csv_sql
+
+def test_read_source_header_required(tmp_path):
+    """Test files without a header row need explicit columns"""
+    path = tmp_path / "rows.csv"
+    path.write_text("1,a\n")
+
+    with pytest.raises(ValueError):
+        read_source(path, header=False)
+    columns, rows = read_source(path, ["id", "name"], header=False)
+    assert columns == ["id", "name"]
+    assert list(rows) == [["1", "a"]]
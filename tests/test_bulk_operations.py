@@ -0,0 +1,63 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig, Spell
+
+def test_insert_many(sqlite_db):
+    """Test multi-row inserts report counts and insert ids"""
+    rows = [{"name": f"user{i}", "age": i} for i in range(25)]
+    result = sqlite_db.insert_many("users", rows, batch_size=10)
+
+    assert result["rows"] == 25
+    assert result["batches"] == 3
+    assert result["last_id"] - result["first_id"] == 24
+
+    records = sqlite_db.simple("SELECT id, name, age FROM users ORDER BY id")
+    assert len(records) == 25
+    assert records[0]["id"] == result["first_id"]
+    assert records[-1]["id"] == result["last_id"]
+    assert records[7]["age"] == 7
+
+def test_insert_many_explicit_ids(sqlite_db):
+    """Test rows carrying their own keys report no id range"""
+    result = sqlite_db.insert_many("users", [{"id": i, "name": f"user{i}"} for i in (5, 17, 42)])
+
+    assert result["rows"] == 3
+    assert result["first_id"] is None and result["last_id"] is None
+    assert [row["id"] for row in sqlite_db.simple("SELECT id FROM users ORDER BY id")] == [5, 17, 42]
+
+    result = sqlite_db.insert_many("users", [{"name": "generated"}])
+    assert result["first_id"] == result["last_id"] == 43
+
+def test_insert_many_generator(sqlite_db):
+    """Test rows can come from any iterator"""
+    result = sqlite_db.insert_many("users", ({"name": f"gen{i}"} for i in range(5)))
+
+    assert result["rows"] == 5
+    assert result["batches"] == 1
+
+def test_insert_many_respects_max_packet(sqlite_db):
+    """Test batches are split to stay under the packet size"""
+    rows = [{"name": "x" * 50} for i in range(10)]
+    result = sqlite_db.insert_many("users", rows, batch_size=100, max_packet=100)
+
+    assert result["rows"] == 10
+    assert result["batches"] == 10
+
+def test_insert_many_keeps_value_types(sqlite_db):
+    """Test values are bound without being stringified"""
+    sqlite_db.insert_many("posts", [{"user_id": 7, "title": "Hello", "content": "World"}])
+
+    record = sqlite_db.simple("SELECT user_id, typeof(user_id) AS kind FROM posts", "one")
+    assert record == {"user_id": 7, "kind": "integer"}
+
+def test_insert_many_rolls_back_on_error(sqlite_db):
+    """Test a failing batch rolls back the whole call"""
+    rows = [{"name": "ok"}, {"name": "ok"}, {"missing": "bad"}]
+    with pytest.raises(ValueError):
+        sqlite_db.insert_many("users", rows, batch_size=1)
+
+    assert sqlite_db.simple("SELECT COUNT(*) AS count FROM users", "one")["count"] == 0
+
+def test_insert_many_invalid_batch_size(sqlite_db):
+    """Test batch_size must be positive"""
+    with pytest.raises(ValueError):
+        sqlite_db.insert_many("users", [{"name": "Eric"}], batch_size=0)
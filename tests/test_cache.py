@@ -0,0 +1,132 @@
+import time
+
+import pytest
+from sorcererdb import SorcererDB, DBConfig, ResultCache
+from sorcererdb.cache import read_tables, write_table
+
+@pytest.fixture(scope="function")
+def cached_db(sqlite_config):
+    db = SorcererDB(sqlite_config, cache_backend=ResultCache(max_entries=8, ttl=60))
+    db.connect(sqlite_config.name)
+    db.simple("CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100), age INT)", "count")
+    db.simple("CREATE TABLE posts (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INT, title VARCHAR(200))", "count")
+    yield db
+    db.disconnect(sqlite_config.name)
+
+def test_table_parsing():
+    """Test tables are tagged from reads and detected from writes"""
+    sql = "SELECT * FROM `users` u JOIN db.posts p ON p.user_id = u.id"
+    assert read_tables(sql) == frozenset({"users", "posts"})
+
+    assert write_table("INSERT INTO `users` SET name = %(name)s") == "users"
+    assert write_table("  update users SET name = 1") == "users"
+    assert write_table("DELETE FROM posts WHERE id = 1") == "posts"
+    assert write_table("TRUNCATE TABLE posts;") == "posts"
+    assert write_table("SELECT * FROM users") is None
+    assert write_table("INSERT posts SET title = 'x'") == "posts"
+    assert write_table("INSERT IGNORE INTO posts (title) VALUES ('x')") == "posts"
+    assert write_table("REPLACE posts (title) VALUES ('x')") == "posts"
+
+def test_comma_join_parsing():
+    """Test every table of a comma-separated FROM list is read"""
+    sql = "SELECT COUNT(*) FROM users u, `posts` AS p, comments WHERE u.id = p.user_id ORDER BY u.id, p.id"
+    assert read_tables(sql) == frozenset({"users", "posts", "comments"})
+    assert read_tables("SELECT a, b FROM users WHERE id IN (1, 2) GROUP BY a, b") == frozenset({"users"})
+    assert read_tables("SELECT * FROM users u, posts p JOIN tags t ON t.post_id = p.id") == frozenset({"users", "posts", "tags"})
+
+def test_cache_lru_eviction():
+    """Test the least recently used entry is evicted first"""
+    cache = ResultCache(max_entries=2)
+    cache.set("a", [1])
+    cache.set("b", [2])
+    cache.get("a")
+    cache.set("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.stats()["evictions"] == 1
+
+def test_cache_memory_bound():
+    """Test entries are evicted to stay under max_bytes"""
+    cache = ResultCache(max_bytes=1500)
+    cache.set("a", ["x" * 800])
+    cache.set("b", ["y" * 800])
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= 1500
+    assert cache.set("huge", ["z" * 5000]) is False
+
+def test_cache_ttl():
+    """Test expired entries are not returned"""
+    cache = ResultCache(ttl=0.01)
+    cache.set("a", [1])
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+
+def test_cached_result_set(cached_db):
+    """Test repeated reads are served from the cache"""
+    cached_db.insert("users", {"name": "Eric", "age": 30})
+
+    cached_db.query("SELECT * FROM users WHERE name = @name").set_bindings({"name": "Eric"})
+    first = cached_db.result_set("all")
+    cached_db.query("SELECT *  FROM users\n WHERE name = @name").set_bindings({"name": "Eric"})
+    second = cached_db.result_set("all")
+
+    assert first == second
+    assert cached_db.cache.stats()["hits"] == 1
+
+    # Different bindings are a different entry
+    cached_db.query("SELECT * FROM users WHERE name = @name").set_bindings({"name": "Barty"})
+    assert cached_db.result_set("all") == []
+    assert cached_db.cache.stats()["hits"] == 1
+
+def test_cached_rows_are_copies(cached_db):
+    """Test mutating a returned row does not change the cached one"""
+    cached_db.insert("users", {"name": "Eric"})
+
+    rows = cached_db.simple("SELECT name FROM users")
+    rows[0]["name"] = "Changed"
+
+    assert cached_db.simple("SELECT name FROM users") == [{"name": "Eric"}]
+
+def test_writes_invalidate_cache(cached_db):
+    """Test insert/update/delete drop cached reads of the table"""
+    user_id = cached_db.insert("users", {"name": "Eric"})
+    cached_db.insert("posts", {"user_id": user_id, "title": "Hello"})
+
+    assert len(cached_db.simple("SELECT * FROM users")) == 1
+    assert len(cached_db.simple("SELECT * FROM posts")) == 1
+
+    cached_db.insert("users", {"name": "Barty"})
+    assert len(cached_db.simple("SELECT * FROM users")) == 2
+
+    cached_db.update("users", {"name": "Marvin"}, {"id": user_id})
+    assert cached_db.simple("SELECT name FROM users ORDER BY id")[0]["name"] == "Marvin"
+
+    cached_db.delete("users", {"id": user_id})
+    assert len(cached_db.simple("SELECT * FROM users")) == 1
+
+    # Reads of other tables stay cached
+    hits = cached_db.cache.stats()["hits"]
+    cached_db.simple("SELECT * FROM posts")
+    assert cached_db.cache.stats()["hits"] == hits + 1
+
+def test_comma_join_invalidated(cached_db):
+    """Test a write to any table of a comma join drops the cached read"""
+    user_id = cached_db.insert("users", {"name": "Eric"})
+    sql = "SELECT COUNT(*) AS total FROM users u, posts p WHERE p.user_id = u.id"
+
+    assert cached_db.simple(sql, "one")["total"] == 0
+    cached_db.insert("posts", {"user_id": user_id, "title": "Hello"})
+    assert cached_db.simple(sql, "one")["total"] == 1
+
+def test_cache_bypass(cached_db):
+    """Test reads can skip the cache and transactions are never cached"""
+    cached_db.simple("SELECT * FROM users", cache=False)
+    assert cached_db.cache.stats()["entries"] == 0
+
+    cached_db.begin()
+    cached_db.simple("SELECT * FROM users")
+    cached_db.commit()
+    assert cached_db.cache.stats()["entries"] == 0
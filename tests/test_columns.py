@@ -0,0 +1,80 @@
+import pytest
+from sorcererdb.columns import ColumnBuilder, load_numpy, read_columns
+
+@pytest.fixture
+def report_db(sqlite_db):
+    rows = [{"name": f"user{i}", "email": f"user{i}@example.com", "age": 20 + i} for i in range(50)]
+    sqlite_db.insert_many("users", rows)
+    return sqlite_db
+
+def test_columns_format(report_db):
+    """Test format="columns" returns one sequence per column"""
+    columns = report_db.query("SELECT id, name, age FROM users WHERE age >= @age").binding("age", 30).result_set(format="columns")
+
+    assert list(columns) == ["id", "name", "age"]
+    assert list(columns["age"]) == list(range(30, 70))
+    assert list(columns["name"])[:2] == ["user10", "user11"]
+    assert report_db.result_count() == 40
+
+def test_columns_empty_result(report_db):
+    """Test an empty result still names every column"""
+    columns = report_db.query("SELECT id, name FROM users WHERE age < 0").result_set(format="columns")
+
+    assert {name: list(values) for name, values in columns.items()} == {"id": [], "name": []}
+
+def test_columns_invalid_format(report_db):
+    """Test an unknown format is rejected"""
+    with pytest.raises(ValueError):
+        report_db.query("SELECT id FROM users").result_set(format="frames")
+
+def test_columns_reject_fetch_type(report_db):
+    """Test format="columns" refuses a fetch type or size it would ignore"""
+    with pytest.raises(ValueError):
+        report_db.query("SELECT id FROM users").result_set("many", size=5, format="columns")
+    with pytest.raises(ValueError):
+        report_db.query("SELECT id FROM users").result_set("one", format="columns")
+
+def test_columns_without_numpy(monkeypatch):
+    """Test columns fall back to lists when NumPy is missing"""
+    monkeypatch.setattr("sorcererdb.columns.load_numpy", lambda: None)
+
+    columns = read_columns([("id", None), ("score", None)], [[(1, 1.5), (2, None)], [(3, 2.5)]])
+
+    assert columns == {"id": [1, 2, 3], "score": [1.5, None, 2.5]}
+
+def test_columns_numpy_dtypes():
+    """Test dtypes come from metadata or the first chunk and widen on NULLs"""
+    numpy = pytest.importorskip("numpy")
+
+    # MySQL: LONGLONG not null, DOUBLE, VAR_STRING
+    description = [("id", 8, None, None, None, None, False), ("score", 5), ("name", 253)]
+    columns = read_columns(description, [[(i, i / 2, f"n{i}") for i in range(3000)]])
+    assert columns["id"].dtype == numpy.int64
+    assert columns["score"].dtype == numpy.float64
+    assert columns["name"].dtype == object
+    assert columns["id"].sum() == sum(range(3000))
+
+    # SQLite: no types, an integer column that later holds a NULL
+    columns = read_columns([("total", None)], [[(1,), (2,)], [(None,)]])
+    assert columns["total"].dtype == numpy.float64
+    assert numpy.isnan(columns["total"][2])
+
+def test_columns_unsigned_bigint_overflow():
+    """Test integers past int64 fall back to an object column"""
+    numpy = pytest.importorskip("numpy")
+
+    # MySQL: LONGLONG not null holding BIGINT UNSIGNED values
+    description = [("id", 8, None, None, None, None, False)]
+    columns = read_columns(description, [[(1,), (2,)], [(2 ** 64 - 1,)]])
+
+    assert columns["id"].dtype == object
+    assert list(columns["id"]) == [1, 2, 2 ** 64 - 1]
+
+def test_column_builder_grows_in_chunks():
+    """Test the builder keeps every value across several growths"""
+    numpy   = load_numpy()
+    builder = ColumnBuilder(numpy, "int")
+    for start in range(0, 5000, 700):
+        builder.extend(list(range(start, min(start + 700, 5000))))
+
+    assert list(builder.result()) == list(range(5000))
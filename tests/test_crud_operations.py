@@ -65,3 +65,17 @@ def test_complex_queries(db):
     assert record['name'] == "Eric"
 
 
+
+# - test_insert_many
+def test_insert_many(db):
+
+    rows = [{"name": f"user{i}", "age": i} for i in range(10)]
+    result = db.insert_many("users", rows, batch_size=4)
+
+    assert result["rows"] == 10
+    assert result["batches"] == 3
+    assert result["last_id"] - result["first_id"] == 9
+
+    db.query("SELECT COUNT(*) AS count FROM users")
+    record = db.result_set("one")
+    assert record['count'] == 10
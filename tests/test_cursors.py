@@ -0,0 +1,119 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig, Spell
+from sorcererdb.spell import live_cursors
+from sorcererdb.statements import CursorCache
+
+class FakeCursor:
+    def __init__(self, conn, dictionary=False, buffered=None):
+        self.conn        = conn
+        self.dictionary  = dictionary
+        self.description = None
+        self.rowcount    = 0
+        self.rows        = []
+        self.closed      = False
+        conn.opened += 1
+
+    def execute(self, query, bindings=None):
+        self.description = [("id",)] if self.dictionary else None
+        self.rows        = [{"id": 1}] if self.dictionary else []
+        self.rowcount    = len(self.rows)
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def reset(self):
+        self.rows = []
+
+    def close(self):
+        self.closed = True
+
+class FakeConn:
+    unread_result = False
+
+    def __init__(self):
+        self.opened = 0
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self, **kwargs)
+
+@pytest.fixture
+def fake_db():
+    db = SorcererDB(DBConfig(name="Fake", engine="mysql"))
+    db.connections["Fake"] = FakeConn()
+    db.active_connection = "Fake"
+    yield db
+    db.connections = {}
+
+def test_result_apis_close_cursors(sqlite_db):
+    """Test result_set, simple and the CRUD helpers leave no cursor open"""
+    baseline = live_cursors()
+
+    sqlite_db.insert("users", {"name": "Alice", "email": "alice@example.com"})
+    sqlite_db.simple("SELECT * FROM users")
+    sqlite_db.query("SELECT * FROM users WHERE name = @name").binding("name", "Alice").result_set("one")
+    sqlite_db.update("users", {"name": "Bob"}, {"name": "Alice"})
+    sqlite_db.delete("users", {"name": "Bob"})
+
+    assert live_cursors() == baseline
+    assert sqlite_db.stats()["cursors"]["live"] == baseline
+
+def test_execute_as_context_manager(sqlite_db):
+    """Test the Spell returned by execute() closes its cursor on exit"""
+    baseline = live_cursors()
+
+    with sqlite_db.query("SELECT * FROM users").execute() as spell:
+        assert live_cursors() == baseline + 1
+        assert spell.fetchall() == []
+
+    assert spell.cursor is None
+    assert live_cursors() == baseline
+
+def test_failed_query_closes_cursor(sqlite_db):
+    """Test a query error does not leave its cursor open"""
+    baseline = live_cursors()
+
+    with pytest.raises(ValueError):
+        sqlite_db.simple("SELECT * FROM missing_table")
+
+    assert live_cursors() == baseline
+
+def test_buffered_cursor_reused_per_connection(fake_db):
+    """Test a closed buffered MySQL cursor runs the next query on its connection"""
+    conn = fake_db.get_connection("Fake")
+
+    for _ in range(3):
+        assert fake_db.simple("SELECT id FROM users", cache=False) == [{"id": 1}]
+    fake_db.simple("UPDATE users SET id = 1", "count")
+
+    # One dictionary cursor for the reads, one plain cursor for the write
+    assert conn.opened == 2
+    stats = fake_db.stats()["cursors"]
+    assert stats["reuses"] == 2
+    assert stats["idle"] == 2
+
+def test_parked_cursor_drops_rows():
+    """Test a parked cursor does not hold on to its buffered rows"""
+    conn    = FakeConn()
+    cursors = CursorCache()
+
+    spell = Spell(conn, "mysql", cursors=cursors)
+    spell.execute("SELECT id FROM users")
+    cursor = spell.cursor
+    spell.close()
+
+    assert cursor.rows == []
+    assert cursor.closed is False
+    assert cursors.take(conn, True) is cursor
+
+def test_unbuffered_cursor_not_reused():
+    """Test unbuffered cursors are closed instead of parked"""
+    conn    = FakeConn()
+    cursors = CursorCache()
+
+    with Spell(conn, "mysql", cursors=cursors) as spell:
+        spell.execute("SELECT id FROM users", buffered=False)
+        cursor = spell.cursor
+
+    assert cursor.closed is True
+    assert cursors.stats()["idle"] == 0
@@ -0,0 +1,57 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+
+@pytest.fixture
+def export_db(sqlite_db):
+    sqlite_db.insert_many("users", [
+        {"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "age": i} for i in range(1, 26)
+    ])
+    return sqlite_db
+
+def test_export_csv(export_db, tmp_path):
+    """Test rows are written as CSV with a header row"""
+    path = tmp_path / "users.csv"
+
+    result = export_db.export("SELECT id, name FROM users WHERE age > @age ORDER BY id", {"age": 20}, path,
+                              chunk_size=2)
+
+    assert result["rows"] == 5
+    assert result["bytes"] == path.stat().st_size
+    assert result["rows_per_sec"] > 0
+    with open(path, newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == ["id", "name"]
+    assert rows[1] == ["21", "user21"]
+    assert len(rows) == 6
+
+def test_export_jsonl_gzip(export_db, tmp_path):
+    """Test JSON Lines output, gzipped for a .gz destination"""
+    path = tmp_path / "users.jsonl.gz"
+
+    result = export_db.export("SELECT id, name, email FROM users ORDER BY id", None, path, format="jsonl")
+
+    with gzip.open(path, "rt") as handle:
+        lines = [json.loads(line) for line in handle]
+    assert result["rows"] == 25
+    assert result["bytes"] == path.stat().st_size
+    assert lines[0] == {"id": 1, "name": "user1", "email": "user1@example.com"}
+
+def test_export_to_file_object(export_db):
+    """Test a binary file object is written to and left open"""
+    buffer = io.BytesIO()
+
+    export_db.export("SELECT name FROM users WHERE id = 3", None, buffer, format="jsonl")
+
+    assert not buffer.closed
+    assert buffer.getvalue() == b'{"name": "user3"}\n'
+
+def test_export_invalid_format(export_db, tmp_path):
+    """Test unknown formats are rejected before anything is written"""
+    with pytest.raises(ValueError):
+        export_db.export("SELECT * FROM users", None, tmp_path / "users.xml", format="xml")
+    assert not (tmp_path / "users.xml").exists()
@@ -0,0 +1,66 @@
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+# Cold-start budget for `import sorcererdb` on top of its dependencies
+IMPORT_BUDGET_MS = float(os.getenv("SORCERERDB_IMPORT_BUDGET_MS", "150"))
+
+# Modules `import sorcererdb` must leave to first use. json is checked too,
+# though loguru usually loads it first; only modules new after the import count.
+LAZY_MODULES = ("mysql.connector", "sqlite3", "sorcererdb.aio", "csv", "json", "concurrent.futures.thread")
+
+IMPORT_PROBE = """
+import os, sys, time
+import loguru
+
+before  = set(sys.modules)
+started = time.perf_counter()
+import sorcererdb
+elapsed = (time.perf_counter() - started) * 1000
+loaded  = [name for name in %r if name in sys.modules and name not in before]
+
+import json
+print(json.dumps({
+    "ms":      elapsed,
+    "modules": loaded,
+    "logs":    os.path.exists("logs"),
+}))
+""" % (LAZY_MODULES,)
+
+def probe_import(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd            = tmp_path,
+        capture_output = True,
+        text           = True,
+        check          = True,
+        env            = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+    )
+    return json.loads(result.stdout)
+
+@pytest.mark.slow
+def test_import_is_lazy(tmp_path):
+    """Test importing the package loads no drivers and creates no log files"""
+    probe = probe_import(tmp_path)
+
+    assert probe["modules"] == []
+    assert probe["logs"] is False
+
+@pytest.mark.slow
+def test_import_time_budget(tmp_path):
+    """Test the cold import stays within the start-up budget"""
+    # Best of a few runs to keep a busy machine from failing the check
+    elapsed = min(probe_import(tmp_path)["ms"] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET_MS, f"import sorcererdb took {elapsed:.1f}ms (budget {IMPORT_BUDGET_MS}ms)"
+
+def test_driver_loaded_on_connect(sqlite_db):
+    """Test connecting a DSN loads its engine's driver"""
+    from sorcererdb.drivers import loaded, db_errors
+    import sqlite3
+
+    assert loaded["sqlite"] is sqlite3
+    assert sqlite3.Error in db_errors()
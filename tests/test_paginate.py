@@ -0,0 +1,74 @@
+import pytest
+from sorcererdb.paginate import Page
+
+@pytest.fixture
+def paged_db(sqlite_db):
+    rows = [{"name": f"user{i:02d}", "email": f"user{i}@example.com", "age": i % 3} for i in range(25)]
+    sqlite_db.insert_many("users", rows)
+    return sqlite_db
+
+def test_paginate_walks_every_row(paged_db):
+    """Test pages come back lazily in key order until the table is exhausted"""
+    pages = list(paged_db.paginate("users", "id", page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert all(isinstance(page, Page) for page in pages)
+    assert [row["id"] for page in pages for row in page] == list(range(1, 26))
+    assert pages[-1].cursor is None
+
+def test_paginate_uses_seek_not_offset(paged_db):
+    """Test later pages seek past the last key instead of using OFFSET"""
+    pages = paged_db.paginate("users", "id", page_size=10)
+    next(pages)
+    next(pages)
+
+    query = paged_db.get_query()
+    assert "OFFSET" not in query.upper()
+    assert "id > @seek_0" in query
+    assert paged_db.get_bindings()["seek_0"] == 10
+    assert paged_db.get_bindings()["limit"] == 10
+
+def test_paginate_composite_key_and_conditions(paged_db):
+    """Test a composite key with conditions and a descending walk"""
+    pages = paged_db.paginate("users", ["age", "id"], page_size=3, conditions={"age": [0, ">"]}, descending=True)
+    rows  = [(row["age"], row["id"]) for page in pages for row in page]
+
+    expected = sorted(((i % 3, i + 1) for i in range(25) if i % 3 > 0), reverse=True)
+    assert rows == expected
+
+def test_paginate_expression_key(paged_db):
+    """Test an expression key seeks on its own type rather than as a string"""
+    pages = list(paged_db.paginate("SELECT id * 2 AS k FROM users", "k", page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [row["k"] for page in pages for row in page] == [i * 2 for i in range(1, 26)]
+
+def test_paginate_expression_key_descending(paged_db):
+    """Test a descending walk over an expression key"""
+    pages = list(paged_db.paginate("SELECT id * 2 AS k FROM users", "k", page_size=10, descending=True))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [row["k"] for page in pages for row in page] == [i * 2 for i in range(25, 0, -1)]
+
+def test_paginate_resumes_from_cursor(paged_db):
+    """Test a serialized cursor resumes right after the page it came from"""
+    first  = next(paged_db.paginate("users", "id", page_size=10))
+    resume = paged_db.paginate("users", "id", page_size=10, cursor=first.cursor)
+
+    assert next(resume)[0]["id"] == 11
+
+def test_paginate_sql_source(paged_db):
+    """Test paging over a query rather than a table"""
+    pages = paged_db.paginate("SELECT id, name FROM users WHERE age = 1", "id", page_size=4)
+    names = [row["name"] for page in pages for row in page]
+
+    assert names == [f"user{i:02d}" for i in range(25) if i % 3 == 1]
+
+def test_paginate_rejects_foreign_cursor(paged_db):
+    """Test a cursor for other key columns is refused"""
+    first = next(paged_db.paginate("users", "id", page_size=10))
+
+    with pytest.raises(ValueError):
+        paged_db.paginate("users", ["age", "id"], cursor=first.cursor)
+    with pytest.raises(ValueError):
+        paged_db.paginate("users", "id", cursor="not-a-cursor")
@@ -0,0 +1,150 @@
+import pytest
+
+from sorcererdb.drivers import load_driver
+from sorcererdb.pipeline import pipeline_calls, number_bindings, multi_results
+
+
+@pytest.fixture
+def pipeline_db(sqlite_db):
+    sqlite_db.insert_many("users", [{"id": i, "name": f"user{i}", "age": 20 + i} for i in range(1, 6)])
+    return sqlite_db
+
+def test_pipeline_fetch_types(pipeline_db):
+    """Test every statement comes back in its own fetch type, in order"""
+    results = pipeline_db.pipeline([
+        "SELECT id FROM users ORDER BY id",
+        ("SELECT name FROM users WHERE id = @id", {"id": 3}, "one"),
+        ("SELECT id FROM users ORDER BY id", None, "many", 2),
+        ("UPDATE users SET age = 0 WHERE id > @id", {"id": 3}, "count"),
+    ])
+
+    assert results[0] == [{"id": i} for i in range(1, 6)]
+    assert results[1] == {"name": "user3"}
+    assert results[2] == [{"id": 1}, {"id": 2}]
+    assert results[3] == 2
+
+def test_pipeline_isolates_errors(pipeline_db):
+    """Test a failing statement does not stop the others"""
+    results = pipeline_db.pipeline([
+        ("SELECT COUNT(*) AS total FROM users", None, "one"),
+        "SELECT * FROM missing_table",
+        ("SELECT COUNT(*) AS total FROM users", None, "one"),
+    ])
+
+    assert results[0] == {"total": 5}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"total": 5}
+
+def test_pipeline_in_transaction(pipeline_db):
+    """Test statements inside a transaction run in order on its connection"""
+    pipeline_db.begin()
+    results = pipeline_db.pipeline([
+        ("DELETE FROM users WHERE id = 1", None, "count"),
+        "SELECT * FROM missing_table",
+        ("SELECT COUNT(*) AS total FROM users", None, "one"),
+    ])
+    pipeline_db.rollback()
+
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"total": 4}
+
+def test_pipeline_calls_validation():
+    """Test statement specs are normalised and fetch types checked"""
+    assert pipeline_calls(["SELECT 1", ("SELECT 2", {"a": 1}, "one")]) == [
+        ("SELECT 1", {}, "all", 25), ("SELECT 2", {"a": 1}, "one", 25)
+    ]
+    with pytest.raises(ValueError):
+        pipeline_calls([("SELECT 1", None, "everything")])
+
+def test_number_bindings():
+    """Test placeholders are renamed per statement"""
+    sql, bindings = number_bindings(2, "SELECT * FROM users WHERE id = %(id)s AND age > %(age)s", {"id": 1, "age": 2})
+
+    assert sql == "SELECT * FROM users WHERE id = %(s2_id)s AND age > %(s2_age)s"
+    assert bindings == {"s2_id": 1, "s2_age": 2}
+
+
+class FakeResult:
+    def __init__(self, statement):
+        self.description = [("value",)] if statement.startswith("SELECT") else None
+        self.rows        = [{"value": statement}]
+        self.rowcount    = 1 if self.description else 7
+        self.lastrowid   = None
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeMultiCursor:
+    # mysql-connector 8.x style: execute(multi=True) yields per-statement results
+    def __init__(self, sent):
+        self.sent = sent
+
+    def execute(self, sql, params = None, multi = False):
+        self.sent.append(sql)
+        return self.results(sql.split(";\n"))
+
+    def results(self, statements):
+        for statement in statements:
+            if "BROKEN" in statement:
+                raise load_driver("mysql").Error("syntax error")
+            yield FakeResult(statement)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.sent = []
+
+    def cursor(self, dictionary = False, buffered = False):
+        return FakeMultiCursor(self.sent)
+
+def test_run_multi_resumes_after_error(sqlite_db):
+    """Test one packet per run, resent from the statement after a failure"""
+    conn    = FakeConnection()
+    calls   = pipeline_calls(["SELECT a", "BROKEN b", ("UPDATE c", None, "count"), "SELECT d"])
+    results = [None] * len(calls)
+
+    start = sqlite_db.run_multi(conn, "test", calls, 0, results, "dict")
+    assert start == 2
+    assert sqlite_db.run_multi(conn, "test", calls, start, results, "dict") == 4
+
+    assert conn.sent == ["SELECT a;\nBROKEN b;\nUPDATE c;\nSELECT d", "UPDATE c;\nSELECT d"]
+    assert results[0] == [{"value": "SELECT a"}]
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 7
+    assert results[3] == [{"value": "SELECT d"}]
+
+def test_multi_results_nextset_api():
+    """Test connectors without multi=True are walked with nextset()"""
+    class NextsetCursor:
+        def __init__(self):
+            self.sets = 3
+
+        def execute(self, sql, params = None):
+            self.executed = sql
+
+        def nextset(self):
+            self.sets -= 1
+            return self.sets > 0
+
+    cursor = NextsetCursor()
+    assert len(list(multi_results(cursor, "SELECT 1; SELECT 2; SELECT 3", {}))) == 3
+
+def test_multi_results_executes_once():
+    """Test an error raised by execute() is not retried as another API"""
+    class FailingCursor:
+        def __init__(self):
+            self.calls = 0
+
+        def execute(self, sql, params = None, multi = False):
+            self.calls += 1
+            raise TypeError("bad parameter")
+
+    cursor = FailingCursor()
+    with pytest.raises(TypeError):
+        list(multi_results(cursor, "INSERT INTO t VALUES (1); SELECT 1", {}))
+    assert cursor.calls == 1
@@ -0,0 +1,121 @@
+import time
+import threading
+
+import pytest
+from sorcererdb import SorcererDB, DBConfig
+from sorcererdb.pool import ConnectionPool
+
+class DummyConn:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def test_pool_prewarms_min_size():
+    """Test the pool opens min_size connections up front"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=2, max_size=4)
+
+    stats = pool.stats()
+    assert stats["size"] == 2
+    assert stats["idle"] == 2
+    assert stats["creations"] == 2
+
+def test_pool_checkout_checkin_reuses_connections():
+    """Test checked in connections are handed out again"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=1, max_size=2)
+
+    conn = pool.checkout()
+    pool.checkin(conn)
+    assert pool.checkout() is conn
+
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["checkins"] == 1
+    assert stats["creations"] == 1
+    assert stats["in_use"] == 1
+
+def test_pool_grows_to_max_size_and_times_out():
+    """Test the pool is bounded and waits up to wait_timeout"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=0, max_size=2, wait_timeout=0.05)
+
+    pool.checkout()
+    pool.checkout()
+    with pytest.raises(ConnectionError):
+        pool.checkout()
+
+    stats = pool.stats()
+    assert stats["size"] == 2
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+
+def test_pool_waiter_is_woken_by_checkin():
+    """Test a waiting checkout gets the connection released by another thread"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=1, max_size=1, wait_timeout=5)
+    conn = pool.checkout()
+
+    timer = threading.Timer(0.05, pool.checkin, args=(conn,))
+    timer.start()
+    assert pool.checkout() is conn
+    timer.join()
+
+    assert pool.stats()["waits"] == 1
+
+def test_pool_expires_idle_and_old_connections():
+    """Test max_idle and max_lifetime recycle connections"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=1, max_size=2, max_idle=0.01)
+    stale = pool.checkout()
+    pool.checkin(stale)
+    time.sleep(0.02)
+
+    fresh = pool.checkout()
+    assert fresh is not stale
+    assert stale.closed is True
+
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=0, max_size=2, max_lifetime=0.01)
+    old = pool.checkout()
+    time.sleep(0.02)
+    pool.checkin(old)
+    assert old.closed is True
+    assert pool.stats()["expired"] == 1
+
+def test_pool_rejects_foreign_connection():
+    """Test checkin of a connection that was not checked out"""
+    pool = ConnectionPool(DummyConn, name="dummy")
+    with pytest.raises(ValueError):
+        pool.checkin(DummyConn())
+
+def test_pool_close():
+    """Test closing the pool closes idle connections and rejects checkouts"""
+    pool = ConnectionPool(DummyConn, name="dummy", min_size=1)
+    conn = pool.checkout()
+    pool.checkin(conn)
+    pool.close()
+
+    assert conn.closed is True
+    with pytest.raises(ConnectionError):
+        pool.checkout()
+
+def test_sorcererdb_pool(sqlite_db, sqlite_config):
+    """Test SorcererDB pins one pooled connection and lends others"""
+    stats = sqlite_db.pool_stats()
+    assert stats["in_use"] == 1
+
+    with sqlite_db.pooled_connection() as conn:
+        assert conn is not sqlite_db.get_connection(sqlite_config.name)
+        assert sqlite_db.pool_stats()["in_use"] == 2
+
+    assert sqlite_db.pool_stats()["in_use"] == 1
+
+    sqlite_db.disconnect(sqlite_config.name)
+    assert sqlite_config.name not in sqlite_db.pools
+
+def test_sorcererdb_pool_invalid_engine():
+    """Test an invalid engine still fails on connect"""
+    config = DBConfig(engine="invalid_engine", name="Invalid")
+    db = SorcererDB(config)
+
+    with pytest.raises(ValueError):
+        db.connect(config.name)
+
+    assert db.check_connection(config.name) is False
@@ -0,0 +1,128 @@
+import re
+import pytest
+import mysql.connector
+from sorcererdb import SorcererDB, DBConfig, Spell
+from sorcererdb.spell import PreparedCursor
+from sorcererdb.statements import PreparedStatements
+
+class FakeCursor:
+    def __init__(self, conn, prepared=False, dictionary=False, buffered=None):
+        self.conn        = conn
+        self.prepared    = prepared
+        self.description = None
+        self.rowcount    = 0
+        self.lastrowid   = None
+        self.closed      = False
+        self.statement   = None
+        self.executed    = None
+
+    def execute(self, query, bindings=None):
+        if self.prepared:
+            # Like MySQLCursorPrepared: dict params are rewritten into a new
+            # operation string, and any new operation string is re-prepared
+            if isinstance(bindings, dict):
+                query = re.sub(r"%\((\w+)\)s", "%s", query)
+            if query is not self.executed:
+                self.conn.prepares += 1
+                self.executed = query
+        if self.conn.forget_statements and self.prepared:
+            self.conn.forget_statements = False
+            raise mysql.connector.Error(msg="Unknown prepared statement handler", errno=1243)
+        self.conn.executions.append((query, bindings, self.prepared))
+        self.description = [("id",)]
+        self.rows = [{"id": 1}, {"id": 2}]
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self):
+        self.closed = True
+
+class FakeConn:
+    def __init__(self):
+        self.prepares          = 0
+        self.executions        = []
+        self.forget_statements = False
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self, **kwargs)
+
+@pytest.fixture
+def fake_db():
+    config = DBConfig(name="Fake", engine="mysql", prepared_cache_size=2)
+    db = SorcererDB(config)
+    db.connections["Fake"] = FakeConn()
+    db.active_connection = "Fake"
+    yield db
+    db.connections = {}
+
+def test_stored_query_prepared_once_per_connection(fake_db):
+    """Test a stored query is prepared on first use and reused after"""
+    conn = fake_db.get_connection("Fake")
+    fake_db.add_stored_query("by_id", "SELECT id FROM users WHERE id = %(id)s")
+
+    for user_id in range(3):
+        rows = fake_db.set_stored_query("by_id").set_bindings({"id": user_id}).result_set("all")
+        assert rows == [{"id": 1}, {"id": 2}]
+
+    assert conn.prepares == 1
+    assert all(prepared for query, bindings, prepared in conn.executions)
+    assert conn.executions[-1][:2] == ("SELECT id FROM users WHERE id = %s", ("2",))
+    assert fake_db.prepared_stats()["hits"] == 2
+
+    # A second connection prepares its own copy
+    fake_db.connections["Fake"] = other = FakeConn()
+    fake_db.set_stored_query("by_id").set_bindings({"id": 1}).result_set("all")
+    assert other.prepares == 1
+
+def test_adhoc_queries_are_not_prepared(fake_db):
+    """Test plain queries keep using regular cursors"""
+    conn = fake_db.get_connection("Fake")
+    fake_db.query("SELECT id FROM users").result_set("all")
+
+    assert conn.prepares == 0
+    assert conn.executions[0][2] is False
+
+def test_prepared_statement_lru_eviction(fake_db):
+    """Test the least recently used statement is deallocated when the cache is full"""
+    for key in ["a", "b", "c"]:
+        fake_db.add_stored_query(key, f"SELECT id FROM {key}")
+        fake_db.set_stored_query(key).result_set("all")
+
+    stats = fake_db.prepared_stats()
+    assert stats["statements"] == 2
+    assert stats["evictions"] == 1
+
+def test_prepared_statement_reprepared_after_reconnect():
+    """Test a statement the server forgot is prepared again transparently"""
+    conn = FakeConn()
+    cursor = PreparedCursor(conn, "SELECT id FROM users")
+    conn.forget_statements = True
+
+    cursor.execute("SELECT id FROM users")
+    assert conn.prepares == 2
+    assert cursor.fetchone() == {"id": 1}
+    assert cursor.rowcount == 2
+
+def test_prepared_statements_cache_clear():
+    """Test clearing closes every cached handle"""
+    cache = PreparedStatements(max_size=4)
+    conn = FakeConn()
+    handle = cache.get(conn, "a", lambda: FakeCursor(conn, prepared=True))
+    assert cache.get(conn, "a", lambda: None) is handle
+
+    cache.clear(conn)
+    assert handle.closed is True
+    assert cache.stats()["statements"] == 0
+
+def test_sqlite_stored_queries(sqlite_db):
+    """Test stored queries run through the SQLite statement cache"""
+    sqlite_db.insert("users", {"name": "Eric"})
+    sqlite_db.add_stored_query("by_name", "SELECT name FROM users WHERE name = @name")
+
+    for _ in range(2):
+        record = sqlite_db.set_stored_query("by_name").set_bindings({"name": "Eric"}).result_set("one")
+        assert record == {"name": "Eric"}
+
+    assert sqlite_db.prepared_stats()["statements"] == 0
@@ -0,0 +1,90 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig
+from sorcererdb.profiler import Histogram, Profiler, fingerprint, estimate_bytes
+
+def test_fingerprint():
+    """Test literals, placeholders and value lists collapse to one shape"""
+    assert fingerprint("SELECT * FROM users WHERE id = 10") == "SELECT * FROM users WHERE id = ?"
+    assert fingerprint("SELECT *  FROM users\n WHERE name = 'Eric'") == "SELECT * FROM users WHERE name = ?"
+    assert fingerprint("SELECT * FROM users WHERE id = %(id)s") == "SELECT * FROM users WHERE id = ?"
+    assert fingerprint("SELECT * FROM users WHERE id IN (1, 2, 3)") == fingerprint("SELECT * FROM users WHERE id IN (@a)")
+    assert fingerprint("INSERT INTO t (a, b) VALUES (@a_0, @b_0), (@a_1, @b_1)") == "INSERT INTO t (a, b) VALUES (?+)"
+    assert fingerprint("SELECT * FROM table2") == "SELECT * FROM table2"
+
+def test_histogram_quantiles():
+    """Test quantiles are interpolated from the fixed buckets"""
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(0.0007)
+    for _ in range(10):
+        histogram.observe(0.3)
+
+    assert histogram.count == 100
+    assert 0.0005 <= histogram.quantile(0.50) <= 0.001
+    assert 0.25 <= histogram.quantile(0.95) <= 0.5
+    assert 0.25 <= histogram.quantile(0.99) <= 0.5
+    assert Histogram().quantile(0.5) == 0.0
+
+def test_profiler_bounds_series():
+    """Test new query shapes beyond the limit share one series"""
+    profiler = Profiler(max_fingerprints=2)
+    profiler.record("db", "SELECT a FROM t1", 0.001)
+    profiler.record("db", "SELECT a FROM t2", 0.001)
+    profiler.record("db", "SELECT a FROM t3", 0.001)
+
+    assert set(profiler.stats()["db"]) == {"SELECT a FROM t1", "SELECT a FROM t2", "other"}
+
+def test_estimate_bytes_samples_first_row():
+    """Test byte estimates scale the first row by the row count"""
+    assert estimate_bytes([("abcd", 1), ("a", 2), ("abcdefgh", 3)]) == 36
+    assert estimate_bytes([{"name": "ab"}, {"name": "abcdef"}]) == 4
+    assert estimate_bytes([]) == 0
+
+def test_sorcererdb_stats(sqlite_db, sqlite_config):
+    """Test executes and fetches are aggregated per DSN and fingerprint"""
+    for i in range(3):
+        sqlite_db.insert("users", {"name": f"user{i}"})
+    for i in range(3):
+        sqlite_db.query("SELECT name FROM users WHERE id >= @id").set_bindings({"id": i + 1}).result_set("all")
+
+    queries = sqlite_db.stats()["queries"][sqlite_config.name]
+    insert = queries["INSERT INTO `users` (name) VALUES (?+)"]
+    select = queries["SELECT name FROM users WHERE id >= ?"]
+
+    assert insert["count"] == 3
+    assert insert["rows"] == 3
+    assert select["count"] == 3
+    assert select["rows"] == 6
+    assert select["bytes"] == 30
+    assert select["p50"] > 0
+    assert select["p99"] >= select["p50"]
+
+    assert sqlite_db.stats()["pools"][sqlite_config.name]["in_use"] == 1
+
+def test_sorcererdb_stats_errors(sqlite_db, sqlite_config):
+    """Test failed executions are counted"""
+    with pytest.raises(ValueError):
+        sqlite_db.simple("SELECT * FROM missing_table")
+
+    queries = sqlite_db.stats()["queries"][sqlite_config.name]
+    assert queries["SELECT * FROM missing_table"]["errors"] == 1
+
+def test_prometheus_exposition(sqlite_db):
+    """Test the Prometheus text format"""
+    sqlite_db.simple('SELECT name FROM users WHERE name = "x"')
+    text = sqlite_db.prometheus()
+
+    assert "# TYPE sorcererdb_query_duration_seconds histogram" in text
+    assert 'sorcererdb_query_duration_seconds_bucket{dsn="TestSQLite",query="SELECT name FROM users WHERE name = ?",le="+Inf"} 1' in text
+    assert 'sorcererdb_query_duration_seconds_count{dsn="TestSQLite",query="SELECT name FROM users WHERE name = ?"} 1' in text
+    assert "# TYPE sorcererdb_query_rows_total counter" in text
+
+def test_profiling_disabled(sqlite_config):
+    """Test profiling can be turned off"""
+    db = SorcererDB(sqlite_config, profile=False)
+    db.connect(sqlite_config.name)
+    db.simple("SELECT 1 AS one")
+
+    assert db.stats()["queries"] == {}
+    assert db.prometheus() == ""
+    db.disconnect(sqlite_config.name)
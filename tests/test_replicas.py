@@ -0,0 +1,99 @@
+import pytest
+import asyncio
+from sorcererdb import SorcererDB, DBConfig, AsyncSorcererDB
+from sorcererdb.router import is_read
+
+def sqlite_dsn(tmp_path, name):
+    return DBConfig(name=name, engine="sqlite", database=str(tmp_path / f"{name}.db"))
+
+def seed(db, name, label):
+    db.set_active_connection(name)
+    db.simple("CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100))", "count")
+    db.insert("users", {"name": label})
+
+@pytest.fixture
+def routed_db(tmp_path):
+    # Each database holds a row naming it, so a read shows where it ran
+    db = SorcererDB(sqlite_dsn(tmp_path, "Primary"))
+    db.set_dsn(sqlite_dsn(tmp_path, "Replica1"))
+    db.set_dsn(sqlite_dsn(tmp_path, "Replica2"))
+    for name in ["Replica1", "Replica2", "Primary"]:
+        seed(db, name, name)
+
+    db.set_replicas("Primary", ["Replica1", "Replica2"], sticky_window=0)
+    yield db
+    for name in list(db.pools):
+        db.disconnect(name)
+
+def count_on(db, name):
+    return db.get_connection(name).execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+def read_from(db):
+    return db.query("SELECT name FROM users WHERE id = 1").result_set("one", cache=False)["name"]
+
+def test_reads_spread_across_replicas(routed_db):
+    """Test SELECTs on the primary alternate between idle replicas"""
+    assert [read_from(routed_db) for _ in range(4)] == ["Replica1", "Replica2", "Replica1", "Replica2"]
+    assert routed_db.simple("SELECT name FROM users", "one", cache=False)["name"] == "Replica1"
+    assert routed_db.get_active_connection() == "Primary"
+
+    stats = routed_db.stats()["replicas"]
+    assert stats["served"]["Replica1"] == 3
+    assert stats["outstanding"] == {"Primary": 0, "Replica1": 0, "Replica2": 0}
+
+def test_writes_go_to_primary(routed_db):
+    """Test writes run on the primary and locking reads stay there"""
+    routed_db.insert("users", {"name": "New"})
+
+    assert count_on(routed_db, "Primary") == 2
+    assert count_on(routed_db, "Replica1") == 1
+    assert is_read("SELECT * FROM users")
+    assert not is_read("SELECT * FROM users WHERE id = 1 FOR UPDATE")
+    assert not is_read("SELECT * FROM users LOCK IN SHARE MODE")
+    assert not is_read("UPDATE users SET name = 'x'")
+
+def test_transactions_stay_on_primary(routed_db):
+    """Test reads inside begin()/commit() see the primary"""
+    routed_db.begin()
+    assert read_from(routed_db) == "Primary"
+    routed_db.commit()
+
+def test_read_your_writes(routed_db):
+    """Test reads stick to the primary for the window after a write"""
+    routed_db.router.sticky_window = 60
+    assert read_from(routed_db) == "Replica1"
+
+    routed_db.update("users", {"name": "Primary"}, {"id": 1})
+    assert read_from(routed_db) == "Primary"
+    assert routed_db.stats()["replicas"]["sticky_reads"] == 1
+
+def test_stream_reads_replica(routed_db):
+    """Test stream() runs on a replica connection"""
+    rows = list(routed_db.query("SELECT name FROM users").stream())
+
+    assert rows == [{"name": "Replica1"}]
+    assert routed_db.router.stats()["outstanding"]["Replica1"] == 0
+
+def test_other_dsns_not_routed(routed_db):
+    """Test queries on a non-primary DSN run where they are sent"""
+    routed_db.set_active_connection("Replica2")
+    assert read_from(routed_db) == "Replica2"
+
+def test_async_reads_use_replicas(tmp_path, routed_db):
+    """Test AsyncSorcererDB routes reads and writes the same way"""
+    async def scenario():
+        adb = AsyncSorcererDB(sqlite_dsn(tmp_path, "Primary"))
+        adb.db = routed_db
+        adb.active_connection = "Primary"
+        names = [(await adb.simple("SELECT name FROM users WHERE id = 1", "one", cache=False))["name"] for _ in range(2)]
+        await adb.insert("users", {"name": "Async"})
+        adb.executor.shutdown(wait=True)
+        return names
+
+    assert asyncio.run(scenario()) == ["Replica1", "Replica2"]
+    assert count_on(routed_db, "Primary") == 2
+
+def test_unknown_replica_rejected(routed_db):
+    """Test replicas must be registered DSNs"""
+    with pytest.raises(ValueError):
+        routed_db.set_replicas("Primary", ["Missing"])
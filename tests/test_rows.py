@@ -0,0 +1,80 @@
+import sys
+import pytest
+from sorcererdb import SorcererDB, DBConfig
+from sorcererdb.rows import Row, row_class
+
+@pytest.fixture
+def rows_db(sqlite_db):
+    sqlite_db.insert_many("users", [{"name": f"user{i}", "email": f"user{i}@example.com", "age": i} for i in range(5)])
+    return sqlite_db
+
+def test_tuple_rows(rows_db):
+    """Test row_factory="tuple" returns the driver's plain tuples"""
+    rows = rows_db.query("SELECT id, name FROM users ORDER BY id").result_set("all", row_factory="tuple")
+
+    assert rows[0] == (1, "user0")
+    assert type(rows[0]) is tuple
+
+def test_row_access(rows_db):
+    """Test rows answer to attribute, key and position and convert to dict"""
+    row = rows_db.query("SELECT id, name, age FROM users WHERE id = @id").binding("id", 2).result_set("one", row_factory="row")
+
+    assert isinstance(row, Row)
+    assert row.name == "user1"
+    assert row["age"] == 1
+    assert row[0] == 2
+    assert row.get("missing", "n/a") == "n/a"
+    assert dict(row) == row.as_dict() == {"id": 2, "name": "user1", "age": 1}
+    with pytest.raises(AttributeError):
+        row.missing
+
+def test_row_class_shared_per_shape(rows_db):
+    """Test rows of one result share a class built once per column shape"""
+    first  = rows_db.simple("SELECT id, name FROM users", row_factory="row", cache=False)
+    second = rows_db.query("SELECT id, name FROM users").result_set("many", size=2, row_factory="row")
+
+    assert len({type(row) for row in first + second}) == 1
+    assert type(first[0]) is row_class(("id", "name"))
+    assert sys.getsizeof(first[0]) < sys.getsizeof(first[0].as_dict())
+
+def test_row_factory_from_dsn(tmp_path):
+    """Test the DSN's row_factory applies to every read, including streams"""
+    config = DBConfig(name="Rows", engine="sqlite", database=str(tmp_path / "rows.db"), row_factory="row")
+    db = SorcererDB(config)
+    db.connect("Rows")
+    db.simple("CREATE TABLE t (id INTEGER PRIMARY KEY, label TEXT)", "count")
+    db.insert("t", {"id": 1, "label": "one"})
+
+    assert db.simple("SELECT * FROM t")[0].label == "one"
+    assert db.simple("SELECT * FROM t", row_factory="dict")[0] == {"id": 1, "label": "one"}
+    assert next(db.query("SELECT * FROM t").stream()).label == "one"
+    db.disconnect("Rows")
+
+def test_tuple_row_factory_paginates(tmp_path):
+    """Test internal reads that need column names work on a tuple DSN"""
+    config = DBConfig(name="Tuples", engine="sqlite", database=str(tmp_path / "tuples.db"), row_factory="tuple")
+    db = SorcererDB(config)
+    db.connect("Tuples")
+    db.simple("CREATE TABLE t (id INTEGER PRIMARY KEY, label TEXT)", "count")
+    db.insert_many("t", [{"id": i, "label": f"l{i}"} for i in range(1, 6)])
+
+    pages = list(db.paginate("t", "id", page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert pages[0].cursor is not None
+    db.disconnect("Tuples")
+
+def test_row_factory_cached_separately(sqlite_db):
+    """Test cached results are kept per row factory"""
+    from sorcererdb import ResultCache
+
+    sqlite_db.cache = ResultCache()
+    sqlite_db.insert("users", {"name": "Alice"})
+
+    assert isinstance(sqlite_db.simple("SELECT name FROM users")[0], dict)
+    assert sqlite_db.simple("SELECT name FROM users", row_factory="tuple")[0] == ("Alice",)
+
+def test_invalid_row_factory(sqlite_db):
+    """Test an unknown row factory is rejected"""
+    with pytest.raises(ValueError):
+        sqlite_db.simple("SELECT * FROM users", row_factory="frame")
@@ -0,0 +1,105 @@
+import time
+import pytest
+from sorcererdb import SorcererDB, DBConfig
+
+SHARDS = 4
+
+@pytest.fixture
+def sharded_db(tmp_path):
+    # Shard n holds users n, n + SHARDS, n + 2 * SHARDS
+    db = SorcererDB(DBConfig(name="Shard0", engine="sqlite", database=str(tmp_path / "shard0.db")))
+    for shard in range(SHARDS):
+        name = f"Shard{shard}"
+        if shard:
+            db.set_dsn(DBConfig(name=name, engine="sqlite", database=str(tmp_path / f"{name}.db")))
+        db.connect(name)
+        db.simple("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(100))", "count")
+        for user_id in range(shard, SHARDS * 3, SHARDS):
+            db.insert("users", {"id": user_id, "name": f"user{user_id}"})
+
+    yield db
+    for name in list(db.pools):
+        db.disconnect(name)
+
+def test_scatter_merges_all_shards(sharded_db):
+    """Test scatter runs on every DSN and returns merged and per-shard rows"""
+    result = sharded_db.scatter("SELECT id FROM users WHERE id >= @min_id", {"min_id": 4})
+
+    assert result["complete"] is True
+    assert list(result["results"]) == [f"Shard{shard}" for shard in range(SHARDS)]
+    assert result["results"]["Shard1"] == [{"id": 5}, {"id": 9}]
+    assert sorted(row["id"] for row in result["rows"]) == list(range(4, SHARDS * 3))
+
+def test_scatter_ordered_merge(sharded_db):
+    """Test order_by merges the shards' sorted rows into one order"""
+    result = sharded_db.scatter("SELECT id FROM users ORDER BY id DESC", order_by="id", reverse=True)
+
+    assert [row["id"] for row in result["rows"]] == list(range(SHARDS * 3 - 1, -1, -1))
+
+def test_scatter_subset_and_errors(sharded_db):
+    """Test a failing shard is reported while the others return"""
+    sharded_db.simple("DROP TABLE users", "count")   # on the last connected shard
+
+    result = sharded_db.scatter("SELECT id FROM users", dsns=["Shard0", "Shard3"])
+
+    assert result["complete"] is False
+    assert list(result["results"]) == ["Shard0"]
+    assert "no such table" in result["errors"]["Shard3"]
+
+def test_scatter_no_dsns(sharded_db):
+    """Test an empty DSN list gives an empty, complete result"""
+    result = sharded_db.scatter("SELECT id FROM users", dsns=[])
+
+    assert result == {"rows": [], "results": {}, "errors": {}, "timeouts": [], "complete": True}
+    assert list(sharded_db.scatter_stream("SELECT id FROM users", dsns=[])) == []
+
+def test_scatter_timeout_partial_results(sharded_db):
+    """Test a slow shard times out and the rest are returned"""
+    fetch_on = sharded_db.fetch_on
+
+    def slow_fetch_on(name, sql, bindings):
+        if name == "Shard2":
+            time.sleep(1)
+        return fetch_on(name, sql, bindings)
+
+    sharded_db.fetch_on = slow_fetch_on
+    started = time.monotonic()
+    result  = sharded_db.scatter("SELECT id FROM users", timeout=0.2)
+
+    assert time.monotonic() - started < 0.9
+    assert result["timeouts"] == ["Shard2"]
+    assert result["complete"] is False
+    assert len(result["results"]) == SHARDS - 1
+
+def test_scatter_runs_concurrently(sharded_db):
+    """Test shards overlap instead of running one after another"""
+    fetch_on = sharded_db.fetch_on
+
+    def slow_fetch_on(name, sql, bindings):
+        time.sleep(0.2)
+        return fetch_on(name, sql, bindings)
+
+    sharded_db.fetch_on = slow_fetch_on
+    started = time.monotonic()
+    sharded_db.scatter("SELECT id FROM users")
+
+    assert time.monotonic() - started < 0.2 * SHARDS
+
+def test_scatter_stream(sharded_db):
+    """Test streaming merge yields every row, ordered when asked"""
+    rows = list(sharded_db.scatter_stream("SELECT id FROM users", fetch_size=1))
+    assert sorted(row["id"] for row in rows) == list(range(SHARDS * 3))
+
+    ordered = sharded_db.scatter_stream("SELECT id FROM users ORDER BY id", order_by="id", fetch_size=2)
+    assert [row["id"] for row in ordered] == list(range(SHARDS * 3))
+
+def test_scatter_stream_early_exit(sharded_db):
+    """Test stopping a streaming merge early returns every connection"""
+    stream = sharded_db.scatter_stream("SELECT id FROM users ORDER BY id", order_by="id", fetch_size=1)
+    assert next(stream)["id"] == 0
+    stream.close()
+
+    time.sleep(0.3)
+    for shard in range(SHARDS):
+        # Only the session connection stays checked out
+        assert sharded_db.pool_stats(f"Shard{shard}")["in_use"] == 1
@@ -0,0 +1,66 @@
+import pytest
+from loguru import logger
+from sorcererdb import SorcererDB, DBConfig
+
+@pytest.fixture
+def slow_records():
+    records = []
+    logger.enable("sorcererdb")
+    handler_id = logger.add(
+        lambda message: records.append(message.record),
+        level="INFO",
+        filter=lambda record: "slow_query" in record["extra"]
+    )
+    yield records
+    logger.remove(handler_id)
+    logger.disable("sorcererdb")
+
+@pytest.fixture
+def slow_db(sqlite_config):
+    sqlite_config.slow_query_threshold = 0
+    db = SorcererDB(sqlite_config)
+    db.connect(sqlite_config.name)
+    db.simple("CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100))", "count")
+    yield db
+    db.disconnect(sqlite_config.name)
+
+def test_slow_queries_are_logged(slow_db, slow_records):
+    """Test queries over the threshold are logged with timing and fingerprint"""
+    slow_db.query("SELECT * FROM users WHERE id = @id").set_bindings({"id": 1}).result_set("all")
+
+    record = slow_records[-1]
+    assert record["level"].name == "WARNING"
+    slow_query = record["extra"]["slow_query"]
+    assert slow_query["dsn"] == "TestSQLite"
+    assert slow_query["fingerprint"] == "SELECT * FROM users WHERE id = ?"
+    assert slow_query["bindings"] == {"id": "1"}
+    assert slow_query["seconds"] >= 0
+    assert slow_query["plan"] is None
+
+def test_fast_queries_are_sampled(slow_db, sqlite_config, slow_records):
+    """Test fast queries are only logged at the sampling rate"""
+    sqlite_config.slow_query_threshold = 60
+    slow_db.simple("SELECT * FROM users")
+    assert slow_records == []
+
+    sqlite_config.slow_query_sample_rate = 1.0
+    slow_db.simple("SELECT * FROM users", cache=False)
+    assert slow_records[-1]["level"].name == "INFO"
+
+def test_slow_select_explain(slow_db, sqlite_config, slow_records):
+    """Test slow SELECTs get their plan attached in the background"""
+    sqlite_config.slow_query_explain = True
+    slow_db.query("SELECT * FROM users WHERE id = @id").set_bindings({"id": 1}).result_set("all")
+    slow_db.slow_log.wait(timeout=5)
+
+    plan = slow_records[-1]["extra"]["slow_query"]["plan"]
+    assert plan
+    assert "users" in str(plan)
+    assert slow_db.pool_stats()["in_use"] == 1
+
+def test_slow_log_disabled(slow_db, sqlite_config, slow_records):
+    """Test a None threshold turns the slow query log off"""
+    sqlite_config.slow_query_threshold = None
+    slow_db.simple("SELECT * FROM users")
+
+    assert slow_records == []
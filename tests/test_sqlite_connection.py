@@ -0,0 +1,125 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig, Spell
+
+def test_sqlite_connection(sqlite_db, sqlite_config):
+    """Test connecting to and disconnecting from SQLite"""
+    assert sqlite_db.get_active_connection() == sqlite_config.name
+    assert sqlite_db.check_connection(sqlite_config.name) is True
+
+    sqlite_db.disconnect(sqlite_config.name)
+    assert sqlite_db.check_connection(sqlite_config.name) is False
+    assert sqlite_db.get_active_connection() is None
+
+def test_sqlite_pragmas(sqlite_config):
+    """Test WAL journaling and configured pragmas are applied"""
+    sqlite_config.synchronous = "off"
+    sqlite_config.cache_size = -4000
+    db = SorcererDB(sqlite_config)
+    db.connect(sqlite_config.name)
+
+    assert db.simple("PRAGMA journal_mode", "one")[0] == "wal"
+    assert db.simple("PRAGMA synchronous", "one")[0] == 0
+    assert db.simple("PRAGMA cache_size", "one")[0] == -4000
+
+    db.disconnect(sqlite_config.name)
+
+def test_sqlite_binder(sqlite_db):
+    """Test SQLite placeholders are used for built bindings"""
+    fields, values = sqlite_db.build_bindings({"name": "Eric", "age": 30})
+
+    assert fields == {'name': 'name = @name', 'age': 'age = @age'}
+    assert values == {'name': 'Eric', 'age': 30}
+
+def test_sqlite_crud(sqlite_db):
+    """Test CRUD helpers against SQLite"""
+    insert_id = sqlite_db.insert("users", {"name": "Eric", "age": 30})
+    next_insert_id = sqlite_db.insert("users", {"name": "Barty", "age": 40})
+    assert next_insert_id > insert_id
+
+    sqlite_db.query("SELECT * FROM users WHERE id = @id").set_bindings({"id": insert_id})
+    record = sqlite_db.result_set("one")
+    assert record["name"] == "Eric"
+
+    sqlite_db.query("SELECT * FROM users")
+    assert sqlite_db.result_set("count") == 2
+    assert len(sqlite_db.result_set("many", size=1)) == 1
+
+    assert sqlite_db.update("users", {"name": "Marvin"}, {"id": insert_id}) == 1
+    assert sqlite_db.delete("users", {"id": next_insert_id}) == 1
+
+    records = sqlite_db.simple("SELECT name FROM users")
+    assert records == [{"name": "Marvin"}]
+
+def test_sqlite_transactions(sqlite_db):
+    """Test begin/commit/rollback against SQLite"""
+    sqlite_db.begin()
+    sqlite_db.insert("users", {"name": "Rolled"})
+    sqlite_db.rollback()
+
+    sqlite_db.begin()
+    sqlite_db.insert("users", {"name": "Committed"})
+    sqlite_db.commit()
+
+    records = sqlite_db.simple("SELECT name FROM users")
+    assert records == [{"name": "Committed"}]
+
+def test_sqlite_spell_fetch(sqlite_db):
+    """Test Spell fetch types on a SQLite cursor"""
+    sqlite_db.insert("users", {"name": "tester"})
+
+    sqlite_db.query("SELECT * FROM users")
+    spell = sqlite_db.execute()
+    assert spell.rowcount() == 1
+    assert spell.fetch("one")["name"] == "tester"
+    assert spell.fetch("one") is None
+    spell.close()
+
+def test_sqlite_proc_not_supported(sqlite_db):
+    """Test stored procedures raise on SQLite"""
+    with pytest.raises(ValueError):
+        sqlite_db.proc("missing_proc")
+
+def test_sqlite_query_error(sqlite_db):
+    """Test driver errors surface as ValueError"""
+    with pytest.raises(ValueError):
+        sqlite_db.simple("SELECT * FROM missing_table")
+
+def test_sqlite_memory_shared_across_pool():
+    """Test pooled connections of a :memory: DSN see the same database"""
+    config = DBConfig(name="Memory", engine="sqlite", database=":memory:")
+    other  = DBConfig(name="OtherMemory", engine="sqlite", database=":memory:")
+    db = SorcererDB(config)
+    db.set_dsn(other)
+    db.connect("OtherMemory")
+    db.simple("CREATE TABLE t (id INTEGER PRIMARY KEY)", "count")
+    db.connect("Memory")
+    db.simple("CREATE TABLE t (id INTEGER PRIMARY KEY)", "count")
+    db.insert_many("t", [{"id": i} for i in range(1, 4)])
+
+    assert [row["id"] for row in db.query("SELECT id FROM t ORDER BY id").stream()] == [1, 2, 3]
+    assert db.pipeline([("SELECT COUNT(*) AS total FROM t", None, "one")]) == [{"total": 3}]
+    assert db.scatter("SELECT COUNT(*) AS total FROM t")["results"] == {
+        "Memory": [{"total": 3}], "OtherMemory": [{"total": 0}]
+    }
+    db.disconnect("Memory")
+    db.disconnect("OtherMemory")
+
+def test_sqlite_memory_stream_does_not_lock_writes():
+    """Test writes during a stream or pipeline on a :memory: DSN are not locked out"""
+    config = DBConfig(name="Memory", engine="sqlite", database=":memory:")
+    db = SorcererDB(config)
+    db.connect("Memory")
+    db.simple("CREATE TABLE t (id INTEGER PRIMARY KEY, label TEXT)", "count")
+    db.insert_many("t", [{"id": i, "label": "old"} for i in range(1, 4)])
+
+    rows = db.query("SELECT id FROM t ORDER BY id").stream(fetch_size=1)
+    assert next(rows)["id"] == 1
+    db.update("t", {"label": "new"}, {"id": 3})
+    assert [row["id"] for row in rows] == [2, 3]
+
+    results = db.pipeline([
+        ("UPDATE t SET label = 'piped' WHERE id = 1", None, "count"),
+        ("SELECT label FROM t WHERE id = 3", None, "one"),
+    ])
+    assert results == [1, {"label": "new"}]
+    db.disconnect("Memory")
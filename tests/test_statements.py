@@ -0,0 +1,68 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig
+from sorcererdb.statements import StatementCache
+
+def test_statement_cache_lru():
+    """Test the statement cache is bounded and counts hits and misses"""
+    cache = StatementCache(max_size=2)
+    cache.set("a", "SQL A")
+    cache.set("b", "SQL B")
+    assert cache.get("a") == "SQL A"
+    cache.set("c", "SQL C")
+
+    assert cache.get("b") is None
+    assert cache.stats() == {"size": 2, "hits": 1, "misses": 1}
+
+def test_compiled_insert_reuses_template():
+    """Test repeated inserts with the same shape only bind values"""
+    db = SorcererDB(DBConfig(name="Compile"))
+
+    first_sql, first_values = db.compile_insert("users", {"Name ": "Eric", "age": 30})
+    second_sql, second_values = db.compile_insert("users", {"Name ": "Barty", "age": 40})
+
+    assert first_sql == second_sql == "INSERT INTO `users` SET name = %(name)s, age = %(age)s"
+    assert first_values == {"name": "Eric", "age": 30}
+    assert second_values == {"name": "Barty", "age": 40}
+    assert db.statement_stats() == {"size": 1, "hits": 1, "misses": 1}
+
+def test_compiled_update_and_delete():
+    """Test update/delete templates keep condition value handling"""
+    db = SorcererDB(DBConfig(name="Compile"))
+
+    for name in ["Eric", "Barty"]:
+        update_sql, values = db.compile_update("users", {"age": 1}, {"name": [name, "like"]})
+        assert update_sql == "UPDATE `users` SET age = %(age)s WHERE name LIKE %(name)s"
+        assert values == {"age": 1, "name": f"%{name}%"}
+
+    for user_id in [1, 2]:
+        delete_sql, values = db.compile_delete("users", [["id", user_id]], limit=1)
+        assert delete_sql == "DELETE FROM `users`  WHERE id = %(id)s LIMIT 1"
+        assert values == {"id": user_id}
+
+    assert db.statement_stats()["hits"] == 2
+    assert db.statement_stats()["misses"] == 2
+
+def test_compiled_statements_differ_by_shape():
+    """Test a different condition or column set compiles a new statement"""
+    db = SorcererDB(DBConfig(name="Compile"))
+
+    db.compile_delete("users", {"id": 1})
+    db.compile_delete("users", {"id": [[1, 2], "IN"]})
+    db.compile_delete("users", {"id": 1}, limit=5)
+    db.compile_insert("users", {"name": "Eric"})
+    db.compile_insert("posts", {"name": "Eric"})
+
+    assert db.statement_stats() == {"size": 5, "hits": 0, "misses": 5}
+
+def test_compiled_statements_on_sqlite(sqlite_db):
+    """Test compiled statements execute against SQLite"""
+    for i in range(3):
+        sqlite_db.insert("users", {"name": f"user{i}", "age": i})
+    sqlite_db.insert_many("users", [{"name": "a"}, {"name": "b"}], batch_size=1)
+
+    assert sqlite_db.update("users", {"age": 10}, {"name": "user1"}) == 1
+    assert sqlite_db.update("users", {"age": 20}, {"name": "user2"}) == 1
+
+    records = sqlite_db.simple("SELECT name, age FROM users ORDER BY id")
+    assert [record["age"] for record in records[:3]] == [0, 10, 20]
+    assert sqlite_db.statement_stats()["hits"] >= 4
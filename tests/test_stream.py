@@ -0,0 +1,120 @@
+import pytest
+from sorcererdb import SorcererDB, DBConfig, Spell
+
+@pytest.fixture(scope="function")
+def stream_db(sqlite_db):
+    sqlite_db.insert_many("users", [{"name": f"user{i}", "age": i} for i in range(25)])
+    return sqlite_db
+
+def test_stream_rows(stream_db):
+    """Test stream yields every row as a dict"""
+    stream_db.query("SELECT id, name FROM users WHERE age >= @age ORDER BY id").set_bindings({"age": 5})
+    rows = list(stream_db.stream(fetch_size=4))
+
+    assert len(rows) == 20
+    assert rows[0]["name"] == "user5"
+
+def test_stream_chunks(stream_db):
+    """Test stream can yield fetch_size chunks"""
+    stream_db.query("SELECT id FROM users ORDER BY id")
+    chunks = list(stream_db.stream(fetch_size=10, chunks=True))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+def test_stream_early_close_releases_connection(stream_db):
+    """Test closing the generator early closes the cursor and returns the connection"""
+    stream_db.query("SELECT id FROM users ORDER BY id")
+    rows = stream_db.stream(fetch_size=2)
+    next(rows)
+    assert stream_db.pool_stats()["in_use"] == 2
+
+    rows.close()
+    assert stream_db.pool_stats()["in_use"] == 1
+
+def test_stream_leaves_session_connection_usable(stream_db):
+    """Test other queries can run while a stream is open"""
+    stream_db.query("SELECT id FROM users ORDER BY id")
+    count = 0
+    for row in stream_db.stream(fetch_size=5):
+        stream_db.update("users", {"age": 100}, {"id": row["id"]})
+        count += 1
+
+    assert count == 25
+    assert stream_db.simple("SELECT COUNT(*) AS count FROM users WHERE age = 100", "one")["count"] == 25
+
+def test_stream_in_transaction_uses_session_connection(stream_db):
+    """Test a stream inside a transaction sees its uncommitted writes"""
+    stream_db.begin()
+    stream_db.insert("users", {"name": "pending"})
+
+    stream_db.query("SELECT name FROM users WHERE name = @name").set_bindings({"name": "pending"})
+    assert [row["name"] for row in stream_db.stream()] == ["pending"]
+    assert stream_db.pool_stats()["in_use"] == 1
+
+    stream_db.rollback()
+
+def test_stream_query_error(stream_db):
+    """Test query errors surface when iteration starts"""
+    stream_db.query("SELECT * FROM missing_table")
+    with pytest.raises(ValueError):
+        list(stream_db.stream())
+
+    assert stream_db.pool_stats()["in_use"] == 1
+
+class UnreadCursor:
+    # An unbuffered MySQL-style cursor: rows stay on the wire until fetched
+    def __init__(self, conn):
+        self.conn        = conn
+        self.description = [("id",)]
+        self.rowcount    = -1
+        self.lastrowid   = None
+
+    def execute(self, query, bindings = None):
+        self.conn.remaining   = 1000
+        self.conn.unread_result = True
+
+    def fetchmany(self, size = 1):
+        count = min(size, self.conn.remaining)
+        self.conn.remaining -= count
+        self.conn.unread_result = self.conn.remaining > 0
+        return [{"id": i} for i in range(count)]
+
+    def close(self):
+        self.conn.cursor_closed = True
+
+
+class UnreadConnection:
+    def __init__(self):
+        self.unread_result = False
+        self.consumed      = False
+        self.closed        = False
+        self.cursor_closed = False
+
+    def cursor(self):
+        return UnreadCursor(self)
+
+    def consume_results(self):
+        self.consumed = True
+
+    def close(self):
+        self.closed = True
+
+def test_stream_early_close_discards_unread_connection(stream_db):
+    """Test a stream closed with rows unread drops its connection instead of draining it"""
+    from sorcererdb.pool import ConnectionPool
+
+    conn = UnreadConnection()
+    name = stream_db.get_active_connection()
+    original = stream_db.pools[name]
+    stream_db.pools[name] = ConnectionPool(lambda: conn, name=name, min_size=0)
+    try:
+        rows = stream_db.query("SELECT id FROM users").stream(fetch_size=10)
+        next(rows)
+        rows.close()
+
+        assert conn.closed is True
+        assert conn.consumed is False
+        assert stream_db.pool_stats(name)["in_use"] == 0
+        assert stream_db.pool_stats(name)["size"] == 0
+    finally:
+        stream_db.pools[name] = original
@@ -0,0 +1,117 @@
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sorcererdb import SorcererDB, DBConfig
+
+THREADS    = 8
+ITERATIONS = 200
+
+@pytest.fixture
+def shared_db(tmp_path):
+    config = DBConfig(name="Shared", engine="sqlite", database=str(tmp_path / "shared.db"), pool_max_size=THREADS + 1)
+    db = SorcererDB(config, thread_safe=True)
+    db.connect("Shared")
+    db.simple("CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100), email VARCHAR(100))", "count")
+    for i in range(THREADS):
+        db.insert("users", {"name": f"user{i}", "email": f"user{i}@example.com"})
+    yield db
+    db.disconnect("Shared")
+
+def test_fluent_state_isolated_per_thread(shared_db):
+    """Test concurrent query().binding().result_set() chains do not mix"""
+    barrier = threading.Barrier(THREADS)
+
+    def worker(i):
+        barrier.wait()
+        mismatches = 0
+        for _ in range(ITERATIONS):
+            row = shared_db.query("SELECT name FROM users WHERE id = @id").binding("id", i + 1).result_set("one", cache=False)
+            if row["name"] != f"user{i}" or shared_db.get_bindings() != {"id": str(i + 1)}:
+                mismatches += 1
+        return mismatches
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(worker, range(THREADS)))
+
+    assert results == [0] * THREADS
+
+def test_concurrent_writes_isolated(shared_db):
+    """Test concurrent inserts return their own ids and row counts"""
+    def worker(i):
+        ids = [shared_db.insert("users", {"name": f"writer{i}", "email": f"w{i}@example.com"}) for _ in range(25)]
+        count = shared_db.query("SELECT id FROM users WHERE name = @name").binding("name", f"writer{i}").result_set("all", cache=False)
+        return ids, [row["id"] for row in count], shared_db.result_count()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(worker, range(THREADS)))
+
+    all_ids = []
+    for ids, stored, row_count in results:
+        assert sorted(ids) == stored
+        assert row_count == 25
+        all_ids.extend(ids)
+    assert len(set(all_ids)) == THREADS * 25
+
+def test_each_thread_pins_own_connection(shared_db):
+    """Test threads get their own connection from the shared pool"""
+    barrier = threading.Barrier(4)
+
+    def worker(_):
+        barrier.wait()
+        shared_db.simple("SELECT 1 AS one", cache=False)
+        conn = id(shared_db.get_connection("Shared"))
+        barrier.wait()
+        shared_db.release()
+        return conn
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        connections = list(executor.map(worker, range(4)))
+
+    assert len(set(connections)) == 4
+    assert id(shared_db.get_connection("Shared")) not in connections
+    assert shared_db.pool_stats()["in_use"] == 1
+
+def test_thread_transactions_isolated(shared_db):
+    """Test a transaction on one thread does not capture another thread's queries"""
+    started = threading.Event()
+    done    = threading.Event()
+
+    def in_transaction():
+        shared_db.begin()
+        shared_db.update("users", {"name": "pending"}, {"id": 1})
+        started.set()
+        done.wait(5)
+        shared_db.rollback()
+        return shared_db.in_transaction()
+
+    def outside():
+        started.wait(5)
+        result = shared_db.in_transaction()
+        done.set()
+        return result
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        inside = executor.submit(in_transaction)
+        other  = executor.submit(outside)
+
+    assert other.result() is False
+    assert inside.result() is False
+    assert shared_db.simple("SELECT name FROM users WHERE id = 1", "one", cache=False)["name"] == "user0"
+
+def test_exited_threads_return_connections(tmp_path):
+    """Test connections pinned by worker threads go back when the threads exit"""
+    config = DBConfig(name="Workers", engine="sqlite", database=str(tmp_path / "workers.db"), pool_max_size=4)
+    db = SorcererDB(config, thread_safe=True)
+    db.connect("Workers")
+
+    def worker(i):
+        barrier.wait()
+        return db.simple(f"SELECT {i} AS i", "one", cache=False)["i"]
+
+    for round in range(3):
+        barrier = threading.Barrier(3)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            assert list(executor.map(worker, range(3))) == [0, 1, 2]
+        assert db.pool_stats()["in_use"] == 1
+
+    db.disconnect("Workers")
@@ -0,0 +1,82 @@
+import pytest
+
+@pytest.fixture
+def update_db(sqlite_db):
+    sqlite_db.insert_many("users", [
+        {"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "age": 20 + i} for i in range(1, 11)
+    ])
+    return sqlite_db
+
+def test_update_many_per_row_values(update_db):
+    """Test each row gets its own values from one statement per batch"""
+    rows = [{"id": i, "name": f"renamed{i}", "age": i} for i in (2, 4, 6)]
+
+    result = update_db.update_many("users", rows, "id")
+
+    assert result == {"rows": 3, "batches": 1, "affected": 3, "batch_counts": [3]}
+    assert update_db.simple("SELECT name, age FROM users WHERE id = 4", "one", cache=False) == {"name": "renamed4", "age": 4}
+    assert update_db.simple("SELECT name, age FROM users WHERE id = 3", "one", cache=False) == {"name": "user3", "age": 23}
+
+def test_update_many_batches_and_missing_keys(update_db):
+    """Test batch counts only include keys that exist"""
+    rows = [{"id": i, "age": 99} for i in range(8, 14)]
+
+    result = update_db.update_many("users", rows, "id", batch_size=4)
+
+    assert result["batches"] == 2
+    assert result["batch_counts"] == [3, 0]
+    assert result["affected"] == 3
+    assert update_db.simple("SELECT COUNT(*) AS total FROM users WHERE age = 99", "one", cache=False)["total"] == 3
+
+def test_update_many_temp_table_join(update_db):
+    """Test batches over join_threshold update through a temporary table"""
+    rows = [{"id": i, "email": f"joined{i}@example.com"} for i in range(1, 11)]
+
+    result = update_db.update_many("users", rows, "id", join_threshold=5)
+
+    assert result["affected"] == 10
+    assert update_db.simple("SELECT email FROM users WHERE id = 7", "one", cache=False)["email"] == "joined7@example.com"
+    assert update_db.simple("SELECT COUNT(*) AS total FROM sqlite_temp_master", "one", cache=False)["total"] == 0
+
+def test_update_many_temp_table_indexed(update_db, monkeypatch):
+    """Test the temporary table is indexed on the key before the join runs"""
+    insert_batch = update_db.insert_batch
+    indexes      = []
+
+    def record_indexes(table, *args):
+        result = insert_batch(table, *args)
+        indexes.extend(update_db.simple(f"PRAGMA temp.index_info({table}_id)", cache=False))
+        return result
+
+    monkeypatch.setattr(update_db, "insert_batch", record_indexes)
+    update_db.update_many("users", [{"id": i, "age": i} for i in range(1, 11)], "id", join_threshold=5)
+
+    assert [index[2] for index in indexes] == ["id"]
+
+def test_update_many_temp_table_join_rolls_back(update_db):
+    """Test a caller's rollback also undoes a join-path update"""
+    rows = [{"id": i, "email": f"joined{i}@example.com"} for i in range(1, 11)]
+
+    update_db.begin()
+    update_db.update_many("users", rows, "id", join_threshold=5)
+    assert update_db.in_transaction()
+    update_db.rollback()
+
+    assert update_db.simple("SELECT email FROM users WHERE id = 7", "one", cache=False)["email"] == "user7@example.com"
+
+def test_update_many_commits_each_batch(update_db):
+    """Test a failing batch rolls back only itself"""
+    rows = [{"id": 1, "name": "changed"}, {"id": 2, "name": None}]
+
+    with pytest.raises(ValueError):
+        update_db.update_many("users", rows, "id", batch_size=1)
+
+    assert update_db.simple("SELECT name FROM users WHERE id = 1", "one", cache=False)["name"] == "changed"
+    assert not update_db.in_transaction()
+
+def test_update_many_requires_key_and_columns(update_db):
+    """Test rows must carry the key column and something to update"""
+    with pytest.raises(ValueError):
+        update_db.update_many("users", [{"name": "no id"}], "id")
+    with pytest.raises(ValueError):
+        update_db.update_many("users", [{"id": 1}], "id")
@@ -0,0 +1,77 @@
+import pytest
+
+@pytest.fixture
+def upsert_db(sqlite_db):
+    sqlite_db.simple("""
+        CREATE TABLE inventory (
+            sku VARCHAR(20) NOT NULL,
+            warehouse VARCHAR(20) NOT NULL,
+            quantity INT NOT NULL DEFAULT 0,
+            note VARCHAR(100) NOT NULL DEFAULT '',
+            PRIMARY KEY (sku, warehouse)
+        )
+    """, "count")
+    sqlite_db.insert_many("users", [{"id": i, "name": f"user{i}", "email": f"user{i}@example.com"} for i in range(1, 6)])
+    return sqlite_db
+
+def test_upsert_many_inserts_and_updates(upsert_db):
+    """Test new keys are inserted, existing keys updated, with counts"""
+    rows = [{"id": i, "name": f"renamed{i}", "email": f"new{i}@example.com"} for i in range(4, 9)]
+
+    result = upsert_db.upsert_many("users", rows, key_columns="id")
+
+    assert result["rows"] == 5
+    assert result["inserted"] == 3
+    assert result["updated"] == 2
+    assert upsert_db.simple("SELECT COUNT(*) AS total FROM users", "one", cache=False)["total"] == 8
+    assert upsert_db.simple("SELECT name FROM users WHERE id = 4", "one", cache=False)["name"] == "renamed4"
+    assert upsert_db.simple("SELECT name FROM users WHERE id = 3", "one", cache=False)["name"] == "user3"
+
+def test_upsert_many_update_columns(upsert_db):
+    """Test only update_columns change on a conflict"""
+    rows = [{"id": 1, "name": "changed", "email": "changed@example.com"}]
+
+    upsert_db.upsert_many("users", rows, ["id"], update_columns=["email"])
+
+    row = upsert_db.simple("SELECT name, email FROM users WHERE id = 1", "one", cache=False)
+    assert row == {"name": "user1", "email": "changed@example.com"}
+
+def test_upsert_many_composite_key_batches(upsert_db):
+    """Test composite keys across several batches report per-batch counts"""
+    first = [{"sku": f"S{i}", "warehouse": "east", "quantity": i} for i in range(10)]
+    upsert_db.upsert_many("inventory", first, ["sku", "warehouse"])
+
+    second = [{"sku": f"S{i}", "warehouse": "east", "quantity": i * 10} for i in range(5, 15)]
+    result = upsert_db.upsert_many("inventory", second, ["sku", "warehouse"], batch_size=4)
+
+    assert result["batches"] == 3
+    assert result["batch_counts"] == [
+        {"rows": 4, "inserted": 0, "updated": 4},
+        {"rows": 4, "inserted": 3, "updated": 1},
+        {"rows": 2, "inserted": 2, "updated": 0},
+    ]
+    assert upsert_db.simple("SELECT SUM(quantity) AS total FROM inventory", "one", cache=False)["total"] == \
+        sum(range(5)) + sum(i * 10 for i in range(5, 15))
+
+def test_upsert_many_keys_only(upsert_db):
+    """Test rows with nothing to update leave existing rows alone"""
+    rows = [{"sku": "S1", "warehouse": "west"}, {"sku": "S1", "warehouse": "west"}]
+
+    result = upsert_db.upsert_many("inventory", rows, ["sku", "warehouse"])
+
+    assert result["inserted"] == 1
+    assert upsert_db.simple("SELECT COUNT(*) AS total FROM inventory", "one", cache=False)["total"] == 1
+
+def test_upsert_many_rolls_back_on_error(upsert_db):
+    """Test a failing batch rolls back the whole upsert"""
+    rows = [{"id": 1, "name": "changed", "email": "x"}, {"id": 2, "name": "changed", "missing": "x"}]
+
+    with pytest.raises(ValueError):
+        upsert_db.upsert_many("users", rows, "id", batch_size=1)
+
+    assert upsert_db.simple("SELECT name FROM users WHERE id = 1", "one", cache=False)["name"] == "user1"
+
+def test_upsert_many_requires_key_columns(upsert_db):
+    """Test rows must carry the key columns"""
+    with pytest.raises(ValueError):
+        upsert_db.upsert_many("users", [{"name": "no id"}], "id")